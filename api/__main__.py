@@ -4,46 +4,88 @@ import logging
 import httpx
 import uvicorn
 
-from fastapi import APIRouter
+from fastapi import APIRouter, FastAPI
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from starlette.middleware.cors import CORSMiddleware
 
 from api import v1
 from api.config import load_config
 from api.main_factory import create_app
+from api.v1.dependencies import FXRates, CachedCurrencyAPI
+from api.v1.dependencies.password_hasher import PasswordHasher
+from finances.database.engine import create_engine, \
+    create_replica_engines, MeteredQueuePool
 from finances.models.dto import Config
-from scheduler.start import scheduler
+from scheduler.start import create_scheduler
 from utils.load_currencies import load_currencies
 
 
 def start_scheduler(
+        app: FastAPI,
         client: AsyncClient,
         ss: async_sessionmaker,
-        config: Config
+        config: Config,
+        fx_rates: FXRates,
+        currency_api: CachedCurrencyAPI,
+        pools: dict[str, MeteredQueuePool],
+        password_hasher: PasswordHasher
 ):
     async def start():
         await load_currencies(ss)
-        asyncio.create_task(scheduler(client, ss, config))
+        app.state.scheduler = create_scheduler(client, ss, config, fx_rates,
+                                               currency_api, pools,
+                                               password_hasher)
+        app.state.scheduler_task = asyncio.create_task(
+            app.state.scheduler.run_forever())
 
     return start
 
 
+def stop_scheduler(app: FastAPI):
+    async def stop():
+        task = getattr(app.state, 'scheduler_task', None)
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    return stop
+
+
 def main():
     logging.basicConfig(level=logging.DEBUG)
 
     app = create_app()
     config = load_config()
-    engine = create_async_engine(url=config.db.make_url, echo=False)
+    engine = create_engine(config.db)
     async_session = async_sessionmaker(engine, expire_on_commit=False)
+    replica_engines = create_replica_engines(config.db)
+    replica_sessions = [
+        async_sessionmaker(replica_engine, expire_on_commit=False)
+        for replica_engine in replica_engines
+    ]
+    pools = {'primary': engine.pool}
+    for i, replica_engine in enumerate(replica_engines):
+        pools[f'replica{i}'] = replica_engine.pool
 
     client = httpx.AsyncClient()
-    app.add_event_handler('startup',
-                          start_scheduler(client, async_session, config))
-    app.add_event_handler('shutdown', client.aclose)
+    fx_rates = FXRates(async_session)
+    currency_api = CachedCurrencyAPI(client, config.crypto_prices_ttl)
     api_router_v1 = APIRouter()
 
-    v1.dependencies.setup(app, api_router_v1, async_session, config, client)
+    auth_provider = v1.dependencies.setup(
+        app, api_router_v1, async_session, config, currency_api, fx_rates,
+        replica_sessionmakers=replica_sessions)
+    app.add_event_handler('startup',
+                          start_scheduler(app, client, async_session, config,
+                                          fx_rates, currency_api, pools,
+                                          auth_provider.password_hasher))
+    app.add_event_handler('shutdown', stop_scheduler(app))
+    app.add_event_handler('shutdown', client.aclose)
     v1.routes.setup_routers(api_router_v1)
 
     app.add_middleware(
@@ -15,10 +15,39 @@ def load_config() -> Config:
             username=env.str('PG_USERNAME', default='postgres'),
             password=env.str('PG_PASSWORD', default='postgres'),
             database=env.str('PG_DATABASE', default='postgres'),
+            pool_size=env.int('PG_POOL_SIZE', default=5),
+            max_overflow=env.int('PG_MAX_OVERFLOW', default=10),
+            pool_timeout=timedelta(
+                seconds=env.float('PG_POOL_TIMEOUT', default=30)),
+            pool_recycle=timedelta(
+                seconds=env.int('PG_POOL_RECYCLE', default=1800)) or None,
+            pool_pre_ping=env.bool('PG_POOL_PRE_PING', default=True),
+            pool_slow_checkout=timedelta(
+                milliseconds=env.int('PG_POOL_SLOW_CHECKOUT_MS',
+                                     default=100)),
+            prepared_statement_cache_size=env.int(
+                'PG_PREPARED_STATEMENT_CACHE_SIZE', default=100),
+            statement_timeout=timedelta(
+                milliseconds=env.int('PG_STATEMENT_TIMEOUT_MS',
+                                     default=30000)) or None,
+            replica_urls=env.list('PG_REPLICA_URLS', default=[]),
+            replica_sticky=timedelta(
+                seconds=env.int('PG_REPLICA_STICKY', default=5)),
         ),
         auth=AuthConfig(
             secret_key=env.str('SECRET_KEY'),
-            token_expire=timedelta(days=365)
+            token_expire=timedelta(days=365),
+            hash_workers=env.int('PASSWORD_HASH_WORKERS', default=4),
+            hash_queue_size=env.int('PASSWORD_HASH_QUEUE_SIZE', default=32),
+            user_cache_size=env.int('USER_CACHE_SIZE', default=10000),
+            user_cache_ttl=timedelta(
+                seconds=env.int('USER_CACHE_TTL', default=60))
         ),
-        fcsapi_access_key=env.str('FCSAPI_API_KEY')
+        fcsapi_access_key=env.str('FCSAPI_API_KEY'),
+        crypto_prices_ttl=timedelta(
+            seconds=env.int('CRYPTO_PRICES_TTL', default=10)),
+        crypto_prices_poll_interval=timedelta(
+            seconds=env.int('CRYPTO_PRICES_POLL_INTERVAL', default=5)),
+        rollup_compaction_interval=timedelta(
+            seconds=env.int('ROLLUP_COMPACTION_INTERVAL', default=3600))
     )
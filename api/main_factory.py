@@ -1,5 +1,7 @@
 from fastapi import FastAPI
 
+from api.responses import ORJSONResponse
+
 
 def create_app() -> FastAPI:
-    return FastAPI()
+    return FastAPI(default_response_class=ORJSONResponse)
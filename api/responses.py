@@ -0,0 +1,23 @@
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, UUID):
+        # asyncpg returns its own UUID subclass, orjson only knows uuid.UUID
+        return str(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=default,
+                            option=orjson.OPT_NON_STR_KEYS)
@@ -1,11 +1,15 @@
-import httpx
 from fastapi import FastAPI, APIRouter
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from api.v1.dependencies.auth import AuthProvider, get_current_user, \
     get_auth_provider
 from api.v1.dependencies.currency_api import currency_api_provider, CurrencyAPI
-from api.v1.dependencies.db import DatabaseProvider, dao_provider
+from api.v1.dependencies.db import DatabaseProvider, dao_provider, \
+    dao_factory_provider, StickyCookieMiddleware
+from api.v1.dependencies.fx_rates import FXRates, fx_rates_provider
+from api.v1.dependencies.price_cache import CachedCurrencyAPI
+from finances.database.dao.user_configuration_cache import \
+    UserConfigurationCache
 from finances.models.dto.config import Config
 
 
@@ -14,15 +18,28 @@ def setup(
         api_router: APIRouter,
         db_sessionmaker: async_sessionmaker,
         config: Config,
-        client: httpx.AsyncClient
-):
-    db_provider = DatabaseProvider(session=db_sessionmaker)
+        currency_api: CurrencyAPI,
+        fx_rates: FXRates,
+        configuration_cache: UserConfigurationCache | None = None,
+        replica_sessionmakers: list[async_sessionmaker] | None = None
+) -> AuthProvider:
     auth_provider = AuthProvider(config.auth)
-    currency_api = CurrencyAPI(client)
+    db_provider = DatabaseProvider(
+        session=db_sessionmaker,
+        configuration_cache=configuration_cache,
+        replica_sessions=replica_sessionmakers,
+        replica_sticky=config.db.replica_sticky,
+        user_cache=auth_provider.user_cache
+    )
 
     api_router.include_router(auth_provider.router)
+    if db_provider.replica_sessions:
+        app.add_middleware(StickyCookieMiddleware)
 
     app.dependency_overrides[dao_provider] = db_provider.dao
+    app.dependency_overrides[dao_factory_provider] = db_provider.dao_factory
     app.dependency_overrides[get_current_user] = auth_provider.get_current_user
     app.dependency_overrides[get_auth_provider] = lambda: auth_provider
     app.dependency_overrides[currency_api_provider] = lambda: currency_api
+    app.dependency_overrides[fx_rates_provider] = lambda: fx_rates
+    return auth_provider
@@ -7,6 +7,9 @@ from passlib.context import CryptContext
 from starlette import status
 
 from api.v1.dependencies.db import dao_provider
+from api.v1.dependencies.password_hasher import PasswordHasher, \
+    PasswordHasherBusy
+from api.v1.dependencies.user_cache import UserCache
 from api.v1.models.request.token import Token
 from finances.database.dao import DAO
 from finances.exceptions.user import UserNotFound
@@ -28,18 +31,24 @@ class AuthProvider:
     def __init__(self, config: AuthConfig):
         self.config = config
         self.pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+        self.password_hasher = PasswordHasher(self.pwd_context,
+                                              config.hash_workers,
+                                              config.hash_queue_size)
+        self.user_cache = UserCache(config.user_cache_size,
+                                    config.user_cache_ttl)
         self.secret_key = config.secret_key
         self.algorythm = 'HS256'
         self.access_token_expire = config.token_expire
         self.router = APIRouter(prefix='/auth', tags=['auth'])
         self.setup_auth_routes()
 
-    def verify_password(self, plain_password: str,
-                        hashed_password: str) -> bool:
-        return self.pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(self, plain_password: str,
+                              hashed_password: str) -> bool:
+        return await self.password_hasher.verify(plain_password,
+                                                 hashed_password)
 
-    def get_password_hash(self, password: str) -> str:
-        return self.pwd_context.hash(password)
+    async def get_password_hash(self, password: str) -> str:
+        return await self.password_hasher.hash(password)
 
     async def authenticate_user(self, username: str, password: str,
                                 dao: DAO) -> dto.User:
@@ -52,7 +61,15 @@ class AuthProvider:
             user = await dao.user.get_by_username_with_password(username)
         except UserNotFound:
             raise http_status_401
-        if not self.verify_password(password, user.hashed_password or ''):
+        try:
+            verified = await self.verify_password(password,
+                                                  user.hashed_password or '')
+        except PasswordHasherBusy as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e)
+            )
+        if not verified:
             raise http_status_401
         return user.without_password()
 
@@ -67,7 +84,8 @@ class AuthProvider:
 
     def create_user_token(self, user: dto.User) -> Token:
         return self.create_access_token(
-            data={'sub': user.username}, expires_delta=self.access_token_expire
+            data={'sub': user.username, 'uid': str(user.id)},
+            expires_delta=self.access_token_expire
         )
 
     async def get_current_user(
@@ -88,9 +106,15 @@ class AuthProvider:
                 raise credentials_exception
         except JWTError:
             raise credentials_exception
-        try:
-            user = await dao.user.get_by_username(username=username)
-        except UserNotFound:
+        user_id = payload.get('uid')
+        user = self.user_cache.get(username)
+        if user is None or (user_id and str(user.id) != user_id):
+            try:
+                user = await dao.user.get_by_username(username=username)
+            except UserNotFound:
+                raise credentials_exception
+            self.user_cache.set(username, user)
+        if user_id and str(user.id) != user_id:
             raise credentials_exception
         return user
 
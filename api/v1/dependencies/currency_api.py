@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import time
+from datetime import timedelta
 from decimal import Decimal
 from dataclasses import dataclass
 
@@ -20,15 +23,52 @@ class BinanceAPI:
 
 
 class CurrencyAPI:
-    def __init__(self, client: AsyncClient):
+    def __init__(self, client: AsyncClient,
+                 symbols_ttl: timedelta = timedelta(hours=1)):
         self._client = client
         self.binance_api = BinanceAPI()
+        self._symbols_ttl = symbols_ttl.total_seconds()
+        self._symbols: frozenset[str] = frozenset()
+        self._symbols_updated: float | None = None
+        self._symbols_lock = asyncio.Lock()
+        self._symbols_task: asyncio.Task | None = None
 
     async def get_all_pairs(self) -> list[str]:
         response = await self._client.get(
             self.binance_api.base_url + 'ticker/price'
         )
-        return [pair['symbol'] for pair in response.json()]
+        pairs = response.json()
+        if response.status_code != 200:
+            logging.error(
+                f'[BinanceAPI:get_all_pairs] response: {pairs}')
+            raise CantGetPrice
+
+        return [pair['symbol'] for pair in pairs]
+
+    async def refresh_symbols(self) -> frozenset[str]:
+        pairs = await self.get_all_pairs()
+        self._symbols = frozenset(
+            pair for pair in pairs if pair.endswith('USDT'))
+        self._symbols_updated = time.monotonic()
+        return self._symbols
+
+    async def _refresh_symbols_in_background(self):
+        try:
+            await self.refresh_symbols()
+        except Exception as e:
+            logging.error(
+                f'[BinanceAPI:refresh_symbols] unable to refresh: {e!r}')
+
+    async def get_usdt_symbols(self) -> frozenset[str]:
+        if self._symbols_updated is None:
+            async with self._symbols_lock:
+                if self._symbols_updated is None:
+                    await self.refresh_symbols()
+        elif time.monotonic() - self._symbols_updated > self._symbols_ttl \
+                and (self._symbols_task is None or self._symbols_task.done()):
+            self._symbols_task = asyncio.create_task(
+                self._refresh_symbols_in_background())
+        return self._symbols
 
     async def get_crypto_currency_price(self, crypto_code: str) -> Decimal:
         response = await self._client.get(
@@ -45,14 +85,15 @@ class CurrencyAPI:
 
     async def get_crypto_currency_prices(self, crypto_codes: list[str]) \
             -> dict[str, Decimal]:
-        all_pairs = await self.get_all_pairs()
+        usdt_symbols = await self.get_usdt_symbols()
+        symbols = [f'"{code}USDT"' for code in crypto_codes if
+                   f'{code}USDT' in usdt_symbols]
+        if not symbols:
+            return {}
+
         response = await self._client.get(
-            self.binance_api.base_url + 'ticker/price?symbols',
-            params={
-                'symbols': '[' + ','.join(
-                    f'"{code}USDT"' for code in crypto_codes if
-                    f'{code}USDT' in all_pairs) + ']'
-            }
+            self.binance_api.base_url + 'ticker/price',
+            params={'symbols': '[' + ','.join(symbols) + ']'}
         )
         prices = response.json()
         if response.status_code != 200:
@@ -1,16 +1,173 @@
+import itertools
+import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from functools import partial
+from http.cookies import SimpleCookie
+
+from fastapi import Request
+from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from finances.database.dao import DAO
+from finances.database.dao.user_configuration_cache import \
+    UserConfigurationCache
+from finances.interfaces.user_cache import UserCacheProtocol
+
+READ_METHODS = frozenset({'GET', 'HEAD'})
+STICKY_COOKIE = 'primary_until'
 
 
 def dao_provider() -> DAO:
     raise NotImplementedError
 
 
+def dao_factory_provider():
+    raise NotImplementedError
+
+
+class RecentWriters:
+    def __init__(self, window: timedelta = timedelta(seconds=5),
+                 maxsize: int = 10000):
+        self._window = window.total_seconds()
+        self._maxsize = maxsize
+        self._writers: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._writers)
+
+    def mark(self, key: str):
+        self._writers[key] = time.monotonic() + self._window
+        self._writers.move_to_end(key)
+        while len(self._writers) > self._maxsize:
+            self._writers.popitem(last=False)
+
+    def is_recent(self, key: str) -> bool:
+        expires = self._writers.get(key)
+        if expires is None:
+            return False
+        if time.monotonic() >= expires:
+            del self._writers[key]
+            return False
+        return True
+
+
+def get_writer_key(request: Request) -> str | None:
+    authorization = request.headers.get('Authorization')
+    if not authorization:
+        return None
+    token = authorization.removeprefix('Bearer ').strip()
+    try:
+        # only used for routing, the token is verified by get_current_user
+        user_id = jwt.get_unverified_claims(token).get('uid')
+    except JWTError:
+        user_id = None
+    return user_id or token
+
+
 class DatabaseProvider:
-    def __init__(self, session: async_sessionmaker):
+    def __init__(self, session: async_sessionmaker,
+                 configuration_cache: UserConfigurationCache | None = None,
+                 replica_sessions: list[async_sessionmaker] | None = None,
+                 replica_sticky: timedelta = timedelta(seconds=5),
+                 user_cache: UserCacheProtocol | None = None):
         self.session = session
+        self.configuration_cache = configuration_cache or \
+            UserConfigurationCache()
+        self.user_cache = user_cache
+        self.replica_sessions = replica_sessions or []
+        self._replicas = itertools.cycle(self.replica_sessions)
+        self.replica_sticky = replica_sticky
+        self.recent_writers = RecentWriters(replica_sticky)
+
+    @asynccontextmanager
+    async def open_dao(self, read_only: bool = False):
+        session = self.session
+        if read_only and self.replica_sessions:
+            session = next(self._replicas)
+        else:
+            read_only = False
+        dao = DAO(session_factory=session,
+                  configuration_cache=self.configuration_cache,
+                  read_only=read_only,
+                  user_cache=self.user_cache)
+        try:
+            yield dao
+        finally:
+            await dao.close()
+
+    def mark_write(self, request: Request):
+        writer_key = get_writer_key(request)
+        if self.replica_sessions and writer_key is not None:
+            self.recent_writers.mark(writer_key)
+
+    def mark_sticky(self, request: Request):
+        # RecentWriters is per process, StickyCookieMiddleware turns this
+        # into a cookie that keeps the client on the primary when its next
+        # request lands on another worker
+        request.state.primary_until = \
+            time.time() + self.replica_sticky.total_seconds()
+
+    def is_sticky(self, request: Request) -> bool:
+        writer_key = get_writer_key(request)
+        if writer_key is not None and \
+                self.recent_writers.is_recent(writer_key):
+            return True
+        try:
+            primary_until = float(request.cookies.get(STICKY_COOKIE, 0))
+        except ValueError:
+            return False
+        return primary_until > time.time()
+
+    def use_replica(self, request: Request) -> bool:
+        if not self.replica_sessions:
+            return False
+        if request.method not in READ_METHODS:
+            self.mark_write(request)
+            return False
+        return not self.is_sticky(request)
+
+    async def dao(self, request: Request):
+        read_only = self.use_replica(request)
+        if self.replica_sessions and request.method not in READ_METHODS:
+            self.mark_sticky(request)
+        try:
+            async with self.open_dao(read_only) as dao:
+                yield dao
+        finally:
+            if request.method not in READ_METHODS:
+                # keep the writer on the primary until replicas catch up
+                self.mark_write(request)
+
+    def dao_factory(self, request: Request):
+        return partial(self.open_dao, self.use_replica(request))
+
+
+class StickyCookieMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message):
+            primary_until = scope.get('state', {}).get('primary_until')
+            if message['type'] == 'http.response.start' and \
+                    primary_until is not None:
+                cookie = SimpleCookie()
+                cookie[STICKY_COOKIE] = str(int(primary_until))
+                cookie[STICKY_COOKIE]['max-age'] = \
+                    math.ceil(primary_until - time.time())
+                cookie[STICKY_COOKIE]['path'] = '/'
+                cookie[STICKY_COOKIE]['httponly'] = True
+                MutableHeaders(scope=message).append(
+                    'set-cookie', cookie.output(header='').strip())
+            await send(message)
 
-    async def dao(self):
-        async with self.session() as s:
-            yield DAO(session=s)
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta, date
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from finances.database.dao.currency_price import CurrencyPriceDAO
+from finances.database.dao.currency_price_history import \
+    CurrencyPriceHistoryDAO
+from finances.models import dto
+
+
+def fx_rates_provider():
+    raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class FXRatesSnapshot:
+    version: int
+    loaded: float
+    index: dict[str, int]
+    matrix: tuple[tuple[Decimal | None, ...], ...]
+
+    def get_rate(self, base: str, quote: str) -> Decimal | None:
+        if base == quote:
+            return Decimal('1')
+        base_index = self.index.get(base)
+        quote_index = self.index.get(quote)
+        if base_index is None or quote_index is None:
+            return None
+        return self.matrix[base_index][quote_index]
+
+    @classmethod
+    def from_prices(cls, prices: list[dto.CurrencyPrice], version: int,
+                    pivots_count: int = 3) -> FXRatesSnapshot:
+        codes = sorted({price.base for price in prices} |
+                       {price.quote for price in prices})
+        index = {code: i for i, code in enumerate(codes)}
+        size = len(codes)
+        matrix: list[list[Decimal | None]] = [[None] * size
+                                              for _ in range(size)]
+        for price in prices:
+            if price.price:
+                matrix[index[price.base]][index[price.quote]] = price.price
+        for price in prices:
+            base, quote = index[price.base], index[price.quote]
+            if price.price and matrix[quote][base] is None:
+                matrix[quote][base] = 1 / price.price
+
+        pivots = sorted(range(size), reverse=True, key=lambda k: sum(
+            rate is not None for rate in matrix[k]))[:pivots_count]
+        for i in range(size):
+            row = matrix[i]
+            for j in range(size):
+                if row[j] is not None or i == j:
+                    continue
+                for k in pivots:
+                    if row[k] is not None and matrix[k][j] is not None:
+                        row[j] = row[k] * matrix[k][j]
+                        break
+
+        return FXRatesSnapshot(
+            version=version,
+            loaded=time.monotonic(),
+            index=index,
+            matrix=tuple(tuple(row) for row in matrix)
+        )
+
+
+class FXRatesHistory:
+    def __init__(self, session: async_sessionmaker,
+                 recent: timedelta = timedelta(days=45),
+                 max_days: int = 1000):
+        self._session = session
+        self._recent = recent
+        self._max_days = max_days
+        self._rates: OrderedDict[tuple[str, date], dict[str, Decimal]] = \
+            OrderedDict()
+
+    def is_recent(self, start_date: date, end_date: date) -> bool:
+        today = date.today()
+        return start_date >= today - self._recent and \
+            end_date <= today + self._recent
+
+    def invalidate(self, since: date | None = None):
+        since = since or date.today()
+        for key in [key for key in self._rates if key[1] >= since]:
+            del self._rates[key]
+
+    async def get_rates(self, base: str, start_date: date, end_date: date) \
+            -> dict[date, dict[str, Decimal]]:
+        days = [start_date + timedelta(days=i)
+                for i in range((end_date - start_date).days)]
+        missing = []
+        for day in days:
+            if (base, day) in self._rates:
+                self._rates.move_to_end((base, day))
+            else:
+                missing.append(day)
+        if missing:
+            async with self._session() as session:
+                rates = await CurrencyPriceHistoryDAO(session).get_rates(
+                    base, missing[0], missing[-1])
+            for day, day_rates in rates.items():
+                self._rates[(base, day)] = day_rates
+            while len(self._rates) > self._max_days:
+                self._rates.popitem(last=False)
+
+        return {day: self._rates[(base, day)] for day in days}
+
+
+class FXRates:
+    def __init__(self, session: async_sessionmaker,
+                 ttl: timedelta = timedelta(hours=1)):
+        self._session = session
+        self._ttl = ttl.total_seconds()
+        self._lock = asyncio.Lock()
+        self._snapshot: FXRatesSnapshot | None = None
+        self.history = FXRatesHistory(session)
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version if self._snapshot else 0
+
+    def _is_fresh(self) -> bool:
+        return self._snapshot is not None and \
+            time.monotonic() - self._snapshot.loaded < self._ttl
+
+    async def refresh(self) -> FXRatesSnapshot:
+        async with self._session() as session:
+            prices = await CurrencyPriceDAO(session).get_all()
+        self._snapshot = FXRatesSnapshot.from_prices(prices,
+                                                     self.version + 1)
+        self.history.invalidate()
+        logging.info(f'[FXRates:refresh] loaded {len(prices)} prices, '
+                     f'version {self._snapshot.version}')
+        return self._snapshot
+
+    async def get_snapshot(self) -> FXRatesSnapshot:
+        if not self._is_fresh():
+            async with self._lock:
+                if not self._is_fresh():
+                    await self.refresh()
+        return self._snapshot
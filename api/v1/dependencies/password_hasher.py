@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from passlib.context import CryptContext
+
+
+class PasswordHasherBusy(Exception):
+    def __init__(self):
+        super().__init__('Password hashing is saturated, try again later')
+
+
+@dataclass(frozen=True)
+class PasswordHasherStats:
+    workers: int
+    max_pending: int
+    pending: int
+    peak_pending: int
+    completed: int
+    rejected: int
+
+
+class PasswordHasher:
+    def __init__(self, pwd_context: CryptContext, workers: int = 4,
+                 queue_size: int = 32):
+        self._pwd_context = pwd_context
+        self._workers = workers
+        self._max_pending = workers + queue_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='password_hasher')
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def stats(self) -> PasswordHasherStats:
+        return PasswordHasherStats(
+            workers=self._workers,
+            max_pending=self._max_pending,
+            pending=self._pending,
+            peak_pending=self._peak_pending,
+            completed=self._completed,
+            rejected=self._rejected
+        )
+
+    async def _run(self, func, *args):
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            logging.warning(
+                f'[PasswordHasher] saturated with {self._pending} pending, '
+                f'{self._rejected} rejected so far')
+            raise PasswordHasherBusy
+
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, func, *args)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self._pwd_context.hash, password)
+
+    async def verify(self, plain_password: str,
+                     hashed_password: str) -> bool:
+        return await self._run(self._pwd_context.verify, plain_password,
+                               hashed_password)
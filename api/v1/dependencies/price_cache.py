@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+
+from httpx import AsyncClient
+
+from api.v1.dependencies.currency_api import CurrencyAPI, CantGetPrice
+
+
+@dataclass(frozen=True)
+class CachedPrice:
+    price: Decimal | None
+    fetched: float
+
+
+class CachedCurrencyAPI(CurrencyAPI):
+    def __init__(self, client: AsyncClient,
+                 prices_ttl: timedelta = timedelta(seconds=10),
+                 prices_max_stale: timedelta = timedelta(minutes=5)):
+        super().__init__(client)
+        self._prices_ttl = prices_ttl.total_seconds()
+        self._prices_max_stale = prices_max_stale.total_seconds()
+        self._prices: dict[str, CachedPrice] = {}
+        self._inflight: dict[frozenset[str], asyncio.Task] = {}
+
+    async def _load_prices(self, crypto_codes: frozenset[str]):
+        prices = await super().get_crypto_currency_prices(list(crypto_codes))
+        fetched = time.monotonic()
+        for code in crypto_codes:
+            self._prices[code] = CachedPrice(prices.get(f'{code}USDT'),
+                                             fetched)
+
+    def _on_load_done(self, crypto_codes: frozenset[str],
+                      task: asyncio.Task):
+        self._inflight.pop(crypto_codes, None)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(
+                f'[CachedCurrencyAPI:load_prices] {sorted(crypto_codes)}: '
+                f'{task.exception()!r}')
+
+    def _fetch(self, crypto_codes: frozenset[str]) -> asyncio.Task:
+        task = self._inflight.get(crypto_codes)
+        if task is None:
+            task = asyncio.create_task(self._load_prices(crypto_codes))
+            task.add_done_callback(
+                lambda done: self._on_load_done(crypto_codes, done))
+            self._inflight[crypto_codes] = task
+        return task
+
+    async def refresh_prices(self, crypto_codes: list[str]):
+        await asyncio.shield(self._fetch(frozenset(crypto_codes)))
+
+    async def get_crypto_currency_prices(self, crypto_codes: list[str]) \
+            -> dict[str, Decimal]:
+        now = time.monotonic()
+        missing, stale = set(), set()
+        for code in crypto_codes:
+            cached = self._prices.get(code)
+            if cached is None or now - cached.fetched > self._prices_max_stale:
+                missing.add(code)
+            elif now - cached.fetched > self._prices_ttl:
+                stale.add(code)
+
+        refreshing = set().union(*self._inflight)
+        stale -= refreshing
+        if stale:
+            self._fetch(frozenset(stale))
+        if missing:
+            await asyncio.shield(self._fetch(frozenset(missing)))
+
+        prices = {}
+        for code in crypto_codes:
+            cached = self._prices.get(code)
+            if cached is not None and cached.price is not None:
+                prices[f'{code}USDT'] = cached.price
+        return prices
+
+    async def get_crypto_currency_price(self, crypto_code: str) -> Decimal:
+        prices = await self.get_crypto_currency_prices([crypto_code])
+        if f'{crypto_code}USDT' not in prices:
+            raise CantGetPrice
+        return prices[f'{crypto_code}USDT']
@@ -0,0 +1,42 @@
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from uuid import UUID
+
+from finances.models import dto
+
+
+class UserCache:
+    def __init__(self, maxsize: int = 10000,
+                 ttl: timedelta = timedelta(minutes=1)):
+        self._maxsize = maxsize
+        self._ttl = ttl.total_seconds()
+        self._users: OrderedDict[str, tuple[dto.User, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def get(self, username: str) -> dto.User | None:
+        cached = self._users.get(username)
+        if cached is None:
+            return None
+        user, expires = cached
+        if time.monotonic() >= expires:
+            del self._users[username]
+            return None
+        self._users.move_to_end(username)
+        return user
+
+    def set(self, username: str, user: dto.User):
+        self._users[username] = (user, time.monotonic() + self._ttl)
+        self._users.move_to_end(username)
+        while len(self._users) > self._maxsize:
+            self._users.popitem(last=False)
+
+    def invalidate(self, username: str):
+        self._users.pop(username, None)
+
+    def invalidate_user_id(self, user_id: UUID):
+        for username, (user, _) in list(self._users.items()):
+            if user.id == user_id:
+                del self._users[username]
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from uuid import UUID
 
@@ -10,7 +10,7 @@ from .transaction import TransactionResponse
 @dataclass
 class TotalResult:
     total: float
-    server_time: datetime = datetime.utcnow()
+    server_time: datetime = field(default_factory=datetime.utcnow)
 
 
 @dataclass
@@ -18,14 +18,24 @@ class TotalByPortfolioResult:
     portfolio_id: UUID
     total: float
     totals_buy: list[dto.TotalBuyCryptoAsset]
-    server_time: datetime = datetime.utcnow()
+    server_time: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class DashboardResult:
+    total_assets: float
+    total_income: float
+    total_expense: float
+    categories: dto.TotalCategories
+    crypto_portfolio: TotalByPortfolioResult | None = None
+    server_time: datetime = field(default_factory=datetime.utcnow)
 
 
 @dataclass
 class TotalAssetResult:
     asset_id: UUID
     total: float
-    server_time: datetime = datetime.utcnow()
+    server_time: datetime = field(default_factory=datetime.utcnow)
 
 
 @dataclass
@@ -35,10 +45,25 @@ class TransactionsResponse:
     total_income: float | None = None
     total_expense: float | None = None
 
+    @classmethod
+    def from_dto(cls, transactions_dto: dto.Transactions,
+                 with_totals: bool = True) -> 'TransactionsResponse':
+        return TransactionsResponse(
+            created=transactions_dto.created,
+            transactions=[
+                TransactionResponse.from_dto(transaction_dto)
+                for transaction_dto in transactions_dto.transactions
+            ],
+            total_income=transactions_dto.total_income
+            if with_totals else None,
+            total_expense=transactions_dto.total_expense
+            if with_totals else None
+        )
+
 
 @dataclass
 class TotalByAssetResponse:
     asset_id: UUID
     total_income: Decimal
     total_expense: Decimal
-    server_time: datetime = datetime.utcnow()
+    server_time: datetime = field(default_factory=datetime.utcnow)
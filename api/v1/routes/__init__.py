@@ -6,6 +6,7 @@ from api.v1.routes.crypto_currency import get_crypto_currency_router
 from api.v1.routes.crypto_portfolio import get_crypto_portfolio_router
 from api.v1.routes.crypto_transaction import get_crypto_transaction_router
 from api.v1.routes.currency import get_currency_router
+from api.v1.routes.dashboard import get_dashboard_router
 from api.v1.routes.transaction_category import get_transaction_category_router
 from api.v1.routes.user import get_user_router
 from api.v1.routes.transaction import get_transaction_router
@@ -37,3 +38,5 @@ def setup_routers(api_router: APIRouter):
     api_router.include_router(get_crypto_transaction_router(),
                               prefix='/cryptoTransaction',
                               tags=['crypto transaction'])
+    api_router.include_router(get_dashboard_router(), prefix='/dashboard',
+                              tags=['dashboard'])
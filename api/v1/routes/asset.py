@@ -3,13 +3,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from starlette import status
 
-from api.v1.dependencies import get_current_user, dao_provider
+from api.v1.dependencies import get_current_user, dao_provider, FXRates, \
+    fx_rates_provider
 from api.v1.models.request.asset import AssetCreate, AssetChange
 from api.v1.models.response.asset import AssetResponse
 from api.v1.models.response.total_result import TotalResult, TotalAssetResult
 from finances.database.dao import DAO
 from finances.exceptions.asset import AssetNotFound, AssetExists
-from finances.exceptions.currency import CurrencyNotFound
+from finances.exceptions.currency import CurrencyNotFound, \
+    CurrencyRateNotFound
 from finances.models import dto
 from finances.services.asset import add_new_asset, get_asset_by_id, \
     change_asset, delete_asset, get_total_assets, get_total_asset
@@ -84,21 +86,30 @@ async def delete_asset_route(
 async def get_total_asset_route(
         asset_id: UUID = Query(),
         current_user: dto.User = Depends(get_current_user),
-        dao: DAO = Depends(dao_provider)
+        dao: DAO = Depends(dao_provider),
+        fx_rates: FXRates = Depends(fx_rates_provider)
 ) -> TotalAssetResult:
     try:
-        total = await get_total_asset(asset_id, current_user, dao)
+        total = await get_total_asset(asset_id, current_user, dao, fx_rates)
     except AssetNotFound as e:
         raise HTTPException(status_code=404, detail=e.message)
+    except CurrencyRateNotFound as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=e.message)
     else:
         return TotalAssetResult(asset_id=asset_id, total=total)
 
 
 async def get_total_assets_route(
         current_user: dto.User = Depends(get_current_user),
-        dao: DAO = Depends(dao_provider)
+        dao: DAO = Depends(dao_provider),
+        fx_rates: FXRates = Depends(fx_rates_provider)
 ) -> TotalResult:
-    total = await get_total_assets(current_user, dao)
+    try:
+        total = await get_total_assets(current_user, dao, fx_rates)
+    except CurrencyRateNotFound as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=e.message)
     return TotalResult(total=total)
 
 
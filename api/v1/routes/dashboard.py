@@ -0,0 +1,52 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette import status
+
+from api.v1.dependencies import get_current_user, dao_factory_provider, \
+    FXRates, fx_rates_provider, CurrencyAPI, currency_api_provider
+from api.v1.models.response.total_result import DashboardResult, \
+    TotalByPortfolioResult
+from finances.exceptions.currency import CurrencyRateNotFound
+from finances.models import dto
+from finances.models.enums.transaction_type import TransactionType
+from finances.services.dashboard import get_dashboard, DAOFactory
+
+
+async def get_dashboard_route(
+        start_date: date = Query(alias='startDate'),
+        end_date: date = Query(alias='endDate'),
+        categories_type: TransactionType = Query(
+            alias='categoriesType', default=TransactionType.EXPENSE),
+        current_user: dto.User = Depends(get_current_user),
+        dao_factory: DAOFactory = Depends(dao_factory_provider),
+        fx_rates: FXRates = Depends(fx_rates_provider),
+        currency_api: CurrencyAPI = Depends(currency_api_provider)
+) -> DashboardResult:
+    try:
+        dashboard = await get_dashboard(start_date, end_date,
+                                        categories_type, current_user,
+                                        dao_factory, fx_rates, currency_api)
+    except CurrencyRateNotFound as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=e.message)
+    crypto_portfolio = None
+    if dashboard.crypto_portfolio is not None:
+        crypto_portfolio = TotalByPortfolioResult(
+            portfolio_id=dashboard.crypto_portfolio_id,
+            total=dashboard.crypto_portfolio.current_total,
+            totals_buy=dashboard.crypto_portfolio.totals_buy
+        )
+    return DashboardResult(
+        total_assets=dashboard.total_assets,
+        total_income=dashboard.total_income,
+        total_expense=dashboard.total_expense,
+        categories=dashboard.categories,
+        crypto_portfolio=crypto_portfolio
+    )
+
+
+def get_dashboard_router() -> APIRouter:
+    router = APIRouter()
+    router.add_api_route('', get_dashboard_route, methods=['GET'])
+    return router
@@ -1,27 +1,58 @@
+import csv
+import io
+import json
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import ValidationError, parse_obj_as
 from starlette import status
 
-from api.v1.dependencies import get_current_user, dao_provider
+from api.responses import ORJSONResponse
+from api.v1.dependencies import get_current_user, dao_provider, FXRates, \
+    fx_rates_provider
 from api.v1.models.request.transaction import TransactionCreate, \
     TransactionChange
 from api.v1.models.response.total_result import TotalResult, \
     TransactionsResponse, TotalByAssetResponse
-from api.v1.models.response.transaction import TransactionResponse
+from api.v1.models.response.transaction import TransactionResponse, \
+    TransactionsImportResponse
 from finances.database.dao import DAO
 from finances.exceptions.asset import AssetNotFound, AssetCantBeDeleted
-from finances.exceptions.currency import CurrencyNotFound
+from finances.exceptions.currency import CurrencyNotFound, \
+    CurrencyRateNotFound
 from finances.exceptions.transaction import TransactionCategoryNotFound, \
     AddTransactionError, TransactionNotFound, MergeTransactionError, \
-    TransactionCantBeChanged, TransactionCantBeDeleted
+    TransactionCantBeChanged, TransactionCantBeDeleted, \
+    InvalidTransactionCursor, InvalidTransactionsImport
 from finances.models import dto
 from finances.models.enums.transaction_type import TransactionType
 from finances.services.transaction import add_transaction, \
     get_transaction_by_id, change_transaction, delete_transaction, \
     get_total_transactions_by_period, get_total_categories_by_period, \
-    get_totals_by_asset
+    get_totals_by_asset, import_transactions
+
+TRANSACTIONS_PAGE_SIZE = 100
+TRANSACTIONS_MAX_PAGE_SIZE = 500
+TRANSACTIONS_MAX_IMPORT_SIZE = 10000
+
+
+def parse_transactions_import(body: bytes, content_type: str) \
+        -> list[TransactionCreate]:
+    try:
+        if content_type.startswith('text/csv'):
+            rows = list(csv.DictReader(io.StringIO(body.decode())))
+        else:
+            rows = json.loads(body)
+    except (UnicodeDecodeError, ValueError, csv.Error):
+        raise InvalidTransactionsImport('Unable to parse transactions')
+
+    if not isinstance(rows, list):
+        raise InvalidTransactionsImport('Transactions must be a list')
+    if len(rows) > TRANSACTIONS_MAX_IMPORT_SIZE:
+        raise InvalidTransactionsImport(
+            f'Too many transactions, max {TRANSACTIONS_MAX_IMPORT_SIZE}')
+    return parse_obj_as(list[TransactionCreate], rows)
 
 
 async def get_transaction_by_id_route(
@@ -41,29 +72,42 @@ async def get_transaction_by_id_route(
 
 
 async def get_all_transactions_route(
+        request: Request,
         start_date: date = Query(alias='startDate'),
         end_date: date = Query(alias='endDate'),
         transaction_type: TransactionType = Query(default=None, alias='type'),
         asset_id: UUID = Query(default=None),
+        limit: int = Query(default=TRANSACTIONS_PAGE_SIZE, ge=1,
+                           le=TRANSACTIONS_MAX_PAGE_SIZE),
+        cursor: str = Query(default=None),
         current_user: dto.User = Depends(get_current_user),
         dao: DAO = Depends(dao_provider)
 ) -> list[TransactionsResponse]:
-    transactions = await dao.transaction.get_all(
-        current_user,
-        start_date,
-        end_date,
-        transaction_type.value if transaction_type else None,
-        asset_id=asset_id
-    )
-    if asset_id is None:
-        return [
-            TransactionsResponse(
-                created=item.created,
-                transactions=item.transactions
-            )
-            for item in transactions
-        ]
-    return transactions
+    try:
+        transactions_page = await dao.transaction.get_all(
+            current_user,
+            start_date,
+            end_date,
+            transaction_type.value if transaction_type else None,
+            asset_id=asset_id,
+            limit=limit,
+            cursor=dto.TransactionCursor.from_token(cursor) if cursor else None
+        )
+    except InvalidTransactionCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=e.message)
+
+    # already shaped by the response dataclasses, so skip re-validation
+    # and let orjson serialize them directly
+    response = ORJSONResponse([
+        TransactionsResponse.from_dto(item, with_totals=asset_id is not None)
+        for item in transactions_page.days
+    ])
+    if transactions_page.next_cursor:
+        next_url = request.url.include_query_params(
+            cursor=transactions_page.next_cursor.to_token())
+        response.headers['Link'] = f'<{next_url}>; rel="next"'
+    return response
 
 
 async def add_transaction_route(
@@ -87,6 +131,32 @@ async def add_transaction_route(
         return TransactionResponse.from_dto(transaction_dto)
 
 
+async def import_transactions_route(
+        request: Request,
+        current_user: dto.User = Depends(get_current_user),
+        dao: DAO = Depends(dao_provider)
+) -> TransactionsImportResponse:
+    try:
+        transactions = parse_transactions_import(
+            await request.body(), request.headers.get('content-type', ''))
+        imported = await import_transactions(
+            [transaction.dict() for transaction in transactions],
+            current_user,
+            dao
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail=e.errors())
+    except InvalidTransactionsImport as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=e.message)
+    except (AssetNotFound, TransactionCategoryNotFound) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail=e.message)
+    else:
+        return TransactionsImportResponse(imported=imported)
+
+
 async def change_transaction_route(
         transaction: TransactionChange,
         current_user: dto.User = Depends(get_current_user),
@@ -131,16 +201,22 @@ async def get_total_transactions_by_period_route(
         transaction_type: TransactionType = Query(alias='type'),
         asset_id: UUID = Query(default=None),
         current_user: dto.User = Depends(get_current_user),
-        dao: DAO = Depends(dao_provider)
+        dao: DAO = Depends(dao_provider),
+        fx_rates: FXRates = Depends(fx_rates_provider)
 ) -> TotalResult:
-    total = await get_total_transactions_by_period(
-        start_date,
-        end_date,
-        transaction_type,
-        asset_id,
-        current_user,
-        dao
-    )
+    try:
+        total = await get_total_transactions_by_period(
+            start_date,
+            end_date,
+            transaction_type,
+            asset_id,
+            current_user,
+            dao,
+            fx_rates
+        )
+    except CurrencyRateNotFound as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=e.message)
     return TotalResult(total=total)
 
 
@@ -149,15 +225,21 @@ async def get_total_categories_by_period_route(
         end_date: date = Query(alias='endDate'),
         transaction_type: TransactionType = Query(alias='type'),
         current_user: dto.User = Depends(get_current_user),
-        dao: DAO = Depends(dao_provider)
+        dao: DAO = Depends(dao_provider),
+        fx_rates: FXRates = Depends(fx_rates_provider)
 ) -> dto.TotalCategories:
-    return await get_total_categories_by_period(
-        start_date,
-        end_date,
-        transaction_type,
-        current_user,
-        dao
-    )
+    try:
+        return await get_total_categories_by_period(
+            start_date,
+            end_date,
+            transaction_type,
+            current_user,
+            dao,
+            fx_rates
+        )
+    except CurrencyRateNotFound as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=e.message)
 
 
 async def get_totals_by_asset_route(
@@ -184,6 +266,8 @@ def get_transaction_router() -> APIRouter:
     router = APIRouter()
     router.add_api_route('/add', add_transaction_route, methods=['POST'])
     router.add_api_route('/change', change_transaction_route, methods=['PUT']),
+    router.add_api_route('/import', import_transactions_route,
+                         methods=['POST'])
     router.add_api_route('/all', get_all_transactions_route, methods=['GET'])
     router.add_api_route('/totalByPeriod',
                          get_total_transactions_by_period_route,
@@ -3,6 +3,7 @@ from starlette import status
 
 from api.v1.dependencies import get_current_user, dao_provider, AuthProvider, \
     get_auth_provider
+from api.v1.dependencies.password_hasher import PasswordHasherBusy
 from api.v1.models.request.user import UserCreate
 from finances.database.dao.holder import DAO
 from finances.exceptions.user import UserException, UserExists
@@ -24,6 +25,9 @@ async def signup_route(
     except UserException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=e.message)
+    except PasswordHasherBusy as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=str(e))
     else:
         raise HTTPException(status_code=status.HTTP_200_OK)
 
@@ -50,7 +54,11 @@ async def set_password_route(
         user: dto.User = Depends(get_current_user),
         dao: DAO = Depends(dao_provider),
 ):
-    hashed_password = auth.get_password_hash(password)
+    try:
+        hashed_password = await auth.get_password_hash(password)
+    except PasswordHasherBusy as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=str(e))
     await set_password(user, hashed_password, dao.user)
     raise HTTPException(status_code=status.HTTP_200_OK)
 
@@ -1,7 +1,6 @@
 #!/bin/sh
 
 cd /app
-alembic revision --autogenerate -m "init"
 alembic upgrade head
 
 python3 -m api
\ No newline at end of file
@@ -1,7 +1,8 @@
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, delete, update
+from sqlalchemy import select, delete, update, values, column, Numeric
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -31,8 +32,19 @@ class AssetDAO(BaseDAO[Asset]):
                                 Asset.deleted.is_(False)).options(
                 joinedload(Asset.currency)).order_by(Asset.title)
         )
-        return [asset.to_dto(with_currency=bool(asset.currency_id)) for asset
-                in result.scalars().all()]
+        interned = {}
+        return [asset.to_dto(with_currency=bool(asset.currency_id),
+                             interned=interned)
+                for asset in result.scalars().all()]
+
+    async def get_owned_ids(self, asset_ids: set[UUID],
+                            user_id: UUID) -> set[UUID]:
+        result = await self.session.execute(
+            select(Asset.id).where(Asset.id.in_(asset_ids),
+                                   Asset.user_id == user_id,
+                                   Asset.deleted.is_(False))
+        )
+        return set(result.scalars().all())
 
     async def create(self, asset_dto: dto.Asset) -> dto.Asset:
         try:
@@ -44,11 +56,22 @@ class AssetDAO(BaseDAO[Asset]):
 
     async def merge(self, asset_dto: dto.Asset) -> dto.Asset:
         try:
-            asset = await self._merge(asset_dto)
+            asset = await self._merge(asset_dto, Asset.deleted.is_(False))
         except MergeModelError as e:
             raise AssetExists from e
-        else:
-            return asset.to_dto(with_currency=False)
+        if asset is None:
+            raise AssetNotFound
+        return asset.to_dto(with_currency=False)
+
+    async def soft_delete(self, asset_id: UUID, user_id: UUID):
+        stmt = update(Asset) \
+            .where(Asset.id == asset_id,
+                   Asset.user_id == user_id) \
+            .values(deleted=True) \
+            .returning(Asset.id)
+        result = await self.session.execute(stmt)
+        if result.scalar() is None:
+            raise AssetNotFound
 
     async def delete_by_id(self, asset_id: UUID, user_id: UUID) -> UUID:
         stmt = delete(Asset) \
@@ -63,9 +86,24 @@ class AssetDAO(BaseDAO[Asset]):
             amount: Decimal,
             asset_id: UUID,
             user_id: UUID
-    ):
+    ) -> Decimal | None:
         stmt = update(Asset).where(
             Asset.id == asset_id,
             Asset.user_id == user_id
-        ).values(amount=Asset.amount + amount)
+        ).values(amount=Asset.amount + amount).returning(Asset.amount)
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
+    async def update_amounts(
+            self,
+            amounts: dict[UUID, Decimal],
+            user_id: UUID
+    ):
+        deltas = values(column('id', PG_UUID(as_uuid=True)),
+                        column('amount', Numeric),
+                        name='deltas').data(list(amounts.items()))
+        stmt = update(Asset).where(
+            Asset.id == deltas.c.id,
+            Asset.user_id == user_id
+        ).values(amount=Asset.amount + deltas.c.amount)
         await self.session.execute(stmt)
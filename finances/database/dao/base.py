@@ -1,10 +1,12 @@
 from typing import Generic, Type, TypeVar, Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, func, Row, RowMapping, delete
+from sqlalchemy import select, func, Row, RowMapping, delete, update, \
+    inspect
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.sql.elements import ColumnElement
 
 from finances.database.models import Base
 from finances.exceptions.base import AddModelError, MergeModelError
@@ -56,14 +58,33 @@ class BaseDAO(Generic[Model]):
         else:
             return obj
 
-    async def _merge(self, dto_obj: DTOProtocol) \
-            -> Model:
+    async def _merge(self, dto_obj: DTOProtocol,
+                     *filters: ColumnElement[bool]) -> Model | None:
         obj = self.model.from_dto(dto_obj)
-        obj = await self.session.merge(obj)
+        state = inspect(obj)
+        where = list(filters)
+        values = {}
+        for column_attr in state.mapper.column_attrs:
+            key = column_attr.key
+            value = state.dict.get(key)
+            column = getattr(self.model, key)
+            if column_attr.columns[0].primary_key:
+                if value is None:
+                    raise ValueError(
+                        f'Can\'t merge {self.model.__name__} without {key}')
+                where.append(column == value)
+            elif key == 'user_id':
+                if value is not None:
+                    where.append(column == value)
+            elif key in state.dict:
+                values[key] = value
+
+        stmt = update(self.model).where(*where).values(values) \
+            .returning(self.model) \
+            .execution_options(populate_existing=True)
         try:
-            await self._flush(obj)
+            result = await self.session.execute(stmt)
         except IntegrityError as e:
-            print(e)
             raise MergeModelError from e
         else:
-            return obj
+            return result.scalar()
@@ -1,6 +1,7 @@
+from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -10,6 +11,7 @@ from finances.exceptions.base import AddModelError, MergeModelError
 from finances.exceptions.crypto_asset import CryptoAssetNotFound, \
     AddCryptoAssetError, MergeCryptoAssetError
 from finances.models import dto
+from finances.models.enums.transaction_type import CryptoTransactionType
 
 
 class CryptoAssetDAO(BaseDAO[CryptoAsset]):
@@ -75,8 +77,9 @@ class CryptoAssetDAO(BaseDAO[CryptoAsset]):
             crypto_asset = await self._merge(crypto_asset_dto)
         except MergeModelError as e:
             raise MergeCryptoAssetError from e
-        else:
-            return crypto_asset.to_dto(with_currency=False)
+        if crypto_asset is None:
+            raise CryptoAssetNotFound
+        return crypto_asset.to_dto(with_currency=False)
 
     async def delete_by_id(
             self,
@@ -89,3 +92,55 @@ class CryptoAssetDAO(BaseDAO[CryptoAsset]):
         ).returning(CryptoAsset.id)
         result = await self.session.execute(stmt)
         return result.scalar()
+
+    async def add_transaction(
+            self,
+            crypto_transaction_dto: dto.CryptoTransaction
+    ) -> Decimal | None:
+        return await self._apply(crypto_transaction_dto, 1)
+
+    async def remove_transaction(
+            self,
+            crypto_transaction_dto: dto.CryptoTransaction
+    ) -> Decimal | None:
+        return await self._apply(crypto_transaction_dto, -1)
+
+    async def _apply(self, crypto_transaction_dto: dto.CryptoTransaction,
+                     sign: int) -> Decimal | None:
+        if crypto_transaction_dto.type == CryptoTransactionType.SELL:
+            sign = -sign
+        amount = crypto_transaction_dto.amount * sign
+        stmt = update(CryptoAsset).where(
+            CryptoAsset.id == crypto_transaction_dto.crypto_asset_id
+        ).values(
+            amount=CryptoAsset.amount + amount,
+            total_amount=CryptoAsset.total_amount + amount,
+            total_cost=CryptoAsset.total_cost +
+            amount * crypto_transaction_dto.price
+        ).returning(CryptoAsset.amount)
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
+    async def rebuild_totals(self):
+        await self.session.execute(
+            update(CryptoAsset).values(total_amount=0, total_cost=0)
+            .execution_options(synchronize_session=False)
+        )
+        signed_amount = case(
+            (CryptoTransaction.type == CryptoTransactionType.SELL.value,
+             -CryptoTransaction.amount),
+            else_=CryptoTransaction.amount
+        )
+        totals = select(
+            CryptoTransaction.crypto_asset_id,
+            func.sum(signed_amount).label('total_amount'),
+            func.sum(signed_amount * CryptoTransaction.price)
+            .label('total_cost')
+        ).group_by(CryptoTransaction.crypto_asset_id).subquery()
+        await self.session.execute(
+            update(CryptoAsset)
+            .where(CryptoAsset.id == totals.c.crypto_asset_id)
+            .values(total_amount=totals.c.total_amount,
+                    total_cost=totals.c.total_cost)
+            .execution_options(synchronize_session=False)
+        )
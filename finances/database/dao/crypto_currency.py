@@ -1,9 +1,11 @@
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from finances.database.dao import BaseDAO
-from finances.database.models import CryptoCurrency
-from finances.exceptions.base import AddModelError, MergeModelError
+from finances.database.models import CryptoCurrency, CryptoAsset
+from finances.exceptions.base import AddModelError
 from finances.exceptions.crypto_currency import CryptoCurrencyNotFound, \
     CryptoCurrencyException
 from finances.models import dto
@@ -34,6 +36,13 @@ class CryptoCurrencyDAO(BaseDAO[CryptoCurrency]):
         return [crypto_currency.to_dto() for crypto_currency in
                 result.scalars().all()]
 
+    async def get_held_codes(self) -> list[str]:
+        stmt = select(CryptoCurrency.code).where(
+            CryptoCurrency.id.in_(select(CryptoAsset.crypto_currency_id))
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def create(self, crypto_currency_dto: dto.CryptoCurrency) \
             -> dto.CryptoCurrency:
         try:
@@ -46,10 +55,20 @@ class CryptoCurrencyDAO(BaseDAO[CryptoCurrency]):
 
     async def merge(self, crypto_currency_dto: dto.CryptoCurrency) \
             -> dto.CryptoCurrency:
+        stmt = insert(CryptoCurrency).values(
+            id=crypto_currency_dto.id,
+            name=crypto_currency_dto.name,
+            code=crypto_currency_dto.code
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CryptoCurrency.id],
+            set_={'name': stmt.excluded.name, 'code': stmt.excluded.code}
+        ).returning(CryptoCurrency) \
+            .execution_options(populate_existing=True)
         try:
-            crypto_currency = await self._merge(crypto_currency_dto)
-        except MergeModelError as e:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
             raise CryptoCurrencyException(
                 'Unable to change crypto currency') from e
         else:
-            return crypto_currency.to_dto()
+            return result.scalar().to_dto()
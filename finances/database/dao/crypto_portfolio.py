@@ -4,6 +4,8 @@ from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from finances.database.dao import BaseDAO
+from finances.database.dao.user_configuration_cache import \
+    UserConfigurationCache
 from finances.database.models import CryptoPortfolio
 from finances.exceptions.base import MergeModelError, AddModelError
 from finances.exceptions.crypto_portfolio import CryptoPortfolioExists, \
@@ -12,8 +14,10 @@ from finances.models import dto
 
 
 class CryptoPortfolioDAO(BaseDAO[CryptoPortfolio]):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession,
+                 configuration_cache: UserConfigurationCache | None = None):
         super().__init__(CryptoPortfolio, session)
+        self.configuration_cache = configuration_cache
 
     async def get_by_id(
             self,
@@ -39,6 +43,9 @@ class CryptoPortfolioDAO(BaseDAO[CryptoPortfolio]):
         except AddModelError as e:
             raise CryptoPortfolioExists from e
         else:
+            if self.configuration_cache is not None:
+                self.configuration_cache.invalidate_on_commit(
+                    self.session, crypto_portfolio.user_id)
             return crypto_portfolio.to_dto()
 
     async def merge(self, crypto_portfolio_dto: dto.CryptoPortfolio) \
@@ -47,8 +54,12 @@ class CryptoPortfolioDAO(BaseDAO[CryptoPortfolio]):
             crypto_portfolio = await self._merge(crypto_portfolio_dto)
         except MergeModelError as e:
             raise CryptoPortfolioExists from e
-        else:
-            return crypto_portfolio.to_dto()
+        if crypto_portfolio is None:
+            raise CryptoPortfolioNotFound
+        if self.configuration_cache is not None:
+            self.configuration_cache.invalidate_on_commit(
+                self.session, crypto_portfolio.user_id)
+        return crypto_portfolio.to_dto()
 
     async def delete_by_id(self, crypto_portfolio_id: UUID,
                            user_id: UUID) -> int:
@@ -57,4 +68,7 @@ class CryptoPortfolioDAO(BaseDAO[CryptoPortfolio]):
                    CryptoPortfolio.user_id == user_id) \
             .returning(CryptoPortfolio.id)
         currency = await self.session.execute(stmt)
+        if self.configuration_cache is not None:
+            self.configuration_cache.invalidate_on_commit(self.session,
+                                                          user_id)
         return currency.scalar()
@@ -1,14 +1,15 @@
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from finances.database.dao import BaseDAO
-from finances.database.models import CryptoTransaction
+from finances.database.models import CryptoTransaction, CryptoAsset
 from finances.exceptions.base import AddModelError, MergeModelError
 from finances.exceptions.crypto_transaction import CryptoTransactionNotFound, \
     AddCryptoTransactionError, MergeCryptoTransactionError
 from finances.models import dto
+from finances.models.enums.transaction_type import CryptoTransactionType
 
 
 class CryptoTransactionDAO(BaseDAO[CryptoTransaction]):
@@ -37,6 +38,39 @@ class CryptoTransactionDAO(BaseDAO[CryptoTransaction]):
         return [crypto_transaction.to_dto() for crypto_transaction in
                 result.scalars().all()]
 
+    async def get_totals_by_portfolio(
+            self,
+            portfolio_id: UUID,
+            user_id: UUID
+    ) -> dict[int, dto.CryptoAssetTotals]:
+        def total(transaction_type: CryptoTransactionType, value):
+            return func.coalesce(func.sum(case(
+                (CryptoTransaction.type == transaction_type.value, value),
+                else_=0
+            )), 0)
+
+        cost = CryptoTransaction.amount * CryptoTransaction.price
+        result = await self.session.execute(
+            select(
+                CryptoTransaction.crypto_asset_id,
+                total(CryptoTransactionType.BUY, CryptoTransaction.amount),
+                total(CryptoTransactionType.BUY, cost),
+                total(CryptoTransactionType.SELL, CryptoTransaction.amount),
+                total(CryptoTransactionType.SELL, cost)
+            ).where(
+                CryptoTransaction.crypto_asset_id.in_(
+                    select(CryptoAsset.id).where(
+                        CryptoAsset.portfolio_id == portfolio_id,
+                        CryptoAsset.user_id == user_id
+                    )
+                ),
+                CryptoTransaction.user_id == user_id
+            ).group_by(CryptoTransaction.crypto_asset_id)
+        )
+        return {
+            row[0]: dto.CryptoAssetTotals(*row) for row in result.all()
+        }
+
     async def create(self, crypto_transaction_dto: dto.CryptoTransaction) \
             -> dto.CryptoTransaction:
         try:
@@ -52,8 +86,9 @@ class CryptoTransactionDAO(BaseDAO[CryptoTransaction]):
             crypto_transaction = await self._merge(crypto_transaction_dto)
         except MergeModelError as e:
             raise MergeCryptoTransactionError from e
-        else:
-            return crypto_transaction.to_dto()
+        if crypto_transaction is None:
+            raise CryptoTransactionNotFound
+        return crypto_transaction.to_dto()
 
     async def delete_by_id(self, crypto_transaction_id: int,
                            user_id: UUID) -> CryptoTransaction | None:
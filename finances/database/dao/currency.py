@@ -4,14 +4,18 @@ from sqlalchemy import select, delete, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from finances.database.dao import BaseDAO
+from finances.database.dao.user_configuration_cache import \
+    UserConfigurationCache
 from finances.database.models import Currency
 from finances.exceptions.currency import CurrencyNotFound
 from finances.models import dto
 
 
 class CurrencyDAO(BaseDAO[Currency]):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession,
+                 configuration_cache: UserConfigurationCache | None = None):
         super().__init__(Currency, session)
+        self.configuration_cache = configuration_cache
 
     async def get_by_id(self, id_: int) -> dto.Currency:
         currency = await self._get_by_id(id_)
@@ -47,6 +51,12 @@ class CurrencyDAO(BaseDAO[Currency]):
 
     async def merge(self, currency_dto: dto.Currency) -> dto.Currency:
         currency = await self._merge(currency_dto)
+        if currency is None:
+            raise CurrencyNotFound
+        if self.configuration_cache is not None and \
+                currency.user_id is not None:
+            self.configuration_cache.invalidate_on_commit(
+                self.session, currency.user_id)
         return currency.to_dto()
 
     async def delete_by_id(self, currency_id: int, user_id: uuid.UUID) -> int:
@@ -55,4 +65,7 @@ class CurrencyDAO(BaseDAO[Currency]):
                    Currency.user_id == user_id) \
             .returning(Currency.id)
         currency = await self.session.execute(stmt)
+        if self.configuration_cache is not None:
+            self.configuration_cache.invalidate_on_commit(self.session,
+                                                          user_id)
         return currency.scalar()
@@ -1,4 +1,5 @@
-from sqlalchemy import select
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from finances.database.dao import BaseDAO
@@ -15,6 +16,10 @@ class CurrencyPriceDAO(BaseDAO[CurrencyPrice]):
         currency_price = await self._get_by_id((base, quote))
         return currency_price.to_dto() if currency_price else None
 
+    async def get_all(self) -> list[dto.CurrencyPrice]:
+        return [currency_price.to_dto() for currency_price in
+                await self._get_all()]
+
     async def get_prices(self, base: str, quotes: list[str]) \
             -> dict[str, dto.CurrencyPrice]:
         stmt = select(CurrencyPrice).where(
@@ -35,6 +40,20 @@ class CurrencyPriceDAO(BaseDAO[CurrencyPrice]):
         return currency_price.to_dto()
 
     async def add_many(self, currency_prices: list[dto.CurrencyPrice]):
-        for currency_price_dto in currency_prices:
-            currency_price = CurrencyPrice.from_dto(currency_price_dto)
-            await self.session.merge(currency_price)
+        prices = {
+            (currency_price.base, currency_price.quote): currency_price.price
+            for currency_price in currency_prices or []
+        }
+        if not prices:
+            return
+
+        stmt = insert(CurrencyPrice)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CurrencyPrice.base, CurrencyPrice.quote],
+            set_={'price': stmt.excluded.price, 'updated': func.now()}
+        )
+        await self.session.execute(
+            stmt,
+            [{'base': base, 'quote': quote, 'price': price}
+             for (base, quote), price in prices.items()]
+        )
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import select, or_, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from finances.database.dao import BaseDAO
+from finances.database.models import CurrencyPriceHistory
+from finances.models import dto
+
+
+class CurrencyPriceHistoryDAO(BaseDAO[CurrencyPriceHistory]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(CurrencyPriceHistory, session)
+
+    async def _create_partition(self, year: int):
+        await self.session.execute(text(
+            f'CREATE TABLE IF NOT EXISTS '
+            f'{CurrencyPriceHistory.__tablename__}_{year:d} '
+            f'PARTITION OF {CurrencyPriceHistory.__tablename__} '
+            f"FOR VALUES FROM ('{year:d}-01-01') TO ('{year + 1:d}-01-01')"
+        ))
+
+    async def add_many(self, currency_prices: list[dto.CurrencyPrice],
+                       day: date):
+        prices = {
+            (currency_price.base, currency_price.quote): currency_price.price
+            for currency_price in currency_prices or []
+        }
+        if not prices:
+            return
+
+        await self._create_partition(day.year)
+        stmt = insert(CurrencyPriceHistory)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CurrencyPriceHistory.base,
+                            CurrencyPriceHistory.quote,
+                            CurrencyPriceHistory.day],
+            set_={'price': stmt.excluded.price}
+        )
+        await self.session.execute(
+            stmt,
+            [{'base': base, 'quote': quote, 'day': day, 'price': price}
+             for (base, quote), price in prices.items()]
+        )
+
+    async def get_rates(self, base: str, start_date: date,
+                        end_date: date) -> dict[date, dict[str, Decimal]]:
+        pair = or_(CurrencyPriceHistory.base == base,
+                   CurrencyPriceHistory.quote == base)
+        columns = (CurrencyPriceHistory.day, CurrencyPriceHistory.base,
+                   CurrencyPriceHistory.quote, CurrencyPriceHistory.price,
+                   (CurrencyPriceHistory.base == base).label('direct'))
+        latest = select(*columns) \
+            .where(pair, CurrencyPriceHistory.day < start_date) \
+            .distinct(CurrencyPriceHistory.base, CurrencyPriceHistory.quote) \
+            .order_by(CurrencyPriceHistory.base, CurrencyPriceHistory.quote,
+                      CurrencyPriceHistory.day.desc())
+        window = select(*columns).where(
+            pair,
+            CurrencyPriceHistory.day >= start_date,
+            CurrencyPriceHistory.day <= end_date
+        )
+        result = await self.session.execute(
+            latest.union_all(window).order_by('day', 'direct'))
+        rows = result.all()
+
+        day_rates, rates = {}, {}
+        day, i = start_date, 0
+        while day <= end_date:
+            while i < len(rows) and rows[i].day <= day:
+                if rows[i].direct:
+                    day_rates[rows[i].quote] = rows[i].price
+                elif rows[i].price:
+                    day_rates[rows[i].base] = 1 / rows[i].price
+                i += 1
+            rates[day] = dict(day_rates)
+            day += timedelta(days=1)
+        return rates
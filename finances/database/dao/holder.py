@@ -1,4 +1,6 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from functools import cached_property
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from finances.database.dao.asset import AssetDAO
 from finances.database.dao.crypto_asset import CryptoAssetDAO
@@ -7,24 +9,92 @@ from finances.database.dao.crypto_portfolio import CryptoPortfolioDAO
 from finances.database.dao.crypto_transaction import CryptoTransactionDAO
 from finances.database.dao.currency import CurrencyDAO
 from finances.database.dao.currency_price import CurrencyPriceDAO
+from finances.database.dao.currency_price_history import \
+    CurrencyPriceHistoryDAO
 from finances.database.dao.transaction import TransactionDAO
 from finances.database.dao.transaction_category import TransactionCategoryDAO
+from finances.database.dao.transaction_daily_total import \
+    TransactionDailyTotalDAO
 from finances.database.dao.user import UserDAO
+from finances.database.dao.user_configuration_cache import \
+    UserConfigurationCache
+from finances.interfaces.user_cache import UserCacheProtocol
 
 
 class DAO:
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.user = UserDAO(self.session)
-        self.currency = CurrencyDAO(self.session)
-        self.asset = AssetDAO(self.session)
-        self.transaction_category = TransactionCategoryDAO(self.session)
-        self.transaction = TransactionDAO(self.session)
-        self.crypto_portfolio = CryptoPortfolioDAO(self.session)
-        self.crypto_currency = CryptoCurrencyDAO(self.session)
-        self.crypto_asset = CryptoAssetDAO(self.session)
-        self.crypto_transaction = CryptoTransactionDAO(self.session)
-        self.currency_price = CurrencyPriceDAO(self.session)
+    def __init__(self, session: AsyncSession | None = None,
+                 configuration_cache: UserConfigurationCache | None = None,
+                 read_only: bool = False,
+                 session_factory: async_sessionmaker | None = None,
+                 user_cache: UserCacheProtocol | None = None):
+        self._session = session
+        self._session_factory = session_factory
+        self.configuration_cache = configuration_cache
+        self.user_cache = user_cache
+        self.read_only = read_only
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    @property
+    def has_session(self) -> bool:
+        return self._session is not None
+
+    @cached_property
+    def user(self) -> UserDAO:
+        return UserDAO(self.session, self.configuration_cache,
+                       self.user_cache)
+
+    @cached_property
+    def currency(self) -> CurrencyDAO:
+        return CurrencyDAO(self.session, self.configuration_cache)
+
+    @cached_property
+    def asset(self) -> AssetDAO:
+        return AssetDAO(self.session)
+
+    @cached_property
+    def transaction_category(self) -> TransactionCategoryDAO:
+        return TransactionCategoryDAO(self.session)
+
+    @cached_property
+    def transaction(self) -> TransactionDAO:
+        return TransactionDAO(self.session)
+
+    @cached_property
+    def transaction_daily_total(self) -> TransactionDailyTotalDAO:
+        return TransactionDailyTotalDAO(self.session)
+
+    @cached_property
+    def crypto_portfolio(self) -> CryptoPortfolioDAO:
+        return CryptoPortfolioDAO(self.session, self.configuration_cache)
+
+    @cached_property
+    def crypto_currency(self) -> CryptoCurrencyDAO:
+        return CryptoCurrencyDAO(self.session)
+
+    @cached_property
+    def crypto_asset(self) -> CryptoAssetDAO:
+        return CryptoAssetDAO(self.session)
+
+    @cached_property
+    def crypto_transaction(self) -> CryptoTransactionDAO:
+        return CryptoTransactionDAO(self.session)
+
+    @cached_property
+    def currency_price(self) -> CurrencyPriceDAO:
+        return CurrencyPriceDAO(self.session)
+
+    @cached_property
+    def currency_price_history(self) -> CurrencyPriceHistoryDAO:
+        return CurrencyPriceHistoryDAO(self.session)
 
     async def commit(self):
         await self.session.commit()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
@@ -0,0 +1,28 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+PENDING_CALLBACKS = 'pending_on_commit'
+
+
+def call_on_commit(session: AsyncSession, callback: Callable[[], None]):
+    sync_session = session.sync_session
+    pending = sync_session.info.get(PENDING_CALLBACKS)
+    if pending is None:
+        pending = sync_session.info[PENDING_CALLBACKS] = []
+        event.listen(sync_session, 'after_commit', _after_commit)
+        event.listen(sync_session, 'after_soft_rollback', _after_rollback)
+    pending.append(callback)
+
+
+def _after_commit(session: Session):
+    pending = session.info[PENDING_CALLBACKS]
+    for callback in pending:
+        callback()
+    pending.clear()
+
+
+def _after_rollback(session: Session, previous_transaction):
+    session.info[PENDING_CALLBACKS].clear()
@@ -2,13 +2,14 @@ from decimal import Decimal
 from datetime import date
 from uuid import UUID
 
-from sqlalchemy import select, delete, func, cast, Date
+from sqlalchemy import select, delete, func, cast, Date, case, tuple_, \
+    literal, or_, and_, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from finances.database.dao import BaseDAO
 from finances.database.models import Transaction, Asset, TransactionCategory, \
-    Currency
+    Currency, TransactionDailyTotal, CurrencyPriceHistory
 from finances.exceptions.base import MergeModelError, AddModelError
 from finances.exceptions.transaction import AddTransactionError, \
     TransactionNotFound, MergeTransactionError
@@ -35,87 +36,187 @@ class TransactionDAO(BaseDAO[Transaction]):
             start_date: date,
             end_date: date,
             transaction_type: str | None = None,
-            asset_id: UUID | None = None
-    ) -> list[dto.Transactions]:
-        created_date = cast(Transaction.created, Date).label('created_date')
-        stmt = select(
-            created_date).where(
-            Transaction.user_id == user_dto.id).filter(
+            asset_id: UUID | None = None,
+            limit: int | None = None,
+            cursor: dto.TransactionCursor | None = None
+    ) -> dto.TransactionsPage:
+        filters = [
+            Transaction.user_id == user_dto.id,
             Transaction.created >= start_date,
-            Transaction.created <= end_date).order_by(
-            created_date.desc()).distinct()
+            Transaction.created <= end_date
+        ]
         if transaction_type:
-            stmt = stmt.where(Transaction.category.has(
-                TransactionCategory.type == transaction_type))
+            filters.append(TransactionCategory.type == transaction_type)
         if asset_id:
-            stmt = stmt.where(Transaction.asset_id == asset_id)
+            filters.append(Transaction.asset_id == asset_id)
 
-        result = await self.session.execute(stmt)
-        transactions = []
-        for created in result.fetchall():
-            stmt = select(Transaction) \
-                .where(
-                Transaction.user_id == user_dto.id,
-                created_date == created[0]
-            ) \
-                .order_by(created_date.desc(), Transaction.id.desc()) \
-                .options(
+        page = select(Transaction.id, Transaction.created) \
+            .join(Transaction.category) \
+            .where(*filters) \
+            .order_by(Transaction.created.desc(), Transaction.id.desc())
+        if cursor:
+            page = page.where(tuple_(Transaction.created, Transaction.id) <
+                              tuple_(cursor.created, cursor.id))
+        if limit:
+            page = page.limit(limit + 1)
+        page = page.subquery()
+
+        created_date = cast(Transaction.created, Date)
+        total_income = func.sum(
+            case((TransactionCategory.type == TransactionType.INCOME.value,
+                  Transaction.amount), else_=0)
+        ).over(partition_by=created_date)
+        total_expense = func.sum(
+            case((TransactionCategory.type == TransactionType.EXPENSE.value,
+                  Transaction.amount), else_=0)
+        ).over(partition_by=created_date)
+        day_totals = select(Transaction.id,
+                            created_date.label('created_date'),
+                            total_income.label('total_income'),
+                            total_expense.label('total_expense')) \
+            .join(Transaction.category) \
+            .where(*filters,
+                   created_date.in_(select(cast(page.c.created, Date)))) \
+            .subquery()
+
+        stmt = select(Transaction,
+                      day_totals.c.created_date,
+                      day_totals.c.total_income,
+                      day_totals.c.total_expense) \
+            .join(page, page.c.id == Transaction.id) \
+            .join(day_totals, day_totals.c.id == Transaction.id) \
+            .order_by(Transaction.created.desc(), Transaction.id.desc()) \
+            .options(
                 joinedload(Transaction.asset).joinedload(Asset.currency),
                 joinedload(Transaction.category))
-            if transaction_type:
-                stmt = stmt.where(Transaction.category.has(
-                    TransactionCategory.type == transaction_type))
-
-            if asset_id:
-                stmt = stmt.where(Transaction.asset_id == asset_id)
-
-            result = await self.session.execute(stmt)
-            total_expense = Decimal('0')
-            total_income = Decimal('0')
-            local_transactions = []
-            for transaction in result.scalars().all():
-                transaction_dto: dto.Transaction = transaction.to_dto()
-                local_transactions.append(transaction_dto)
-                if transaction_dto.category.type == TransactionType.INCOME:
-                    total_income += transaction_dto.amount
-                elif transaction_dto.category.type == TransactionType.EXPENSE:
-                    total_expense += transaction_dto.amount
-
-            transactions.append(
-                dto.Transactions(
-                    created=created[0],
-                    total_income=total_income,
-                    total_expense=total_expense,
-                    transactions=local_transactions
-                )
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            last_transaction = rows[-1][0]
+            next_cursor = dto.TransactionCursor(
+                created=last_transaction.created,
+                id=last_transaction.id
             )
 
-        return transactions
+        transactions: list[dto.Transactions] = []
+        interned = {}
+        for transaction, created, income, expense in rows:
+            if not transactions or transactions[-1].created != created:
+                transactions.append(
+                    dto.Transactions(
+                        created=created,
+                        total_income=income,
+                        total_expense=expense,
+                        transactions=[]
+                    )
+                )
+            transactions[-1].transactions.append(
+                transaction.to_dto(interned=interned))
 
-    async def get_total_by_period(
-            self,
+        return dto.TransactionsPage(days=transactions, next_cursor=next_cursor)
+
+    @staticmethod
+    def _period_totals(start_date: date, end_date: date):
+        # the rollup holds whole days, so it covers the days before end_date;
+        # transactions stamped exactly at midnight of end_date are added from
+        # the transactions table to keep the created <= end_date bound
+        rollup = select(TransactionDailyTotal.user_id,
+                        TransactionDailyTotal.asset_id,
+                        TransactionDailyTotal.category_id,
+                        TransactionDailyTotal.day,
+                        TransactionDailyTotal.total) \
+            .where(TransactionDailyTotal.day >= start_date,
+                   TransactionDailyTotal.day < end_date)
+        midnight = select(Transaction.user_id,
+                          Transaction.asset_id,
+                          Transaction.category_id,
+                          cast(Transaction.created, Date).label('day'),
+                          Transaction.amount.label('total')) \
+            .where(Transaction.created >= start_date,
+                   Transaction.created == end_date)
+        return union_all(rollup, midnight).subquery('period_totals')
+
+    @staticmethod
+    def _daily_total_by_currency(
             user_dto: dto.User,
             start_date: date,
             end_date: date,
             transaction_type: str,
             asset_id: UUID | None = None
-    ) -> dict[str, Decimal]:
-        stmt = select(Currency.code, Currency.rate_to_base_currency,
-                      func.sum(Transaction.amount).label('total')) \
-            .join(Transaction.asset).join(Transaction.category) \
+    ):
+        totals = TransactionDAO._period_totals(start_date, end_date)
+        stmt = select(Currency.code,
+                      Currency.rate_to_base_currency,
+                      totals.c.day,
+                      func.sum(totals.c.total).label('total')) \
+            .join(Asset, Asset.id == totals.c.asset_id) \
+            .join(TransactionCategory,
+                  TransactionCategory.id == totals.c.category_id) \
             .join(Asset.currency) \
-            .group_by(Currency.id, Currency.code) \
-            .filter(Transaction.created >= start_date,
-                    Transaction.created <= end_date) \
-            .where(Transaction.category.has(TransactionCategory.type ==
-                                            transaction_type),
-                   Transaction.user_id == user_dto.id)
+            .group_by(Currency.code, Currency.rate_to_base_currency,
+                      totals.c.day) \
+            .where(TransactionCategory.type == transaction_type,
+                   totals.c.user_id == user_dto.id)
         if asset_id:
-            stmt = stmt.where(Transaction.asset_id == asset_id)
+            stmt = stmt.where(totals.c.asset_id == asset_id)
+        return stmt
+
+    async def get_daily_total_by_period(
+            self,
+            user_dto: dto.User,
+            start_date: date,
+            end_date: date,
+            transaction_type: str,
+            asset_id: UUID | None = None
+    ) -> list[tuple[str, Decimal | None, date, Decimal]]:
+        result = await self.session.execute(self._daily_total_by_currency(
+            user_dto, start_date, end_date, transaction_type, asset_id))
+        return [tuple(row) for row in result.all()]
+
+    async def get_total_by_period_at_daily_rates(
+            self,
+            user_dto: dto.User,
+            start_date: date,
+            end_date: date,
+            transaction_type: str,
+            base_currency_code: str,
+            asset_id: UUID | None = None
+    ) -> dict[str, tuple[Decimal, Decimal]]:
+        daily = self._daily_total_by_currency(
+            user_dto, start_date, end_date, transaction_type, asset_id
+        ).subquery()
+
+        direct = CurrencyPriceHistory.base == base_currency_code
+        rate_on_day = select(
+            case((direct, CurrencyPriceHistory.price),
+                 else_=1 / func.nullif(CurrencyPriceHistory.price, 0))
+        ).where(
+            or_(and_(direct, CurrencyPriceHistory.quote == daily.c.code),
+                and_(CurrencyPriceHistory.base == daily.c.code,
+                     CurrencyPriceHistory.quote == base_currency_code)),
+            CurrencyPriceHistory.day <= daily.c.day
+        ).order_by(CurrencyPriceHistory.day.desc(), direct.desc()) \
+            .limit(1) \
+            .scalar_subquery()
+        rate = func.coalesce(
+            daily.c.rate_to_base_currency,
+            case((daily.c.code == base_currency_code, literal(1)),
+                 else_=rate_on_day)
+        )
+        rated = select(daily.c.code, daily.c.total,
+                       func.nullif(rate, 0).label('rate')).subquery()
+        stmt = select(
+            rated.c.code,
+            func.coalesce(func.sum(rated.c.total / rated.c.rate), 0),
+            func.sum(case((rated.c.rate.is_(None), rated.c.total), else_=0))
+        ).group_by(rated.c.code)
 
         result = await self.session.execute(stmt)
-        result = result.fetchall()
-        return {currency[0]: (currency[1], currency[2]) for currency in result}
+        return {code: (converted, unconverted)
+                for code, converted, unconverted in result.all()}
 
     async def get_total_categories_by_period(
             self,
@@ -124,22 +225,22 @@ class TransactionDAO(BaseDAO[Transaction]):
             end_date: date,
             transaction_type: str
     ) -> list[dto.TotalByCategoryAndCurrency]:
+        totals = self._period_totals(start_date, end_date)
         stmt = select(TransactionCategory.title,
                       TransactionCategory.type,
                       Currency.code,
                       Currency.rate_to_base_currency,
-                      func.sum(Transaction.amount).label('total')) \
-            .join(Transaction.asset).join(Transaction.category) \
+                      func.sum(totals.c.total).label('total')) \
+            .join(Asset, Asset.id == totals.c.asset_id) \
+            .join(TransactionCategory,
+                  TransactionCategory.id == totals.c.category_id) \
             .join(Asset.currency) \
             .group_by(Currency.id,
                       TransactionCategory.title,
                       TransactionCategory.type,
                       Currency.code) \
-            .filter(Transaction.created >= start_date,
-                    Transaction.created <= end_date) \
-            .where(Transaction.category.has(TransactionCategory.type ==
-                                            transaction_type),
-                   Transaction.user_id == user_dto.id)
+            .where(TransactionCategory.type == transaction_type,
+                   totals.c.user_id == user_dto.id)
         result = await self.session.execute(stmt)
         result = result.fetchall()
         return [dto.TotalByCategoryAndCurrency(
@@ -159,13 +260,27 @@ class TransactionDAO(BaseDAO[Transaction]):
         else:
             return transaction.to_dto(with_asset=False, with_category=False)
 
+    async def copy_many(self, transactions_dto: list[dto.Transaction]):
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Transaction.__tablename__,
+            columns=['user_id', 'asset_id', 'category_id', 'amount',
+                     'created'],
+            records=[(transaction.user_id, transaction.asset_id,
+                      transaction.category_id, transaction.amount,
+                      transaction.created)
+                     for transaction in transactions_dto]
+        )
+
     async def merge(self, transaction_dto: dto.Transaction) -> dto.Transaction:
         try:
             transaction = await self._merge(transaction_dto)
         except MergeModelError as e:
             raise MergeTransactionError from e
-        else:
-            return transaction.to_dto(with_asset=False, with_category=False)
+        if transaction is None:
+            raise TransactionNotFound
+        return transaction.to_dto(with_asset=False, with_category=False)
 
     async def delete_by_id(
             self,
@@ -183,12 +298,13 @@ class TransactionDAO(BaseDAO[Transaction]):
 
     async def get_totals_by_asset(self, asset_id: UUID, start_date: date,
                                   end_date: date) -> dto.TotalsByAsset:
-        stmt = select(TransactionCategory.type, func.sum(Transaction.amount)) \
-            .join(Transaction.category) \
-            .where(Transaction.asset_id == asset_id) \
-            .group_by(TransactionCategory.type) \
-            .filter(Transaction.created >= start_date,
-                    Transaction.created <= end_date)
+        totals = self._period_totals(start_date, end_date)
+        stmt = select(TransactionCategory.type,
+                      func.sum(totals.c.total)) \
+            .join(TransactionCategory,
+                  TransactionCategory.id == totals.c.category_id) \
+            .where(totals.c.asset_id == asset_id) \
+            .group_by(TransactionCategory.type)
         result = await self.session.execute(stmt)
         totals = {'income': Decimal('0'), 'expense': Decimal('0')}
         totals |= {cat_type: amount for cat_type, amount in result.fetchall()}
@@ -50,6 +50,18 @@ class TransactionCategoryDAO(BaseDAO[TransactionCategory]):
         return [transaction_category.to_dto() for transaction_category in
                 result.scalars().all()]
 
+    async def get_owned_types(self, category_ids: set[int], user_id: UUID) \
+            -> dict[int, TransactionType]:
+        result = await self.session.execute(
+            select(TransactionCategory.id, TransactionCategory.type).where(
+                TransactionCategory.id.in_(category_ids),
+                TransactionCategory.user_id == user_id,
+                TransactionCategory.deleted.is_(False)
+            )
+        )
+        return {category_id: TransactionType(category_type)
+                for category_id, category_type in result.all()}
+
     async def create(self, transaction_category_dto: dto.TransactionCategory) \
             -> dto.TransactionCategory:
         try:
@@ -62,11 +74,23 @@ class TransactionCategoryDAO(BaseDAO[TransactionCategory]):
     async def merge(self, category_dto: dto.TransactionCategory) \
             -> dto.TransactionCategory:
         try:
-            category = await self._merge(category_dto)
+            category = await self._merge(
+                category_dto, TransactionCategory.deleted.is_(False))
         except MergeModelError as e:
             raise TransactionCategoryExists from e
-        else:
-            return category.to_dto()
+        if category is None:
+            raise TransactionCategoryNotFound
+        return category.to_dto()
+
+    async def soft_delete(self, category_id: int, user_id: UUID):
+        stmt = update(TransactionCategory) \
+            .where(TransactionCategory.id == category_id,
+                   TransactionCategory.user_id == user_id) \
+            .values(deleted=True) \
+            .returning(TransactionCategory.id)
+        result = await self.session.execute(stmt)
+        if result.scalar() is None:
+            raise TransactionCategoryNotFound
 
     async def delete_by_id(self, category_id: int, user_id: UUID) -> int:
         stmt = delete(TransactionCategory) \
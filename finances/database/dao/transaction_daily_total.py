@@ -0,0 +1,98 @@
+from sqlalchemy import select, delete, func, cast, Date
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from finances.database.dao import BaseDAO
+from finances.database.models import TransactionDailyTotal, Transaction
+from finances.models import dto
+
+# 6 bind parameters per row, asyncpg allows at most 32767 per statement
+UPSERT_CHUNK_SIZE = 1000
+
+
+class TransactionDailyTotalDAO(BaseDAO[TransactionDailyTotal]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(TransactionDailyTotal, session)
+
+    async def add_transaction(self, transaction_dto: dto.Transaction):
+        await self._apply(transaction_dto, 1)
+
+    async def remove_transaction(self, transaction_dto: dto.Transaction):
+        await self._apply(transaction_dto, -1)
+
+    async def add_transactions(self,
+                               transactions_dto: list[dto.Transaction]):
+        totals = {}
+        for transaction in transactions_dto:
+            key = (transaction.user_id, transaction.created.date(),
+                   transaction.asset_id, transaction.category_id)
+            total, count = totals.get(key, (0, 0))
+            totals[key] = (total + transaction.amount, count + 1)
+
+        rows = [
+            {
+                'user_id': user_id,
+                'day': day,
+                'asset_id': asset_id,
+                'category_id': category_id,
+                'total': total,
+                'count': count
+            }
+            for (user_id, day, asset_id, category_id), (total, count)
+            in totals.items()
+        ]
+        for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            await self._upsert(rows[i:i + UPSERT_CHUNK_SIZE])
+
+    async def _apply(self, transaction_dto: dto.Transaction, sign: int):
+        await self._upsert([{
+            'user_id': transaction_dto.user_id,
+            'day': transaction_dto.created.date(),
+            'asset_id': transaction_dto.asset_id,
+            'category_id': transaction_dto.category_id,
+            'total': transaction_dto.amount * sign,
+            'count': sign
+        }])
+
+    async def _upsert(self, totals: list[dict]):
+        stmt = insert(TransactionDailyTotal).values(totals)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                TransactionDailyTotal.user_id,
+                TransactionDailyTotal.day,
+                TransactionDailyTotal.asset_id,
+                TransactionDailyTotal.category_id
+            ],
+            set_={
+                'total': TransactionDailyTotal.total + stmt.excluded.total,
+                'count': TransactionDailyTotal.count + stmt.excluded.count
+            }
+        )
+        await self.session.execute(stmt)
+
+    async def compact(self) -> int:
+        result = await self.session.execute(
+            delete(TransactionDailyTotal)
+            .where(TransactionDailyTotal.count == 0)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def rebuild(self):
+        await self.session.execute(delete(TransactionDailyTotal))
+        created_date = cast(Transaction.created, Date)
+        await self.session.execute(
+            insert(TransactionDailyTotal).from_select(
+                ['user_id', 'day', 'asset_id', 'category_id', 'total',
+                 'count'],
+                select(Transaction.user_id,
+                       created_date,
+                       Transaction.asset_id,
+                       Transaction.category_id,
+                       func.sum(Transaction.amount),
+                       func.count()).group_by(Transaction.user_id,
+                                              created_date,
+                                              Transaction.asset_id,
+                                              Transaction.category_id)
+            )
+        )
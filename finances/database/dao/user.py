@@ -1,3 +1,4 @@
+from functools import partial
 from uuid import UUID
 
 from sqlalchemy import select, delete
@@ -6,14 +7,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from finances.database.dao.base import BaseDAO
+from finances.database.dao.on_commit import call_on_commit
+from finances.database.dao.user_configuration_cache import \
+    UserConfigurationCache
 from finances.database.models import User, UserConfiguration
 from finances.exceptions.user import UserExists, UserNotFound
+from finances.interfaces.user_cache import UserCacheProtocol
 from finances.models import dto
 
 
 class UserDAO(BaseDAO[User]):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession,
+                 configuration_cache: UserConfigurationCache | None = None,
+                 user_cache: UserCacheProtocol | None = None):
         super().__init__(User, session)
+        self.configuration_cache = configuration_cache
+        self.user_cache = user_cache
 
     async def get_by_username(self, username: str) -> dto.User:
         user = await self._get_by_username(username)
@@ -50,37 +59,71 @@ class UserDAO(BaseDAO[User]):
     async def set_username(self, user: dto.User, username: str):
         db_user = await self._get_by_id(user.id)
         db_user.username = username
+        self.forget_user_on_commit(user.id)
 
     async def set_password(self, user: dto.User, hashed_password: str):
         db_user = await self._get_by_id(user.id)
         db_user.password = hashed_password
+        self.forget_user_on_commit(user.id)
+
+    def forget_user_on_commit(self, user_id: UUID):
+        if self.user_cache is not None:
+            call_on_commit(self.session,
+                           partial(self.user_cache.invalidate_user_id,
+                                   user_id))
+
+    async def get_configuration(self, user: dto.User) \
+            -> dto.UserConfiguration:
+        if self.configuration_cache is not None:
+            config_dto = self.configuration_cache.get(user.id)
+            if config_dto is not None:
+                return config_dto
+
+        config = await self.session.get(
+            UserConfiguration,
+            user.id,
+            options=[joinedload(UserConfiguration.base_currency),
+                     joinedload(UserConfiguration.base_crypto_portfolio)]
+        )
+        config_dto = config.to_dto() if config else \
+            dto.UserConfiguration(id=user.id)
+        if self.configuration_cache is not None and \
+                config not in self.session.dirty:
+            self.configuration_cache.set(user.id, config_dto)
+        return config_dto
+
+    def invalidate_configuration(self, user_id: UUID):
+        if self.configuration_cache is not None:
+            self.configuration_cache.invalidate(user_id)
+
+    def invalidate_configuration_on_commit(self, user_id: UUID):
+        if self.configuration_cache is not None:
+            self.configuration_cache.invalidate_on_commit(self.session,
+                                                          user_id)
 
     async def get_base_currency(self, user: dto.User) -> dto.Currency | None:
-        config = await self.session.get(UserConfiguration, user.id,
-                                        options=[joinedload(
-                                            UserConfiguration.base_currency)])
-        return config.base_currency.to_dto() if config.base_currency else None
+        config = await self.get_configuration(user)
+        return config.base_currency
 
     async def set_base_currency(self, user: dto.User, currency_id: int):
         config = await self.session.get(UserConfiguration, user.id)
         config.base_currency_id = currency_id
         await self.session.merge(config)
+        self.invalidate_configuration_on_commit(user.id)
 
     async def get_base_crypto_portfolio(self, user: dto.User) \
             -> dto.CryptoPortfolio | None:
-        config = await self.session.get(
-            UserConfiguration,
-            user.id,
-            options=[joinedload(
-                UserConfiguration.base_crypto_portfolio)])
-        return config.base_crypto_portfolio.to_dto() if \
-            config.base_crypto_portfolio else None
+        config = await self.get_configuration(user)
+        return config.base_crypto_portfolio
 
     async def set_base_crypto_portfolio(self, user: dto.User,
                                         portfolio_id: UUID):
         config = await self.session.get(UserConfiguration, user.id)
         config.base_crypto_portfolio_id = portfolio_id
         await self.session.merge(config)
+        self.invalidate_configuration_on_commit(user.id)
 
     async def delete_by_id(self, id_: UUID):
         await self.session.execute(delete(User).where(User.id == id_))
+        self.invalidate_configuration_on_commit(id_)
+        self.forget_user_on_commit(id_)
@@ -0,0 +1,44 @@
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import partial
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from finances.database.dao.on_commit import call_on_commit
+from finances.models import dto
+
+
+class UserConfigurationCache:
+    def __init__(self, maxsize: int = 10000,
+                 ttl: timedelta = timedelta(minutes=10)):
+        self._maxsize = maxsize
+        self._ttl = ttl.total_seconds()
+        self._configs: OrderedDict[
+            UUID, tuple[dto.UserConfiguration, float]] = OrderedDict()
+
+    def get(self, user_id: UUID) -> dto.UserConfiguration | None:
+        cached = self._configs.get(user_id)
+        if cached is None:
+            return None
+        config, expires = cached
+        if time.monotonic() >= expires:
+            del self._configs[user_id]
+            return None
+        self._configs.move_to_end(user_id)
+        return config
+
+    def set(self, user_id: UUID, config: dto.UserConfiguration):
+        self._configs[user_id] = (config, time.monotonic() + self._ttl)
+        self._configs.move_to_end(user_id)
+        while len(self._configs) > self._maxsize:
+            self._configs.popitem(last=False)
+
+    def invalidate(self, user_id: UUID):
+        self._configs.pop(user_id, None)
+
+    def invalidate_on_commit(self, session: AsyncSession, user_id: UUID):
+        # a concurrent read between an early invalidate and the commit would
+        # cache the old row again, so only drop it once the commit succeeded
+        call_on_commit(session, partial(self.invalidate, user_id))
@@ -0,0 +1,123 @@
+import logging
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from finances.models.dto import DatabaseConfig
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    slow_checkouts: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def avg_wait(self) -> float | None:
+        return self.total_wait / self.checkouts if self.checkouts else None
+
+
+class PoolMetrics:
+    def __init__(self, slow_checkout: float = 0.1):
+        self.slow_checkout = slow_checkout
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow_checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, pool: AsyncAdaptedQueuePool, wait: float,
+               timed_out: bool):
+        if timed_out:
+            self.timeouts += 1
+            logging.error(
+                f'[PoolMetrics] checkout timed out after {wait:.3f} s, '
+                f'{pool.checkedout()} connections checked out, '
+                f'{self.timeouts} timeouts so far')
+            return
+
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if wait >= self.slow_checkout:
+            self.slow_checkouts += 1
+            logging.warning(
+                f'[PoolMetrics] checkout waited {wait * 1000:.1f} ms, '
+                f'{pool.checkedout()} connections checked out')
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, metrics: PoolMetrics | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or PoolMetrics()
+
+    def recreate(self) -> 'MeteredQueuePool':
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            checkouts=self.metrics.checkouts,
+            timeouts=self.metrics.timeouts,
+            slow_checkouts=self.metrics.slow_checkouts,
+            total_wait=self.metrics.total_wait,
+            max_wait=self.metrics.max_wait
+        )
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(self, time.perf_counter() - start, True)
+            raise
+        self.metrics.record(self, time.perf_counter() - start, False)
+        return connection
+
+
+def create_engine(config: DatabaseConfig, url: str | None = None,
+                  **kwargs) -> AsyncEngine:
+    connect_args = {
+        'prepared_statement_cache_size':
+            config.prepared_statement_cache_size,
+    }
+    if config.statement_timeout is not None:
+        connect_args['server_settings'] = {
+            'statement_timeout':
+                str(int(config.statement_timeout.total_seconds() * 1000))
+        }
+
+    engine = create_async_engine(
+        url=url or config.make_url,
+        poolclass=MeteredQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout.total_seconds(),
+        pool_recycle=int(config.pool_recycle.total_seconds())
+        if config.pool_recycle is not None else -1,
+        pool_pre_ping=config.pool_pre_ping,
+        connect_args=connect_args,
+        **kwargs
+    )
+    engine.pool.metrics.slow_checkout = \
+        config.pool_slow_checkout.total_seconds()
+    return engine
+
+
+def create_replica_engines(config: DatabaseConfig) -> list[AsyncEngine]:
+    return [
+        create_engine(config, url).execution_options(postgresql_readonly=True)
+        for url in config.replica_urls
+    ]
@@ -27,6 +27,15 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 # from myapp import mymodel
 target_metadata = Base.metadata
+partitioned_tables = [table.name for table in Base.metadata.sorted_tables
+                      if table.dialect_options['postgresql']['partition_by']]
+
+
+def include_object(object_, name, type_, reflected, compare_to):
+    # partitions are created at runtime and are not part of the metadata
+    return not (type_ == 'table' and reflected and compare_to is None and
+                any(name.startswith(f'{table}_')
+                    for table in partitioned_tables))
 
 
 # other values from the config, defined by the needs of env.py,
@@ -54,7 +63,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
-        compare_type=True
+        compare_type=True,
+        include_object=include_object
     )
 
     with context.begin_transaction():
@@ -77,7 +87,7 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection, target_metadata=target_metadata,
-            compare_type=True
+            compare_type=True, include_object=include_object
         )
 
         with context.begin_transaction():
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import uuid
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional
 
 from sqlalchemy import String, Integer, ForeignKey, Numeric, Boolean, \
-    BigInteger, DateTime, UniqueConstraint, func
+    BigInteger, DateTime, UniqueConstraint, func, Date, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, mapped_column, Mapped, relationship
 
@@ -17,6 +17,19 @@ from finances.models.enums.transaction_type import TransactionType, \
 from finances.models.enums.user_type import UserType
 
 
+DTOCache = dict[tuple[type, object], DTOProtocol]
+
+
+def to_interned_dto(obj: Base, cache: DTOCache | None, **kwargs):
+    if cache is None:
+        return obj.to_dto(**kwargs)
+    key = (type(obj), obj.id)
+    dto_obj = cache.get(key)
+    if dto_obj is None:
+        dto_obj = cache[key] = obj.to_dto(**kwargs)
+    return dto_obj
+
+
 class Base(DeclarativeBase):
     def to_dto(self) -> DTOProtocol:
         raise NotImplementedError
@@ -78,8 +91,14 @@ class UserConfiguration(Base):
     base_currency: Mapped['Currency'] = relationship()
     base_crypto_portfolio: Mapped['CryptoPortfolio'] = relationship()
 
-    def to_dto(self) -> DTOProtocol:
-        pass
+    def to_dto(self) -> dto.UserConfiguration:
+        return dto.UserConfiguration(
+            id=self.id,
+            base_currency=self.base_currency.to_dto()
+            if self.base_currency else None,
+            base_crypto_portfolio=self.base_crypto_portfolio.to_dto()
+            if self.base_crypto_portfolio else None
+        )
 
     @classmethod
     def from_dto(cls, dto_object: DTOProtocol):
@@ -110,7 +129,8 @@ class Asset(Base):
         UniqueConstraint('user_id', 'title', name='unique_asset'),
     )
 
-    def to_dto(self, with_currency: bool = True) -> dto.Asset:
+    def to_dto(self, with_currency: bool = True,
+               interned: DTOCache | None = None) -> dto.Asset:
         return dto.Asset(
             id=self.id,
             user_id=self.user_id,
@@ -118,7 +138,7 @@ class Asset(Base):
             currency_id=self.currency_id,
             amount=self.amount,
             deleted=self.deleted,
-            currency=self.currency.to_dto()
+            currency=to_interned_dto(self.currency, interned)
             if with_currency and self.currency_id else None,
         )
 
@@ -197,6 +217,20 @@ class CurrencyPrice(Base):
         )
 
 
+class CurrencyPriceHistory(Base):
+    __tablename__ = 'currency_price_history'
+
+    base: Mapped[str] = mapped_column(String, primary_key=True)
+    quote: Mapped[str] = mapped_column(String, primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    price: Mapped[Decimal] = mapped_column(Numeric, nullable=False)
+
+    __table_args__ = (
+        Index('ix_currency_price_history_quote_day', 'quote', 'day'),
+        {'postgresql_partition_by': 'RANGE (day)'}
+    )
+
+
 class Transaction(Base):
     __tablename__ = 'transactions'
 
@@ -220,8 +254,14 @@ class Transaction(Base):
     asset: Mapped['Asset'] = relationship()
     category: Mapped['TransactionCategory'] = relationship()
 
+    __table_args__ = (
+        Index('ix_transactions_user_id_created', 'user_id', 'created', 'id'),
+        Index('ix_transactions_asset_id_created', 'asset_id', 'created'),
+    )
+
     def to_dto(self, with_asset: bool = True,
-               with_category: bool = True) -> dto.Transaction:
+               with_category: bool = True,
+               interned: DTOCache | None = None) -> dto.Transaction:
         return dto.Transaction(
             id=self.id,
             user_id=self.user_id,
@@ -229,9 +269,9 @@ class Transaction(Base):
             category_id=self.category_id,
             amount=self.amount,
             created=self.created,
-            asset=self.asset.to_dto()
+            asset=to_interned_dto(self.asset, interned, interned=interned)
             if with_asset and self.asset_id else None,
-            category=self.category.to_dto()
+            category=to_interned_dto(self.category, interned)
             if with_category and self.category_id else None
         )
 
@@ -247,6 +287,34 @@ class Transaction(Base):
         )
 
 
+class TransactionDailyTotal(Base):
+    __tablename__ = 'transaction_daily_totals'
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True),
+                                               ForeignKey('users.id',
+                                                          ondelete='CASCADE'),
+                                               primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    asset_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True),
+                                                ForeignKey('assets.id',
+                                                           ondelete='CASCADE'),
+                                                primary_key=True)
+    category_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('transaction_categories.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    total: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=0)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    asset: Mapped['Asset'] = relationship()
+    category: Mapped['TransactionCategory'] = relationship()
+
+    __table_args__ = (
+        Index('ix_transaction_daily_totals_asset_id_day', 'asset_id', 'day'),
+    )
+
+
 class TransactionCategory(Base):
     __tablename__ = 'transaction_categories'
 
@@ -339,12 +407,18 @@ class CryptoAsset(Base):
         nullable=False
     )
     amount: Mapped[Decimal] = mapped_column(Numeric, default=0, nullable=False)
+    total_amount: Mapped[Decimal] = mapped_column(
+        Numeric, default=0, server_default='0', nullable=False)
+    total_cost: Mapped[Decimal] = mapped_column(
+        Numeric, default=0, server_default='0', nullable=False)
 
     crypto_currency: Mapped['CryptoCurrency'] = relationship()
 
     __table_args__ = (
         UniqueConstraint('user_id', 'portfolio_id', 'crypto_currency_id',
                          name='u_crypto_asset1'),
+        Index('ix_crypto_assets_portfolio_id_crypto_currency_id',
+              'portfolio_id', 'crypto_currency_id'),
     )
 
     def to_dto(self, with_currency: bool = True) -> dto.CryptoAsset:
@@ -355,7 +429,9 @@ class CryptoAsset(Base):
             crypto_currency_id=self.crypto_currency_id,
             amount=self.amount,
             crypto_currency=self.crypto_currency.to_dto()
-            if with_currency and self.crypto_currency_id else None
+            if with_currency and self.crypto_currency_id else None,
+            total_amount=self.total_amount,
+            total_cost=self.total_cost
         )
 
     @classmethod
@@ -414,6 +490,12 @@ class CryptoTransaction(Base):
     price: Mapped[Decimal] = mapped_column(Numeric, nullable=False)
     created: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
+    __table_args__ = (
+        Index('ix_crypto_transactions_crypto_asset_id_user_id_created',
+              'crypto_asset_id', 'user_id', 'created', 'id',
+              postgresql_include=['type', 'amount', 'price']),
+    )
+
     def to_dto(self) -> dto.CryptoTransaction:
         return dto.CryptoTransaction(
             id=self.id,
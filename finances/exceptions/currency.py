@@ -19,3 +19,8 @@ class CurrencyExists(CurrencyException):
 class CurrencyCantBeBase(CurrencyException):
     def __init__(self):
         super().__init__('Currency cannot be base')
+
+
+class CurrencyRateNotFound(CurrencyException):
+    def __init__(self, code: str):
+        super().__init__(f'Exchange rate for {code} not found')
@@ -39,3 +39,13 @@ class TransactionCantBeChanged(TransactionException):
 class TransactionCantBeDeleted(TransactionException):
     def __init__(self):
         super().__init__('Transaction cannot be deleted')
+
+
+class InvalidTransactionCursor(TransactionException):
+    def __init__(self):
+        super().__init__('Invalid transaction cursor')
+
+
+class InvalidTransactionsImport(TransactionException):
+    def __init__(self, msg: str = 'Invalid transactions import'):
+        super().__init__(msg)
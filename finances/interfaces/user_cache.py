@@ -0,0 +1,7 @@
+from typing import Protocol
+from uuid import UUID
+
+
+class UserCacheProtocol(Protocol):
+    def invalidate_user_id(self, user_id: UUID):
+        pass
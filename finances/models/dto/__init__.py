@@ -3,11 +3,12 @@ from .config import Config, AuthConfig, DatabaseConfig
 from .currency import Currency, CurrencyPrice
 from .asset import Asset
 from .transaction_category import TransactionCategory
-from .transaction import Transaction
+from .transaction import Transaction, TransactionCursor
 from .crypto_portfolio import CryptoPortfolio
 from .crypto_currency import CryptoCurrency, CryptoCurrencyPrice
 from .crypto_asset import CryptoAsset
 from .crypto_transaction import CryptoTransaction
+from .user_configuration import UserConfiguration
 from .total_results import TotalByCategoryAndCurrency, TotalByCategory, \
-    Transactions, TotalsByAsset, TotalCategories, TotalByPortfolio, \
-    TotalBuyCryptoAsset
+    Transactions, TransactionsPage, TotalsByAsset, TotalCategories, \
+    TotalByPortfolio, TotalBuyCryptoAsset, CryptoAssetTotals, Dashboard
@@ -6,7 +6,7 @@ from uuid import UUID
 from .currency import Currency
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     id: UUID | None
     user_id: UUID | None
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 
 
@@ -10,6 +10,16 @@ class DatabaseConfig:
     database: str
     RDBMS: str = 'postgresql'
     driver: str = 'asyncpg'
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: timedelta = timedelta(seconds=30)
+    pool_recycle: timedelta | None = None
+    pool_pre_ping: bool = False
+    pool_slow_checkout: timedelta = timedelta(milliseconds=100)
+    prepared_statement_cache_size: int = 100
+    statement_timeout: timedelta | None = None
+    replica_urls: list[str] = field(default_factory=list)
+    replica_sticky: timedelta = timedelta(seconds=5)
 
     @property
     def make_url(self):
@@ -21,6 +31,10 @@ class DatabaseConfig:
 class AuthConfig:
     secret_key: str
     token_expire: timedelta
+    hash_workers: int = 4
+    hash_queue_size: int = 32
+    user_cache_size: int = 10000
+    user_cache_ttl: timedelta = timedelta(minutes=1)
 
 
 @dataclass
@@ -28,3 +42,6 @@ class Config:
     db: DatabaseConfig
     auth: AuthConfig
     fcsapi_access_key: str
+    crypto_prices_ttl: timedelta = timedelta(seconds=10)
+    crypto_prices_poll_interval: timedelta = timedelta(seconds=5)
+    rollup_compaction_interval: timedelta = timedelta(hours=1)
@@ -6,7 +6,7 @@ from uuid import UUID
 from .crypto_currency import CryptoCurrency
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptoAsset:
     id: int | None
     user_id: UUID | None
@@ -15,6 +15,8 @@ class CryptoAsset:
     amount: Decimal | None
 
     crypto_currency: CryptoCurrency | None = None
+    total_amount: Decimal | None = None
+    total_cost: Decimal | None = None
 
     @classmethod
     def from_dict(cls, dct: dict) -> CryptoAsset:
@@ -3,7 +3,7 @@ from decimal import Decimal
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptoCurrency:
     id: int | None
     name: str
@@ -13,7 +13,7 @@ class CryptoCurrency:
         return dataclasses.asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptoCurrencyPrice:
     code: str
     price: Decimal
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptoPortfolio:
     id: UUID | None
     title: str | None
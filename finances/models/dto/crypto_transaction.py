@@ -7,7 +7,7 @@ from uuid import UUID
 from finances.models.enums.transaction_type import CryptoTransactionType
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptoTransaction:
     id: int | None
     user_id: UUID | None
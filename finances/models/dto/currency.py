@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Currency:
     id: int | None
     name: str | None
@@ -27,7 +27,7 @@ class Currency:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrencyPrice:
     base: str
     quote: str
@@ -1,11 +1,12 @@
 from decimal import Decimal
 from dataclasses import dataclass
 from datetime import date
+from uuid import UUID
 
-from .transaction import Transaction
+from .transaction import Transaction, TransactionCursor
 
 
-@dataclass
+@dataclass(slots=True)
 class TotalByCategoryAndCurrency:
     category: str
     type: str
@@ -14,7 +15,7 @@ class TotalByCategoryAndCurrency:
     total: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class TotalByCategory:
     category: str
     type: str
@@ -22,13 +23,13 @@ class TotalByCategory:
     percentage: Decimal | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TotalCategories:
     total: Decimal
     categories: list[TotalByCategory]
 
 
-@dataclass
+@dataclass(slots=True)
 class Transactions:
     created: date
     total_income: Decimal
@@ -36,20 +37,53 @@ class Transactions:
     transactions: list[Transaction]
 
 
-@dataclass
+@dataclass(slots=True)
+class TransactionsPage:
+    days: list[Transactions]
+    next_cursor: TransactionCursor | None = None
+
+
+@dataclass(slots=True)
 class TotalsByAsset:
     income: Decimal
     expense: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class TotalBuyCryptoAsset:
     currency_code: str
     total_amount: float
     total_price: float
 
 
-@dataclass
+@dataclass(slots=True)
+class CryptoAssetTotals:
+    crypto_asset_id: int
+    buy_amount: Decimal
+    buy_cost: Decimal
+    sell_amount: Decimal
+    sell_cost: Decimal
+
+    @property
+    def total_amount(self) -> Decimal:
+        return self.buy_amount - self.sell_amount
+
+    @property
+    def total_cost(self) -> Decimal:
+        return self.buy_cost - self.sell_cost
+
+
+@dataclass(slots=True)
 class TotalByPortfolio:
     current_total: float
     totals_buy: list[TotalBuyCryptoAsset]
+
+
+@dataclass(slots=True)
+class Dashboard:
+    total_assets: Decimal
+    total_income: Decimal
+    total_expense: Decimal
+    categories: TotalCategories
+    crypto_portfolio_id: UUID | None = None
+    crypto_portfolio: TotalByPortfolio | None = None
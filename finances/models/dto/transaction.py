@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import base64
 from decimal import Decimal
 from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
+
+from finances.exceptions.transaction import InvalidTransactionCursor
 from .asset import Asset
 from .transaction_category import TransactionCategory
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     id: int | None
     user_id: UUID | None
@@ -29,3 +32,23 @@ class Transaction:
             amount=dct.get('amount'),
             created=dct.get('created')
         )
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionCursor:
+    created: datetime
+    id: int
+
+    def to_token(self) -> str:
+        raw = f'{self.created.isoformat()}|{self.id}'.encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def from_token(cls, token: str) -> TransactionCursor:
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+            created, id_ = raw.decode().split('|')
+            return TransactionCursor(created=datetime.fromisoformat(created),
+                                     id=int(id_))
+        except ValueError as e:
+            raise InvalidTransactionCursor from e
@@ -6,7 +6,7 @@ from uuid import UUID
 from finances.models.enums.transaction_type import TransactionType
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionCategory:
     id: int | None
     title: str | None
@@ -6,7 +6,7 @@ from uuid import UUID
 from finances.models.enums.user_type import UserType
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: UUID | None = None
     username: str | None = None
@@ -29,7 +29,7 @@ class User:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UserWithCreds(User):
     hashed_password: str | None = None
 
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from .crypto_portfolio import CryptoPortfolio
+from .currency import Currency
+
+
+@dataclass(slots=True)
+class UserConfiguration:
+    id: UUID | None
+    base_currency: Currency | None = None
+    base_crypto_portfolio: CryptoPortfolio | None = None
@@ -1,10 +1,13 @@
 from uuid import UUID
 
+from api.v1.dependencies import FXRates
+from api.v1.dependencies.fx_rates import FXRatesSnapshot
 from finances.database.dao import DAO
 from finances.database.dao.asset import AssetDAO
 from finances.database.dao.currency import CurrencyDAO
 from finances.exceptions.asset import AssetNotFound
-from finances.exceptions.currency import CurrencyNotFound
+from finances.exceptions.currency import CurrencyNotFound, \
+    CurrencyRateNotFound
 from finances.models import dto
 
 
@@ -47,10 +50,6 @@ async def change_asset(
     if currency_dto.is_custom and currency_dto.user_id != user.id:
         raise CurrencyNotFound
 
-    asset_dto = await asset_dao.get_by_id(changed_asset_dto.id)
-    if asset_dto.user_id != user.id:
-        raise AssetNotFound
-
     changed_asset_dto.user_id = user.id
     changed_asset = await asset_dao.merge(changed_asset_dto)
     await asset_dao.commit()
@@ -63,19 +62,15 @@ async def delete_asset(
         user: dto.User,
         asset_dao: AssetDAO,
 ):
-    deleted_asset_dto = await asset_dao.get_by_id(asset_id)
-    if deleted_asset_dto.user_id != user.id:
-        raise AssetNotFound
-
-    deleted_asset_dto.deleted = True
-    await asset_dao.merge(deleted_asset_dto)
+    await asset_dao.soft_delete(asset_id, user.id)
     await asset_dao.commit()
 
 
 async def get_total_asset(
         asset_id: UUID,
         user: dto.User,
-        dao: DAO):
+        dao: DAO,
+        fx_rates: FXRates):
     asset_dto = await dao.asset.get_by_id(asset_id)
     if asset_dto is None or asset_dto.user_id != user.id:
         raise AssetNotFound
@@ -84,39 +79,37 @@ async def get_total_asset(
     if asset_dto.currency.is_custom:
         return round(
             asset_dto.amount / asset_dto.currency.rate_to_base_currency, 2)
-    currency_price = await dao.currency_price.get_by_id(
-        getattr(base_currency, 'code', 'USD'),
-        asset_dto.currency.code)
-    return round(asset_dto.amount / currency_price.price, 2)
+    rates = await fx_rates.get_snapshot()
+    rate = rates.get_rate(getattr(base_currency, 'code', 'USD'),
+                          asset_dto.currency.code)
+    if not rate:
+        raise CurrencyRateNotFound(asset_dto.currency.code)
+    return round(asset_dto.amount / rate, 2)
 
 
 async def get_total_assets(
         user: dto.User,
-        dao: DAO
+        dao: DAO,
+        fx_rates: FXRates,
+        rates: FXRatesSnapshot | None = None
 ) -> float:
     assets = await dao.asset.get_all(user)
     if not assets:
         return 0
 
-    currencies_codes = [
-        asset.currency.code for asset in assets if
-        asset.currency and not asset.currency.is_custom
-    ]
     base_currency = await dao.user.get_base_currency(user)
-    prices = await dao.currency_price.get_prices(
-        getattr(base_currency, 'code', 'USD'), currencies_codes)
+    base_currency_code = getattr(base_currency, 'code', 'USD')
+    rates = rates or await fx_rates.get_snapshot()
     amount = 0
     for asset in assets:
         if asset.currency:
             if asset.currency.is_custom:
                 amount += asset.amount / asset.currency.rate_to_base_currency
             else:
-                currency_price = prices.get(asset.currency.code)
-                if currency_price is None:
-                    rate = 1
-                else:
-                    rate = currency_price.price
-
+                rate = rates.get_rate(base_currency_code,
+                                      asset.currency.code)
+                if not rate:
+                    raise CurrencyRateNotFound(asset.currency.code)
                 amount += asset.amount / rate
 
     return round(amount, 2)
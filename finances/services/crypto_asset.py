@@ -35,4 +35,4 @@ async def get_total_buy(
 ) -> dto.TotalBuyCryptoAsset:
     crypto_asset_dto = await get_crypto_asset_by_id(crypto_asset_id, user,
                                                     dao.crypto_asset)
-    return await get_total_buy_by_crypto_asset(crypto_asset_dto, dao)
+    return get_total_buy_by_crypto_asset(crypto_asset_dto)
@@ -5,7 +5,8 @@ from finances.database.dao import DAO, UserDAO
 from finances.database.dao.crypto_portfolio import CryptoPortfolioDAO
 from finances.exceptions.crypto_portfolio import CryptoPortfolioNotFound
 from finances.models import dto
-from finances.services.crypto_transaction import get_total_buy_by_crypto_asset
+from finances.services.crypto_transaction import \
+    get_total_buy_by_portfolio_totals
 
 
 async def get_crypto_portfolio_by_id(
@@ -43,11 +44,6 @@ async def change_crypto_portfolio(
 ) -> dto.CryptoPortfolio:
     changed_crypto_portfolio_dto = dto.CryptoPortfolio.from_dict(
         crypto_portfolio)
-    crypto_portfolio_dto = await crypto_portfolio_dao.get_by_id(
-        changed_crypto_portfolio_dto.id)
-    if crypto_portfolio_dto.user_id != user.id:
-        raise CryptoPortfolioNotFound
-
     changed_crypto_portfolio_dto.user_id = user.id
     changed_crypto_portfolio_dto = await crypto_portfolio_dao.merge(
         changed_crypto_portfolio_dto)
@@ -108,13 +104,15 @@ async def get_total_by_portfolio(
         return dto.TotalByPortfolio(current_total=total, totals_buy=[])
 
     prices = await currency_api.get_crypto_currency_prices(crypto_codes)
+    asset_totals = await dao.crypto_transaction.get_totals_by_portfolio(
+        crypto_portfolio_id, user.id)
 
     totals_buy = []
     for crypto_asset in crypto_assets:
         total += crypto_asset.amount * prices.get(
             crypto_asset.crypto_currency.code + 'USDT', 0)
-        totals_buy.append(
-            await get_total_buy_by_crypto_asset(crypto_asset, dao))
+        totals_buy.append(get_total_buy_by_portfolio_totals(
+            crypto_asset, asset_totals.get(crypto_asset.id)))
 
     total = round(total, 2)
     return dto.TotalByPortfolio(current_total=total, totals_buy=totals_buy)
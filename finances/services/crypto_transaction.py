@@ -4,7 +4,6 @@ from finances.exceptions.crypto_asset import CryptoAssetNotFound
 from finances.exceptions.crypto_portfolio import CryptoPortfolioNotFound
 from finances.exceptions.crypto_transaction import CryptoTransactionNotFound
 from finances.models import dto
-from finances.models.enums.transaction_type import CryptoTransactionType
 
 
 async def get_crypto_transaction_by_id(
@@ -56,16 +55,9 @@ async def add_crypto_transaction(
     crypto_transaction['user_id'] = user.id
     crypto_transaction_dto = dto.CryptoTransaction.from_dict(
         crypto_transaction)
-
-    amount = crypto_transaction['amount']
-    crypto_transaction_type = crypto_transaction['type']
-    if crypto_transaction_type == CryptoTransactionType.BUY:
-        crypto_asset_dto.amount += amount
-    elif crypto_transaction_type == CryptoTransactionType.SELL:
-        crypto_asset_dto.amount -= amount
-    await dao.crypto_asset.merge(crypto_asset_dto)
     crypto_transaction_dto = await dao.crypto_transaction.create(
         crypto_transaction_dto)
+    await dao.crypto_asset.add_transaction(crypto_transaction_dto)
     await dao.commit()
     return crypto_transaction_dto
 
@@ -80,22 +72,10 @@ async def change_crypto_transaction(
     if crypto_transaction_dto.user_id != user.id:
         raise CryptoTransactionNotFound
 
-    crypto_asset_dto = await dao.crypto_asset.get_by_id(
-        crypto_transaction_dto.crypto_asset_id)
-    if crypto_transaction_dto.type == CryptoTransactionType.BUY:
-        crypto_asset_dto.amount -= crypto_transaction_dto.amount
-    elif crypto_transaction_dto.type == CryptoTransactionType.SELL:
-        crypto_asset_dto.amount += crypto_transaction_dto.amount
+    await dao.crypto_asset.remove_transaction(crypto_transaction_dto)
 
     changed_transaction_type = crypto_transaction['type']
     amount = crypto_transaction['amount']
-    if changed_transaction_type == CryptoTransactionType.BUY:
-        crypto_asset_dto.amount += amount
-    elif changed_transaction_type == CryptoTransactionType.SELL:
-        crypto_asset_dto.amount -= amount
-
-    await dao.crypto_asset.merge(crypto_asset_dto)
-
     price = crypto_transaction['price']
     created = crypto_transaction['created']
     crypto_transaction_dto.type = changed_transaction_type
@@ -104,6 +84,7 @@ async def change_crypto_transaction(
     crypto_transaction_dto.created = created
     crypto_transaction_dto = await dao.crypto_transaction.merge(
         crypto_transaction_dto)
+    await dao.crypto_asset.add_transaction(crypto_transaction_dto)
     await dao.commit()
     return crypto_transaction_dto
 
@@ -118,35 +99,29 @@ async def delete_crypto_transaction(
     if crypto_transaction_dto is None:
         raise CryptoTransactionNotFound
 
-    crypto_asset_dto = await dao.crypto_asset.get_by_id(
-        crypto_transaction_dto.crypto_asset_id)
-    if crypto_transaction_dto.type == CryptoTransactionType.BUY:
-        crypto_asset_dto.amount -= crypto_transaction_dto.amount
-    elif crypto_transaction_dto.type == CryptoTransactionType.SELL:
-        crypto_asset_dto.amount += crypto_transaction_dto.amount
-
-    await dao.crypto_asset.merge(crypto_asset_dto)
+    await dao.crypto_asset.remove_transaction(crypto_transaction_dto)
     await dao.commit()
 
 
-async def get_total_buy_by_crypto_asset(
-        crypto_asset_dto: dto.CryptoAsset,
-        dao: DAO
+def get_total_buy_by_crypto_asset(
+        crypto_asset_dto: dto.CryptoAsset
 ) -> dto.TotalBuyCryptoAsset:
-    transactions = await dao.crypto_transaction.get_all_by_crypto_asset(
-        crypto_asset_dto.id, crypto_asset_dto.user_id)
-    total_price = 0
-    total_amount = 0
-    for transaction in transactions:
-        if transaction.type == CryptoTransactionType.BUY:
-            total_price += transaction.amount * transaction.price
-            total_amount += transaction.amount
-        elif transaction.type == CryptoTransactionType.SELL:
-            total_price -= transaction.amount * transaction.price
-            total_amount -= transaction.amount
+    return dto.TotalBuyCryptoAsset(
+        currency_code=crypto_asset_dto.crypto_currency.code,
+        total_amount=crypto_asset_dto.total_amount,
+        total_price=round(crypto_asset_dto.total_cost, 2)
+    )
 
+
+def get_total_buy_by_portfolio_totals(
+        crypto_asset_dto: dto.CryptoAsset,
+        totals: dto.CryptoAssetTotals | None
+) -> dto.TotalBuyCryptoAsset:
+    # an asset without transactions has no row in the grouped totals
+    total_amount, total_cost = (totals.total_amount, totals.total_cost) \
+        if totals is not None else (0, 0)
     return dto.TotalBuyCryptoAsset(
         currency_code=crypto_asset_dto.crypto_currency.code,
         total_amount=total_amount,
-        total_price=round(total_price, 2)
+        total_price=round(total_cost, 2)
     )
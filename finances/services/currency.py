@@ -32,12 +32,8 @@ async def change_currency(
         user: dto.User,
         currency_dao: CurrencyDAO) -> dto.Currency:
     changed_currency_dto = dto.Currency.from_dict(currency)
-    currency_dto = await currency_dao.get_by_id(changed_currency_dto.id)
-    if currency_dto.user_id != user.id:
-        raise CurrencyNotFound
-
     changed_currency_dto.user_id = user.id
-    changed_currency_dto.is_custom = currency_dto.is_custom
+    changed_currency_dto.is_custom = True
     changed_currency_dto = await currency_dao.merge(changed_currency_dto)
     await currency_dao.commit()
     return changed_currency_dto
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from datetime import date
+from typing import AsyncContextManager, Awaitable, Callable, TypeVar
+
+from api.v1.dependencies import CurrencyAPI, FXRates
+from api.v1.dependencies.currency_api import CantGetPrice
+from finances.database.dao import DAO
+from finances.models import dto
+from finances.models.enums.transaction_type import TransactionType
+from finances.services.asset import get_total_assets
+from finances.services.crypto_portfolio import get_total_by_portfolio
+from finances.services.transaction import get_total_categories_by_period, \
+    get_total_transactions_by_period
+
+T = TypeVar('T')
+DAOFactory = Callable[[], AsyncContextManager[DAO]]
+
+# each total holds its own pooled connection, keep the fan-out small
+DASHBOARD_MAX_SESSIONS = 2
+
+
+async def get_dashboard(
+        start_date: date,
+        end_date: date,
+        categories_type: TransactionType,
+        user: dto.User,
+        dao_factory: DAOFactory,
+        fx_rates: FXRates,
+        currency_api: CurrencyAPI
+) -> dto.Dashboard:
+    sessions = asyncio.Semaphore(DASHBOARD_MAX_SESSIONS)
+
+    async def with_dao(service: Callable[[DAO], Awaitable[T]]) -> T:
+        async with sessions, dao_factory() as dao:
+            return await service(dao)
+
+    async def get_crypto_portfolio(dao: DAO) -> dto.TotalByPortfolio | None:
+        try:
+            return await get_total_by_portfolio(crypto_portfolio.id, user,
+                                                dao, currency_api)
+        except CantGetPrice as e:
+            logging.error(f'[get_dashboard] crypto portfolio total: {e!r}')
+            return None
+
+    async with dao_factory() as dao:
+        config = await dao.user.get_configuration(user)
+    crypto_portfolio = config.base_crypto_portfolio
+    rates = await fx_rates.get_snapshot()
+
+    totals = [
+        with_dao(lambda dao: get_total_assets(user, dao, fx_rates, rates)),
+        with_dao(lambda dao: get_total_transactions_by_period(
+            start_date, end_date, TransactionType.INCOME, None, user, dao,
+            fx_rates, rates)),
+        with_dao(lambda dao: get_total_transactions_by_period(
+            start_date, end_date, TransactionType.EXPENSE, None, user, dao,
+            fx_rates, rates)),
+        with_dao(lambda dao: get_total_categories_by_period(
+            start_date, end_date, categories_type, user, dao, fx_rates,
+            rates))
+    ]
+    if crypto_portfolio is not None:
+        totals.append(with_dao(get_crypto_portfolio))
+
+    total_assets, total_income, total_expense, categories, *portfolio = \
+        await asyncio.gather(*totals)
+    return dto.Dashboard(
+        total_assets=total_assets,
+        total_income=total_income,
+        total_expense=total_expense,
+        categories=categories,
+        crypto_portfolio_id=getattr(crypto_portfolio, 'id', None),
+        crypto_portfolio=portfolio[0] if portfolio else None
+    )
@@ -2,10 +2,13 @@ from decimal import Decimal
 from datetime import date
 from uuid import UUID
 
+from api.v1.dependencies import FXRates
+from api.v1.dependencies.fx_rates import FXRatesSnapshot
 from finances.database.dao import DAO
 from finances.database.dao.transaction_category import TransactionCategoryDAO
+from finances.exceptions.currency import CurrencyRateNotFound
 from finances.exceptions.transaction import TransactionCategoryNotFound, \
-    TransactionNotFound, TransactionCantBeChanged
+    TransactionNotFound, TransactionCantBeChanged, InvalidTransactionsImport
 from finances.models import dto
 from finances.models.enums.transaction_type import TransactionType
 
@@ -58,11 +61,6 @@ async def change_transaction_category(
         transaction_category_dao: TransactionCategoryDAO
 ):
     changed_category_dto = dto.TransactionCategory.from_dict(category)
-    category_dto = await transaction_category_dao.get_by_id(
-        changed_category_dto.id)
-    if category_dto is None or category_dto.user_id != user.id:
-        raise TransactionCategoryNotFound
-
     changed_category_dto.user_id = user.id
     changed_category_dto = await transaction_category_dao.merge(
         changed_category_dto)
@@ -75,18 +73,21 @@ async def delete_transaction_category(
         user: dto.User,
         transaction_category_dao: TransactionCategoryDAO
 ):
-    category_dto = await transaction_category_dao.get_by_id(
-        category_id)
-    if category_dto.user_id != user.id:
-        raise TransactionCategoryNotFound
-
-    category_dto.deleted = True
-    await transaction_category_dao.merge(category_dto)
+    await transaction_category_dao.soft_delete(category_id, user.id)
     await transaction_category_dao.commit()
 
 
 # transaction
 
+def get_signed_amount(category_type: TransactionType,
+                      amount: Decimal) -> Decimal:
+    if category_type == TransactionType.INCOME:
+        return amount
+    if category_type == TransactionType.EXPENSE:
+        return -amount
+    return Decimal(0)
+
+
 async def get_transaction_by_id(
         transaction_id: int,
         user: dto.User,
@@ -119,13 +120,12 @@ async def add_transaction(
         created=transaction['created']
     )
     transaction_dto = await dao.transaction.create(transaction_dto)
-
-    if category_dto.type == TransactionType.INCOME:
-        asset_dto.amount += transaction_dto.amount
-    elif category_dto.type == TransactionType.EXPENSE:
-        asset_dto.amount -= transaction_dto.amount
-
-    await dao.asset.merge(asset_dto)
+    await dao.transaction_daily_total.add_transaction(transaction_dto)
+    asset_dto.amount = await dao.asset.update_amount(
+        get_signed_amount(category_dto.type, transaction_dto.amount),
+        asset_dto.id,
+        user.id
+    )
     await dao.commit()
 
     transaction_dto.asset = asset_dto
@@ -136,6 +136,45 @@ async def add_transaction(
     return transaction_dto
 
 
+async def import_transactions(
+        transactions: list[dict],
+        user: dto.User,
+        dao: DAO
+) -> int:
+    if not transactions:
+        raise InvalidTransactionsImport('No transactions to import')
+
+    asset_ids = {transaction['asset_id'] for transaction in transactions}
+    category_ids = {transaction['category_id']
+                    for transaction in transactions}
+    if await dao.asset.get_owned_ids(asset_ids, user.id) != asset_ids:
+        raise AssetNotFound
+    category_types = await dao.transaction_category.get_owned_types(
+        category_ids, user.id)
+    if category_types.keys() != category_ids:
+        raise TransactionCategoryNotFound
+
+    transactions_dto = []
+    amounts = {asset_id: Decimal(0) for asset_id in asset_ids}
+    for transaction in transactions:
+        transactions_dto.append(dto.Transaction(
+            id=None,
+            user_id=user.id,
+            asset_id=transaction['asset_id'],
+            category_id=transaction['category_id'],
+            amount=transaction['amount'],
+            created=transaction['created']
+        ))
+        amounts[transaction['asset_id']] += get_signed_amount(
+            category_types[transaction['category_id']], transaction['amount'])
+
+    await dao.transaction.copy_many(transactions_dto)
+    await dao.transaction_daily_total.add_transactions(transactions_dto)
+    await dao.asset.update_amounts(amounts, user.id)
+    await dao.commit()
+    return len(transactions_dto)
+
+
 async def change_transaction(
         transaction: dict,
         user: dto.User,
@@ -167,37 +206,28 @@ async def change_transaction(
         raise TransactionCantBeChanged(
             'Transaction category cannot be changed')
 
+    old_amount = get_signed_amount(transaction_dto.category.type,
+                                   transaction_dto.amount)
+    new_amount = get_signed_amount(category_dto.type, amount)
     if transaction_dto.asset_id != asset_id:
         asset_dto = await get_asset_by_id(asset_id, user, dao.asset)
-        if transaction_dto.category.type == TransactionType.INCOME:
-            transaction_dto.asset.amount -= transaction_dto.amount
-        elif transaction_dto.category.type == TransactionType.EXPENSE:
-            transaction_dto.asset.amount += transaction_dto.amount
-
-        if category_dto.type == TransactionType.INCOME:
-            asset_dto.amount += amount
-        elif category_dto.type == TransactionType.EXPENSE:
-            asset_dto.amount -= amount
-
-        await dao.asset.merge(transaction_dto.asset)
-        await dao.asset.merge(asset_dto)
+        await dao.asset.update_amount(-old_amount, transaction_dto.asset_id,
+                                      user.id)
+        asset_dto.amount = await dao.asset.update_amount(
+            new_amount, asset_id, user.id)
     else:
         asset_dto = transaction_dto.asset
-        if category_dto.type == TransactionType.INCOME:
-            asset_dto.amount = asset_dto.amount - transaction_dto.amount \
-                               + amount
-        elif category_dto.type == TransactionType.EXPENSE:
-            asset_dto.amount = asset_dto.amount + transaction_dto.amount \
-                               - amount
-
-        await dao.asset.merge(asset_dto)
+        asset_dto.amount = await dao.asset.update_amount(
+            new_amount - old_amount, asset_id, user.id)
 
+    await dao.transaction_daily_total.remove_transaction(transaction_dto)
     transaction_dto.asset_id = asset_id
     transaction_dto.category_id = category_id
     transaction_dto.amount = amount
     transaction_dto.created = created
 
     await dao.transaction.merge(transaction_dto)
+    await dao.transaction_daily_total.add_transaction(transaction_dto)
     await dao.commit()
 
     transaction_dto.asset = asset_dto
@@ -215,15 +245,11 @@ async def delete_transaction(
     if transaction_dto is None:
         raise TransactionNotFound
 
+    await dao.transaction_daily_total.remove_transaction(transaction_dto)
     category = await dao.transaction_category.get_by_id(
         transaction_dto.category_id)
-    transaction_dto.category = category
-    amount = transaction_dto.amount
-    if transaction_dto.category.type == TransactionType.INCOME:
-        amount = -amount
-
     await dao.asset.update_amount(
-        amount,
+        -get_signed_amount(category.type, transaction_dto.amount),
         transaction_dto.asset_id,
         user.id
     )
@@ -236,40 +262,44 @@ async def get_total_transactions_by_period(
         transaction_type: TransactionType,
         asset_id: UUID | None,
         user: dto.User,
-        dao: DAO
+        dao: DAO,
+        fx_rates: FXRates,
+        rates: FXRatesSnapshot | None = None
 ) -> float:
-    currencies_amount = await dao.transaction.get_total_by_period(
-        user,
-        start_date,
-        end_date,
-        transaction_type.value,
-        asset_id
-    )
+    base_currency = await dao.user.get_base_currency(user)
+    base_currency_code = getattr(base_currency, 'code', 'USD')
+    if fx_rates.history.is_recent(start_date, end_date):
+        daily_totals = await dao.transaction.get_daily_total_by_period(
+            user, start_date, end_date, transaction_type.value, asset_id)
+        daily_rates = await fx_rates.history.get_rates(
+            base_currency_code, start_date, end_date)
+        currencies_amount = {}
+        for code, custom_rate, day, amount in daily_totals:
+            rate = custom_rate or (1 if code == base_currency_code else
+                                   daily_rates[day].get(code))
+            converted, unconverted = currencies_amount.get(code, (0, 0))
+            if rate:
+                converted += amount / rate
+            else:
+                unconverted += amount
+            currencies_amount[code] = (converted, unconverted)
+    else:
+        currencies_amount = \
+            await dao.transaction.get_total_by_period_at_daily_rates(
+                user, start_date, end_date, transaction_type.value,
+                base_currency_code, asset_id)
     if not currencies_amount:
         return 0
 
-    base_currency = await dao.user.get_base_currency(user)
-    base_currency_code = getattr(base_currency, 'code', 'USD')
-    currencies_codes = [
-        currency for currency, value in currencies_amount.items()
-        if value[0] is None and currency != base_currency_code
-    ]
-    prices = await dao.currency_price.get_prices(
-        base_currency_code, currencies_codes)
+    rates = rates or await fx_rates.get_snapshot()
     total = 0
-
-    for code, (custom_rate, amount) in currencies_amount.items():
-        if custom_rate is not None:
-            total += amount / custom_rate
-            continue
-
-        currency_price = prices.get(code)
-        if currency_price is None:
-            rate = 1
-        else:
-            rate = currency_price.price
-
-        total += amount / rate
+    for code, (converted, unconverted) in currencies_amount.items():
+        total += converted
+        if unconverted:
+            rate = rates.get_rate(base_currency_code, code)
+            if not rate:
+                raise CurrencyRateNotFound(code)
+            total += unconverted / rate
 
     return round(total, 2)
 
@@ -279,32 +309,29 @@ async def get_total_categories_by_period(
         end_date: date,
         transaction_type: TransactionType,
         user: dto.User,
-        dao: DAO
+        dao: DAO,
+        fx_rates: FXRates,
+        rates: FXRatesSnapshot | None = None
 ) -> dto.TotalCategories:
     totals_cat_and_cur = await dao.transaction.get_total_categories_by_period(
         user, start_date, end_date, transaction_type.value
     )
     if not totals_cat_and_cur:
         return dto.TotalCategories(total=Decimal("0"), categories=[])
-    currencies_codes = [
-        total_cat_and_cur.currency_code for total_cat_and_cur in
-        totals_cat_and_cur if total_cat_and_cur.rate_to_base_currency is None
-    ]
 
     base_currency = await dao.user.get_base_currency(user)
-    prices = await dao.currency_price.get_prices(
-        getattr(base_currency, 'code', 'USD'), currencies_codes)
+    base_currency_code = getattr(base_currency, 'code', 'USD')
+    rates = rates or await fx_rates.get_snapshot()
 
     totals_by_category = {}
     for total_cat_and_cur in totals_cat_and_cur:
         category = totals_by_category.get(total_cat_and_cur.category)
         rate = total_cat_and_cur.rate_to_base_currency
         if rate is None:
-            currency_price = prices.get(total_cat_and_cur.currency_code)
-            if currency_price is None:
-                rate = 1
-            else:
-                rate = currency_price.price
+            rate = rates.get_rate(base_currency_code,
+                                  total_cat_and_cur.currency_code)
+        if not rate:
+            raise CurrencyRateNotFound(total_cat_and_cur.currency_code)
 
         total = total_cat_and_cur.total / rate
         if category is None:
@@ -10,10 +10,10 @@ async def signup(
         auth_provider: AuthProvider,
         dao: DAO
 ):
+    hashed_password = await auth_provider.get_password_hash(user['password'])
     user_dto = await dao.user.create(
         dto.UserWithCreds(username=user['username'],
-                          hashed_password=auth_provider.get_password_hash(
-                              user['password']),
+                          hashed_password=hashed_password,
                           user_type=UserType.USER))
     base_currency = await dao.currency.get_by_code('USD')
     if base_currency:
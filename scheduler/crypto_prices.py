@@ -0,0 +1,19 @@
+import logging
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.v1.dependencies import CachedCurrencyAPI
+from finances.database.dao.crypto_currency import CryptoCurrencyDAO
+
+
+async def poll_crypto_prices_task(currency_api: CachedCurrencyAPI,
+                                  ss: async_sessionmaker):
+    async with ss() as session:
+        crypto_codes = await CryptoCurrencyDAO(session).get_held_codes()
+    if not crypto_codes:
+        return
+
+    try:
+        await currency_api.refresh_prices(crypto_codes)
+    except Exception as e:
+        logging.error(f'[poll_crypto_prices_task] unable to refresh: {e!r}')
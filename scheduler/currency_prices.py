@@ -1,16 +1,24 @@
 import logging
+from datetime import date
 
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from api.v1.dependencies import FXRates
 from finances.database.dao.currency_price import CurrencyPriceDAO
+from finances.database.dao.currency_price_history import \
+    CurrencyPriceHistoryDAO
 from scheduler.fcsapi import FCSClient
 
 
-async def add_prices_task(fcs_client: FCSClient, ss: async_sessionmaker):
+async def add_prices_task(fcs_client: FCSClient, ss: async_sessionmaker,
+                          fx_rates: FXRates):
     currency_prices = await fcs_client.get_all_prices()
     async with ss() as session:
         currency_price_dao = CurrencyPriceDAO(session=session)
         await currency_price_dao.add_many(currency_prices)
+        await CurrencyPriceHistoryDAO(session).add_many(currency_prices,
+                                                        date.today())
         await currency_price_dao.commit()
 
+    await fx_rates.refresh()
     logging.info('CURRENCY PRICES SUCCESSFULLY UPDATED')
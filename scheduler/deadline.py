@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, time as day_time
+from typing import Awaitable, Callable
+
+JobFunc = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    last_duration: float | None = None
+    max_duration: float = 0
+    total_duration: float = 0
+
+    @property
+    def avg_duration(self) -> float | None:
+        return self.total_duration / self.runs if self.runs else None
+
+
+@dataclass
+class Job:
+    name: str
+    func: JobFunc
+    interval: timedelta | None = None
+    at: day_time | None = None
+    jitter: timedelta = timedelta()
+    deadline: float = 0
+    running: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+
+    def next_delay(self) -> float:
+        if self.at is not None:
+            now = datetime.now()
+            next_run = datetime.combine(now.date(), self.at)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            delay = (next_run - now).total_seconds()
+        else:
+            delay = self.interval.total_seconds()
+        return delay + random.uniform(0, self.jitter.total_seconds())
+
+
+class DeadlineScheduler:
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._jobs: list[Job] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+
+    def every(self, name: str, interval: timedelta, func: JobFunc,
+              jitter: timedelta = timedelta(), run_now: bool = False):
+        self._add(Job(name=name, func=func, interval=interval,
+                      jitter=jitter), run_now)
+
+    def daily(self, name: str, at: day_time, func: JobFunc,
+              jitter: timedelta = timedelta(), run_now: bool = False):
+        self._add(Job(name=name, func=func, at=at, jitter=jitter), run_now)
+
+    def _add(self, job: Job, run_now: bool):
+        job.deadline = self._clock() + (0 if run_now else job.next_delay())
+        self._jobs.append(job)
+        self._wakeup.set()
+
+    def stats(self) -> dict[str, JobStats]:
+        return {job.name: replace(job.stats) for job in self._jobs}
+
+    async def _run(self, job: Job):
+        job.running = True
+        start = time.perf_counter()
+        try:
+            await job.func()
+        except Exception as e:
+            job.stats.failures += 1
+            logging.error(f'[DeadlineScheduler] {job.name} failed: {e!r}')
+        finally:
+            duration = time.perf_counter() - start
+            job.running = False
+            job.stats.runs += 1
+            job.stats.last_duration = duration
+            job.stats.max_duration = max(job.stats.max_duration, duration)
+            job.stats.total_duration += duration
+            logging.debug(f'[DeadlineScheduler] {job.name} took '
+                          f'{duration * 1000:.1f} ms')
+
+    def run_pending(self):
+        now = self._clock()
+        for job in self._jobs:
+            if job.deadline > now:
+                continue
+            job.deadline = now + job.next_delay()
+            if job.running:
+                job.stats.skipped += 1
+                logging.warning(f'[DeadlineScheduler] {job.name} is still '
+                                f'running, skipping this run')
+                continue
+            task = asyncio.create_task(self._run(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def run_forever(self):
+        while True:
+            self._wakeup.clear()
+            self.run_pending()
+            timeout = None
+            if self._jobs:
+                timeout = max(0.0, min(job.deadline for job in self._jobs) -
+                              self._clock())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,15 @@
+import logging
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from finances.database.dao.transaction_daily_total import \
+    TransactionDailyTotalDAO
+
+
+async def compact_rollup_task(ss: async_sessionmaker):
+    async with ss() as session:
+        transaction_daily_total_dao = TransactionDailyTotalDAO(session)
+        deleted = await transaction_daily_total_dao.compact()
+        await transaction_daily_total_dao.commit()
+
+    logging.info(f'ROLLUP COMPACTED, {deleted} EMPTY DAYS REMOVED')
@@ -1,25 +1,95 @@
-import asyncio
+import logging
+from datetime import time, timedelta
+from functools import partial
 
-import aioschedule
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from api.v1.dependencies import FXRates, CachedCurrencyAPI
+from api.v1.dependencies.password_hasher import PasswordHasher
+from finances.database.engine import MeteredQueuePool
 from finances.models.dto import Config
+from scheduler.crypto_prices import poll_crypto_prices_task
 from scheduler.currency_prices import add_prices_task
+from scheduler.deadline import DeadlineScheduler
 from scheduler.fcsapi import FCSClient
+from scheduler.rollup import compact_rollup_task
 
+STATS_LOG_INTERVAL = timedelta(minutes=15)
 
-async def scheduler(httpx_client: AsyncClient, ss: async_sessionmaker,
-                    config: Config):
+
+async def log_scheduler_stats(scheduler: DeadlineScheduler):
+    for name, stats in scheduler.stats().items():
+        avg_duration = stats.avg_duration or 0
+        logging.info(
+            f'[DeadlineScheduler] {name}: {stats.runs} runs, '
+            f'{stats.failures} failures, {stats.skipped} skipped, '
+            f'avg {avg_duration * 1000:.1f} ms, '
+            f'max {stats.max_duration * 1000:.1f} ms')
+
+
+async def log_pool_stats(pools: dict[str, MeteredQueuePool]):
+    for name, pool in pools.items():
+        stats = pool.stats()
+        avg_wait = stats.avg_wait or 0
+        logging.info(
+            f'[MeteredQueuePool] {name}: {stats.checked_out}/{stats.size} '
+            f'checked out, {stats.overflow} overflow, '
+            f'{stats.checkouts} checkouts, {stats.timeouts} timeouts, '
+            f'{stats.slow_checkouts} slow, '
+            f'avg wait {avg_wait * 1000:.1f} ms, '
+            f'max wait {stats.max_wait * 1000:.1f} ms')
+
+
+async def log_password_hasher_stats(password_hasher: PasswordHasher):
+    stats = password_hasher.stats()
+    logging.info(
+        f'[PasswordHasher] {stats.pending}/{stats.max_pending} pending, '
+        f'peak {stats.peak_pending}, {stats.completed} completed, '
+        f'{stats.rejected} rejected, {stats.workers} workers')
+
+
+async def log_stats(scheduler: DeadlineScheduler,
+                    pools: dict[str, MeteredQueuePool],
+                    password_hasher: PasswordHasher | None = None):
+    await log_scheduler_stats(scheduler)
+    await log_pool_stats(pools)
+    if password_hasher is not None:
+        await log_password_hasher_stats(password_hasher)
+
+
+def create_scheduler(httpx_client: AsyncClient, ss: async_sessionmaker,
+                     config: Config, fx_rates: FXRates,
+                     currency_api: CachedCurrencyAPI,
+                     pools: dict[str, MeteredQueuePool] | None = None,
+                     password_hasher: PasswordHasher | None = None) \
+        -> DeadlineScheduler:
     fcs_client = FCSClient(access_key=config.fcsapi_access_key,
                            client=httpx_client)
-    aioschedule.every().day.at('10:00').do(
-        add_prices_task,
-        fcs_client=fcs_client,
-        ss=ss
+    scheduler = DeadlineScheduler()
+    scheduler.daily(
+        'fx_refresh',
+        time(10),
+        partial(add_prices_task, fcs_client, ss, fx_rates),
+        jitter=timedelta(minutes=5),
+        run_now=True
     )
-
-    await add_prices_task(fcs_client, ss)
-    while True:
-        await aioschedule.run_pending()
-        await asyncio.sleep(0.1)
+    scheduler.every(
+        'crypto_prices_poll',
+        config.crypto_prices_poll_interval,
+        partial(poll_crypto_prices_task, currency_api, ss),
+        jitter=config.crypto_prices_poll_interval / 10,
+        run_now=True
+    )
+    scheduler.every(
+        'rollup_compaction',
+        config.rollup_compaction_interval,
+        partial(compact_rollup_task, ss),
+        jitter=config.rollup_compaction_interval / 10
+    )
+    scheduler.every(
+        'stats_log',
+        STATS_LOG_INTERVAL,
+        partial(log_stats, scheduler, pools or {}, password_hasher)
+    )
+    return scheduler
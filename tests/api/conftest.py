@@ -6,13 +6,16 @@ import pytest
 import pytest_asyncio
 from fastapi import FastAPI, APIRouter
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
 from api import v1
 from api.main_factory import create_app
-from api.v1.dependencies import AuthProvider
+from api.v1.dependencies import AuthProvider, FXRates, CachedCurrencyAPI
 from finances.database.dao import DAO
-from finances.database.models import Currency, Asset, TransactionCategory
+from finances.database.dao.user_configuration_cache import \
+    UserConfigurationCache
+from finances.database.models import Currency, Asset, TransactionCategory, \
+    Transaction, CryptoPortfolio, CryptoAsset, CryptoTransaction
 from finances.exceptions.asset import AssetNotFound
 from finances.exceptions.crypto_asset import CryptoAssetNotFound
 from finances.exceptions.crypto_currency import CryptoCurrencyNotFound
@@ -35,11 +38,21 @@ from tests.fixtures.user_data import get_test_user
 
 
 @pytest.fixture(scope='session')
-def app(config: Config, sessionmaker: async_sessionmaker) -> FastAPI:
+def configuration_cache() -> UserConfigurationCache:
+    return UserConfigurationCache()
+
+
+@pytest.fixture(scope='session')
+def app(
+        config: Config,
+        sessionmaker: async_sessionmaker,
+        configuration_cache: UserConfigurationCache
+) -> FastAPI:
     app = create_app()
     api_router_v1 = APIRouter()
     v1.dependencies.setup(app, api_router_v1, sessionmaker, config,
-                          None)  # noqa
+                          CachedCurrencyAPI(None),  # noqa
+                          FXRates(sessionmaker), configuration_cache)
     v1.routes.setup_routers(api_router_v1)
     main_api_router = APIRouter(prefix='/api')
     main_api_router.include_router(api_router_v1, prefix='/v1')
@@ -60,13 +73,21 @@ def auth(config: Config) -> AuthProvider:
     return AuthProvider(config.auth)
 
 
+@pytest_asyncio.fixture
+async def dao(
+        session: AsyncSession,
+        configuration_cache: UserConfigurationCache
+) -> DAO:
+    return DAO(session=session, configuration_cache=configuration_cache)
+
+
 @pytest_asyncio.fixture
 async def user(dao: DAO, auth: AuthProvider) -> dto.User:
     test_user = get_test_user()
     try:
         user_ = await dao.user.get_by_username(test_user.username)
     except UserNotFound:
-        password = auth.get_password_hash('12345')
+        password = await auth.get_password_hash('12345')
         user_ = await dao.user.create(test_user.add_password(password))
         await dao.commit()
     return user_
@@ -145,8 +166,12 @@ async def transaction(
             amount=Decimal('5.0'),
             created=datetime.now()
         )
-        transaction_dto = await dao.transaction.merge(transaction_dto)
+        transaction_ = await dao.session.merge(
+            Transaction.from_dto(transaction_dto))
+        await dao.transaction_daily_total.add_transaction(transaction_dto)
         await dao.commit()
+        transaction_dto = transaction_.to_dto(with_asset=False,
+                                              with_category=False)
         transaction_dto.asset = asset
         transaction_dto.category = transaction_category
 
@@ -164,8 +189,9 @@ async def crypto_portfolio(
             crypto_portfolio_dto.id)
     except CryptoPortfolioNotFound:
         crypto_portfolio_dto.user_id = user.id
-        crypto_portfolio_dto = await dao.crypto_portfolio.merge(
-            crypto_portfolio_dto)
+        crypto_portfolio = await dao.session.merge(
+            CryptoPortfolio.from_dto(crypto_portfolio_dto))
+        crypto_portfolio_dto = crypto_portfolio.to_dto()
         await dao.user.set_base_crypto_portfolio(user, crypto_portfolio_dto.id)
         await dao.commit()
 
@@ -214,16 +240,17 @@ async def crypto_asset(
     try:
         crypto_asset_dto = await dao.crypto_asset.get_by_id(1)
     except CryptoAssetNotFound:
-        crypto_asset_dto = await dao.crypto_asset.merge(
-            dto.CryptoAsset(
+        crypto_asset_ = await dao.session.merge(
+            CryptoAsset.from_dto(dto.CryptoAsset(
                 id=1,
                 user_id=user.id,
                 portfolio_id=crypto_portfolio.id,
                 crypto_currency_id=crypto_currency.id,
-                amount=None
-            )
+                amount=Decimal(0)
+            ))
         )
         await dao.commit()
+        crypto_asset_dto = crypto_asset_.to_dto(with_currency=False)
         crypto_asset_dto.crypto_currency = crypto_currency
     return crypto_asset_dto
 
@@ -244,8 +271,10 @@ async def crypto_transaction(
         crypto_transaction_dto.user_id = user.id
         crypto_transaction_dto.portfolio_id = crypto_portfolio.id
         crypto_transaction_dto.crypto_asset_id = crypto_asset.id
-        crypto_transaction_dto = await dao.crypto_transaction.merge(
-            crypto_transaction_dto)
+        crypto_transaction = await dao.session.merge(
+            CryptoTransaction.from_dto(crypto_transaction_dto))
+        await dao.crypto_asset.add_transaction(crypto_transaction_dto)
         await dao.commit()
+        crypto_transaction_dto = crypto_transaction.to_dto()
 
     return crypto_transaction_dto
@@ -0,0 +1,34 @@
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from api.v1.dependencies import CurrencyAPI
+
+
+@pytest.mark.asyncio
+async def test_crypto_currency_prices_use_cached_symbols():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if 'symbols' in request.url.params:
+            return httpx.Response(200, json=[
+                {'symbol': 'BTCUSDT', 'price': '20000.5'}
+            ])
+        return httpx.Response(200, json=[
+            {'symbol': 'BTCUSDT', 'price': '20000.5'},
+            {'symbol': 'ETHBTC', 'price': '0.07'},
+        ])
+
+    async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)) as client:
+        currency_api = CurrencyAPI(client)
+        for _ in range(3):
+            prices = await currency_api.get_crypto_currency_prices(
+                ['BTC', 'ETH'])
+            assert prices == {'BTCUSDT': Decimal('20000.5')}
+
+    assert len(requests) == 4
+    assert requests[1].url.params['symbols'] == '["BTCUSDT"]'
+    assert await currency_api.get_usdt_symbols() == frozenset({'BTCUSDT'})
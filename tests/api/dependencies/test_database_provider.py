@@ -0,0 +1,134 @@
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Request
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.v1.dependencies import AuthProvider
+from api.v1.dependencies.db import DatabaseProvider, \
+    StickyCookieMiddleware
+from finances.database.dao import DAO
+from finances.database.engine import create_replica_engines
+from finances.models.dto import Config
+from tests.fixtures.user_data import get_test_user
+
+
+def make_request(method: str, token: str | None = None,
+                 cookie: str | None = None) -> Request:
+    headers = []
+    if token is not None:
+        headers.append((b'authorization', f'Bearer {token}'.encode()))
+    if cookie is not None:
+        headers.append((b'cookie', cookie.encode()))
+    return Request({'type': 'http', 'method': method, 'headers': headers})
+
+
+async def resolve_dao(db_provider: DatabaseProvider, request: Request):
+    dao_gen = db_provider.dao(request)
+    dao = await anext(dao_gen)
+    result = await dao.session.execute(text('SHOW transaction_read_only'))
+    read_only = result.scalar()
+    await dao_gen.aclose()
+    return dao.read_only, read_only
+
+
+@pytest.mark.asyncio
+async def test_reads_are_routed_to_replica(config: Config,
+                                           sessionmaker: async_sessionmaker):
+    replica_engine, = create_replica_engines(
+        replace(config.db, replica_urls=[config.db.make_url]))
+    db_provider = DatabaseProvider(
+        sessionmaker,
+        replica_sessions=[async_sessionmaker(replica_engine)]
+    )
+    auth = AuthProvider(config.auth)
+    user = replace(get_test_user(), id=uuid4())
+    token = auth.create_user_token(user).access_token
+    other_token = auth.create_user_token(
+        replace(user, id=uuid4(), username='trinity')).access_token
+
+    try:
+        assert await resolve_dao(db_provider, make_request('GET', token)) \
+               == (True, 'on')
+        assert await resolve_dao(db_provider, make_request('POST', token)) \
+               == (False, 'off')
+        assert await resolve_dao(db_provider, make_request('GET', token)) \
+               == (False, 'off')
+        assert await resolve_dao(db_provider,
+                                 make_request('GET', other_token)) \
+               == (True, 'on')
+        assert await resolve_dao(db_provider, make_request('GET')) \
+               == (True, 'on')
+    finally:
+        await replica_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sticky_cookie_is_shared_between_workers(
+        config: Config, sessionmaker: async_sessionmaker):
+    replica_engine, = create_replica_engines(
+        replace(config.db, replica_urls=[config.db.make_url]))
+    replica_sessions = [async_sessionmaker(replica_engine)]
+    worker = DatabaseProvider(sessionmaker,
+                              replica_sessions=replica_sessions)
+    other_worker = DatabaseProvider(sessionmaker,
+                                    replica_sessions=replica_sessions)
+    auth = AuthProvider(config.auth)
+    token = auth.create_user_token(
+        replace(get_test_user(), id=uuid4())).access_token
+
+    app = FastAPI()
+    app.add_middleware(StickyCookieMiddleware)
+
+    @app.post('/write')
+    async def write(dao: DAO = Depends(worker.dao)):
+        # user routes answer with HTTPException(200), which drops any
+        # cookie set on an injected Response
+        assert dao.read_only is False
+        raise HTTPException(status_code=200)
+
+    try:
+        async with AsyncClient(app=app, base_url='http://test') as client:
+            response = await client.post(
+                '/write', headers={'Authorization': f'Bearer {token}'})
+        assert response.status_code == 200
+        assert 'httponly' in response.headers['set-cookie'].lower()
+        cookie = response.headers['set-cookie'].split(';')[0]
+        assert cookie.startswith('primary_until=')
+
+        assert await resolve_dao(other_worker,
+                                 make_request('GET', token, cookie)) \
+               == (False, 'off')
+        assert await resolve_dao(other_worker, make_request('GET', token)) \
+               == (True, 'on')
+        assert await resolve_dao(other_worker,
+                                 make_request('GET', token,
+                                              'primary_until=0')) \
+               == (True, 'on')
+    finally:
+        await replica_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_stay_on_primary_without_replicas(
+        sessionmaker: async_sessionmaker):
+    db_provider = DatabaseProvider(sessionmaker)
+    assert await resolve_dao(db_provider, make_request('GET')) \
+           == (False, 'off')
+
+
+@pytest.mark.asyncio
+async def test_session_is_opened_on_first_use(
+        sessionmaker: async_sessionmaker):
+    db_provider = DatabaseProvider(sessionmaker)
+    async with db_provider.open_dao() as dao:
+        assert not dao.has_session
+        assert 'user' not in vars(dao)
+
+        user_dao = dao.user
+        assert dao.has_session
+        assert dao.user is user_dao
+        assert dao.asset.session is user_dao.session
@@ -0,0 +1,42 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.v1.dependencies import FXRates
+from api.v1.dependencies.fx_rates import FXRatesSnapshot
+from finances.database.dao import DAO
+from finances.models import dto
+
+
+def test_snapshot_cross_rates():
+    snapshot = FXRatesSnapshot.from_prices([
+        dto.CurrencyPrice(base='USD', quote='EUR', price=Decimal('0.5')),
+        dto.CurrencyPrice(base='USD', quote='RUB', price=Decimal('80')),
+    ], version=1)
+
+    assert snapshot.get_rate('USD', 'USD') == Decimal('1')
+    assert snapshot.get_rate('USD', 'EUR') == Decimal('0.5')
+    assert snapshot.get_rate('EUR', 'USD') == Decimal('2')
+    assert snapshot.get_rate('EUR', 'RUB') == Decimal('160')
+    assert snapshot.get_rate('USD', 'XXX') is None
+
+
+@pytest.mark.asyncio
+async def test_fx_rates_refresh(sessionmaker: async_sessionmaker, dao: DAO):
+    await dao.currency_price.merge(
+        dto.CurrencyPrice(base='FXA', quote='FXB', price=Decimal('4')))
+    await dao.commit()
+
+    fx_rates = FXRates(sessionmaker, ttl=timedelta(hours=1))
+    snapshot = await fx_rates.get_snapshot()
+    assert snapshot.get_rate('FXB', 'FXA') == Decimal('0.25')
+    assert await fx_rates.get_snapshot() is snapshot
+
+    await fx_rates.refresh()
+    assert fx_rates.version == snapshot.version + 1
+
+    expired_fx_rates = FXRates(sessionmaker, ttl=timedelta(0))
+    expired_snapshot = await expired_fx_rates.get_snapshot()
+    assert await expired_fx_rates.get_snapshot() is not expired_snapshot
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+from passlib.context import CryptContext
+
+from api.v1.dependencies.password_hasher import PasswordHasher, \
+    PasswordHasherBusy
+
+
+@pytest.fixture
+def pwd_context() -> CryptContext:
+    return CryptContext(schemes=['bcrypt'], bcrypt__rounds=4)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(pwd_context: CryptContext):
+    hasher = PasswordHasher(pwd_context, workers=2)
+    hashed = await hasher.hash('12345')
+
+    assert await hasher.verify('12345', hashed)
+    assert not await hasher.verify('54321', hashed)
+    assert hasher.stats().completed == 3
+    assert hasher.stats().pending == 0
+
+
+@pytest.mark.asyncio
+async def test_saturated_hasher_rejects(pwd_context: CryptContext):
+    hasher = PasswordHasher(pwd_context, workers=1, queue_size=1)
+    results = await asyncio.gather(
+        *(hasher.hash('12345') for _ in range(3)),
+        return_exceptions=True
+    )
+
+    assert isinstance(results[2], PasswordHasherBusy)
+    assert all(isinstance(result, str) for result in results[:2])
+    stats = hasher.stats()
+    assert stats.rejected == 1
+    assert stats.peak_pending == stats.max_pending == 2
@@ -0,0 +1,79 @@
+import asyncio
+from datetime import timedelta
+from decimal import Decimal
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.v1.dependencies import CachedCurrencyAPI
+from finances.models import dto
+from scheduler.crypto_prices import poll_crypto_prices_task
+
+
+def binance_handler(requests: list[httpx.Request], price: list[str]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if 'symbols' in request.url.params:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=[
+                {'symbol': 'BTCUSDT', 'price': price[0]}
+            ])
+        return httpx.Response(200, json=[
+            {'symbol': 'BTCUSDT', 'price': price[0]},
+        ])
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced():
+    requests: list[httpx.Request] = []
+    async with httpx.AsyncClient(transport=httpx.MockTransport(
+            binance_handler(requests, ['20000']))) as client:
+        currency_api = CachedCurrencyAPI(client)
+        results = await asyncio.gather(*(
+            currency_api.get_crypto_currency_prices(['BTC', 'ETH'])
+            for _ in range(10)))
+
+    assert all(prices == {'BTCUSDT': Decimal('20000')}
+               for prices in results)
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_prices_are_revalidated_in_background():
+    requests: list[httpx.Request] = []
+    price = ['20000']
+    async with httpx.AsyncClient(transport=httpx.MockTransport(
+            binance_handler(requests, price))) as client:
+        currency_api = CachedCurrencyAPI(client,
+                                         prices_ttl=timedelta(seconds=0))
+        assert await currency_api.get_crypto_currency_price('BTC') == \
+            Decimal('20000')
+
+        price[0] = '21000'
+        assert await currency_api.get_crypto_currency_price('BTC') == \
+            Decimal('20000')
+        await asyncio.sleep(0.05)
+        assert await currency_api.get_crypto_currency_price('BTC') == \
+            Decimal('21000')
+
+
+@pytest.mark.asyncio
+async def test_poller_fills_ticker_table(
+        crypto_asset: dto.CryptoAsset,
+        sessionmaker: async_sessionmaker
+):
+    requests: list[httpx.Request] = []
+    async with httpx.AsyncClient(transport=httpx.MockTransport(
+            binance_handler(requests, ['20000']))) as client:
+        currency_api = CachedCurrencyAPI(client)
+        await poll_crypto_prices_task(currency_api, sessionmaker)
+        polled = len(requests)
+
+        prices = await currency_api.get_crypto_currency_prices(['BTC'])
+
+    assert prices == {'BTCUSDT': Decimal('20000')}
+    assert requests[-1].url.params['symbols'] == '["BTCUSDT"]'
+    assert len(requests) == polled
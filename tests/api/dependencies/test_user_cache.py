@@ -0,0 +1,38 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from api.v1.dependencies.user_cache import UserCache
+from finances.models import dto
+from finances.models.enums.user_type import UserType
+
+
+def make_user(username: str) -> dto.User:
+    return dto.User(id=uuid4(), username=username, user_type=UserType.USER)
+
+
+def test_least_recently_used_user_is_evicted():
+    cache = UserCache(maxsize=2)
+    neo, trinity, morpheus = map(make_user, ['neo', 'trinity', 'morpheus'])
+    cache.set('neo', neo)
+    cache.set('trinity', trinity)
+    assert cache.get('neo') == neo
+
+    cache.set('morpheus', morpheus)
+    assert cache.get('trinity') is None
+    assert cache.get('neo') == neo
+    assert cache.get('morpheus') == morpheus
+
+
+def test_expired_and_invalidated_users_are_dropped():
+    cache = UserCache(ttl=timedelta(seconds=0))
+    cache.set('neo', make_user('neo'))
+    assert cache.get('neo') is None
+    assert len(cache) == 0
+
+    cache = UserCache()
+    neo, trinity = make_user('neo'), make_user('trinity')
+    cache.set('neo', neo)
+    cache.set('trinity', trinity)
+    cache.invalidate('neo')
+    cache.invalidate_user_id(trinity.id)
+    assert len(cache) == 0
@@ -1,8 +1,12 @@
+from decimal import Decimal
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete
 
 from api.v1.dependencies import AuthProvider
 from finances.database.dao import DAO
+from finances.database.models import Currency
 from finances.models import dto
 
 
@@ -100,6 +104,42 @@ async def test_delete_asset(
 
     assert resp.status_code == 404
 
+    resp = await client.delete(
+        f'/api/v1/asset/{asset.id}',
+        headers={
+            'Authorization': 'Bearer ' + token.access_token}
+    )
+
+    assert resp.is_success
+
+
+@pytest.mark.asyncio
+async def test_merge_asset_sets_null(
+        dao: DAO,
+        user: dto.User,
+        asset: dto.Asset
+):
+    changed_asset = dto.Asset(id=asset.id, user_id=user.id,
+                              title=asset.title, currency_id=None,
+                              amount=asset.amount)
+    merged_asset = await dao.asset.merge(changed_asset)
+    await dao.commit()
+
+    assert merged_asset.currency_id is None
+    assert merged_asset.title == asset.title
+
+    await dao.asset.merge(asset)
+    await dao.commit()
+
+
+@pytest.mark.asyncio
+async def test_merge_asset_requires_id(dao: DAO, user: dto.User):
+    asset = dto.Asset(id=None, user_id=user.id, title='no id',
+                      currency_id=None, amount=Decimal(0))
+    with pytest.raises(ValueError):
+        await dao.asset.merge(asset)
+    await dao.session.rollback()
+
 
 @pytest.mark.asyncio
 async def test_change_asset(
@@ -174,3 +214,35 @@ async def test_delete_asset_currency(
 
     await dao.asset.delete_by_id(asset.id, user.id)
     await dao.commit()
+
+
+@pytest.mark.asyncio
+async def test_total_without_rate_is_not_converted_at_par(
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider,
+        dao: DAO
+):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    await dao.session.merge(Currency(id=901, name='no rate', code='NRT',
+                                     is_custom=False))
+    await dao.commit()
+    asset = await dao.asset.create(dto.Asset(
+        id=None, user_id=user.id, title='no rate asset', currency_id=901,
+        amount=Decimal(100)
+    ))
+    await dao.commit()
+
+    try:
+        resp = await client.get('/api/v1/asset/total', headers=headers,
+                                params={'asset_id': str(asset.id)})
+        assert resp.status_code == 503
+
+        resp = await client.get('/api/v1/asset/totalPrices', headers=headers)
+        assert resp.status_code == 503
+        assert resp.json()['detail'] == 'Exchange rate for NRT not found'
+    finally:
+        await dao.asset.delete_by_id(asset.id, user.id)
+        await dao.session.execute(delete(Currency).where(Currency.id == 901))
+        await dao.commit()
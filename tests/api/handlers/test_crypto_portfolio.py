@@ -1,11 +1,16 @@
+from uuid import uuid4
+
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import update
+from sqlalchemy import update, event
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from api.v1.dependencies import AuthProvider
 from finances.database.dao import DAO
 from finances.database.models import UserConfiguration
 from finances.models import dto
+from finances.models.enums.transaction_type import CryptoTransactionType
+from finances.services.crypto_portfolio import get_total_by_portfolio
 
 
 @pytest.mark.asyncio
@@ -83,6 +88,48 @@ async def test_change_crypto_portfolio(
     assert resp.status_code == 400
 
 
+@pytest.mark.asyncio
+async def test_change_crypto_portfolio_is_single_update(
+        client: AsyncClient,
+        user: dto.User,
+        crypto_portfolio: dto.CryptoPortfolio,
+        auth: AuthProvider,
+        sessionmaker: async_sessionmaker
+):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    resp = await client.get('/api/v1/user/me', headers=headers)
+    assert resp.is_success
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context,
+                              executemany):
+        statements.append(statement)
+
+    engine = sessionmaker.kw['bind'].sync_engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        resp = await client.put(
+            'api/v1/cryptoportfolio/change',
+            headers=headers,
+            json={'id': str(crypto_portfolio.id), 'title': 'single update'}
+        )
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    assert resp.is_success
+    assert resp.json()['title'] == 'single update'
+    assert [statement.split()[0] for statement in statements
+            if 'crypto_portfolios' in statement] == ['UPDATE']
+
+    resp = await client.put(
+        'api/v1/cryptoportfolio/change',
+        headers=headers,
+        json={'id': str(uuid4()), 'title': 'single update'}
+    )
+    assert resp.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_delete_crypto_portfolio(
         client: AsyncClient,
@@ -139,6 +186,7 @@ async def test_set_base_portfolio(
     await dao.session.execute(update(UserConfiguration).where(
         UserConfiguration.id == user.id).values(base_crypto_portfolio_id=None))
     await dao.commit()
+    dao.user.invalidate_configuration(user.id)
 
     resp = await client.get(
         'api/v1/cryptoportfolio/baseCryptoportfolio',
@@ -155,3 +203,32 @@ async def test_set_base_portfolio(
     assert resp.is_success
     base_portfolio = await dao.user.get_base_crypto_portfolio(user)
     assert base_portfolio == crypto_portfolio
+
+
+@pytest.mark.asyncio
+async def test_total_by_portfolio_sums_transactions(
+        crypto_transaction: dto.CryptoTransaction,
+        crypto_asset: dto.CryptoAsset,
+        user: dto.User,
+        dao: DAO
+):
+    class NoPrices:
+        async def get_crypto_currency_prices(self, codes: list[str]):
+            return {}
+
+    total = await get_total_by_portfolio(crypto_transaction.portfolio_id,
+                                         user, dao, NoPrices())
+    transactions = await dao.crypto_transaction.get_all_by_crypto_asset(
+        crypto_asset.id, user.id)
+    signs = [-1 if transaction.type == CryptoTransactionType.SELL else 1
+             for transaction in transactions]
+    total_buy, = [total_buy for total_buy in total.totals_buy
+                  if total_buy.currency_code ==
+                  crypto_asset.crypto_currency.code]
+
+    assert total_buy.total_amount == sum(
+        sign * transaction.amount
+        for sign, transaction in zip(signs, transactions))
+    assert total_buy.total_price == round(sum(
+        sign * transaction.amount * transaction.price
+        for sign, transaction in zip(signs, transactions)), 2)
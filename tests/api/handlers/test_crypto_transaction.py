@@ -1,9 +1,12 @@
+from decimal import Decimal
+
 import pytest
 from httpx import AsyncClient
 
 from api.v1.dependencies import AuthProvider
 from finances.database.dao import DAO
 from finances.models import dto
+from finances.models.enums.transaction_type import CryptoTransactionType
 
 
 @pytest.mark.asyncio
@@ -92,6 +95,8 @@ async def test_change_crypto_transaction(
         dao: DAO
 ):
     token = auth.create_user_token(user)
+    amount_before = (await dao.crypto_asset.get_by_id(
+        crypto_transaction.crypto_asset_id)).amount
     crypto_transaction_dict = {
         'type': crypto_transaction.type.value,
         'amount': float(crypto_transaction.amount - 2),
@@ -117,8 +122,7 @@ async def test_change_crypto_transaction(
     }
     crypto_asset_dto = await dao.crypto_asset.get_by_id(
         crypto_transaction.crypto_asset_id)
-    assert (crypto_asset_dto.amount - crypto_transaction.amount) == (
-            crypto_transaction.amount - 2)
+    assert crypto_asset_dto.amount - amount_before == -2
 
 
 @pytest.mark.asyncio
@@ -142,3 +146,80 @@ async def test_delete_crypto_transaction(
             'Authorization': 'Bearer ' + token.access_token}
     )
     assert not resp.is_success
+
+
+@pytest.mark.asyncio
+async def test_crypto_asset_totals_follow_transactions(
+        crypto_portfolio: dto.CryptoPortfolio,
+        crypto_asset: dto.CryptoAsset,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider,
+        dao: DAO
+):
+    async def get_totals() -> tuple[Decimal, Decimal]:
+        dao.session.expire_all()
+        crypto_asset_dto = await dao.crypto_asset.get_by_id(crypto_asset.id)
+        return crypto_asset_dto.total_amount, crypto_asset_dto.total_cost
+
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    total_amount, total_cost = await get_totals()
+
+    resp = await client.post(
+        '/api/v1/cryptoTransaction/add',
+        headers=headers,
+        json={
+            'type': 'buy',
+            'amount': 10,
+            'price': 100,
+            'created': '2023-02-19 22:04',
+            'portfolio_id': str(crypto_portfolio.id),
+            'crypto_asset_id': crypto_asset.id
+        }
+    )
+    assert resp.is_success
+    crypto_transaction_id = resp.json()['id']
+    assert await get_totals() == (total_amount + 10, total_cost + 1000)
+
+    resp = await client.get(
+        '/api/v1/cryptoAsset/totalBuy',
+        headers=headers,
+        params={'crypto_asset_id': crypto_asset.id}
+    )
+    assert resp.is_success
+    assert resp.json()['total_amount'] == float(total_amount + 10)
+
+    resp = await client.put(
+        '/api/v1/cryptoTransaction/change',
+        headers=headers,
+        json={
+            'id': crypto_transaction_id,
+            'type': 'sell',
+            'amount': 4,
+            'price': 50,
+            'created': '2023-02-19T22:05:00'
+        }
+    )
+    assert resp.is_success
+    assert await get_totals() == (total_amount - 4, total_cost - 200)
+
+    resp = await client.delete(
+        f'/api/v1/cryptoTransaction/{crypto_transaction_id}',
+        headers=headers
+    )
+    assert resp.is_success
+    assert await get_totals() == (total_amount, total_cost)
+
+    await dao.crypto_asset.rebuild_totals()
+    await dao.commit()
+    transactions = await dao.crypto_transaction.get_all_by_crypto_asset(
+        crypto_asset.id, user.id)
+    signs = [-1 if transaction.type == CryptoTransactionType.SELL else 1
+             for transaction in transactions]
+    assert await get_totals() == (
+        sum(sign * transaction.amount
+            for sign, transaction in zip(signs, transactions)),
+        sum(sign * transaction.amount * transaction.price
+            for sign, transaction in zip(signs, transactions))
+    )
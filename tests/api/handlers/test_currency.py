@@ -6,6 +6,8 @@ from httpx import AsyncClient
 
 from api.v1.dependencies import AuthProvider
 from finances.database.dao import DAO
+from finances.database.dao.user_configuration_cache import \
+    UserConfigurationCache
 from finances.models import dto
 from tests.fixtures.currency_data import get_test_currency, \
     get_test_base_currency
@@ -171,3 +173,43 @@ async def test_set_base_currency(
     assert {'id': currency.id, 'name': currency.name,
             'code': currency.code, 'is_custom': False,
             'rate_to_base_currency': None} == currency_json
+
+
+@pytest.mark.asyncio
+async def test_base_currency_is_cached(
+        user: dto.User,
+        dao: DAO,
+        configuration_cache: UserConfigurationCache
+):
+    configuration_cache.invalidate(user.id)
+    config = await dao.user.get_configuration(user)
+    assert configuration_cache.get(user.id) is config
+    assert await dao.user.get_base_currency(user) is config.base_currency
+
+    base_currency = config.base_currency
+    await dao.user.set_base_currency(
+        user, base_currency.id if base_currency else None)
+    assert configuration_cache.get(user.id) is config
+    await dao.commit()
+    assert configuration_cache.get(user.id) is None
+
+    await dao.user.get_configuration(user)
+    await dao.user.set_base_currency(
+        user, base_currency.id if base_currency else None)
+    await dao.session.rollback()
+    await dao.commit()
+    assert configuration_cache.get(user.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_currency_change_clears_configuration_cache(
+        user: dto.User,
+        currency: dto.Currency,
+        dao: DAO,
+        configuration_cache: UserConfigurationCache
+):
+    await dao.user.get_configuration(user)
+    await dao.currency.merge(currency)
+    assert configuration_cache.get(user.id) is not None
+    await dao.commit()
+    assert configuration_cache.get(user.id) is None
@@ -0,0 +1,122 @@
+import time
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.v1.dependencies import AuthProvider, CachedCurrencyAPI, \
+    currency_api_provider, FXRates
+from api.v1.dependencies.db import DatabaseProvider
+from api.v1.models.response.total_result import DashboardResult
+from finances.models import dto
+from finances.models.enums.transaction_type import TransactionType
+from finances.services.dashboard import get_dashboard, \
+    DASHBOARD_MAX_SESSIONS
+
+
+def binance_handler(request: httpx.Request) -> httpx.Response:
+    prices = [{'symbol': 'BTCUSDT', 'price': '20000'},
+              {'symbol': 'ETHUSDT', 'price': '1500'}]
+    return httpx.Response(200, json=prices)
+
+
+@pytest.mark.asyncio
+async def test_dashboard_matches_separate_totals(
+        transaction: dto.Transaction,
+        crypto_transaction: dto.CryptoTransaction,
+        app: FastAPI,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider
+):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    period = {
+        'startDate': (transaction.created - timedelta(days=1)).date()
+        .isoformat(),
+        'endDate': (transaction.created + timedelta(days=1)).date()
+        .isoformat()
+    }
+
+    async def get(url: str, **params) -> dict:
+        resp = await client.get(url, headers=headers, params=params)
+        assert resp.is_success
+        result = resp.json()
+        result.pop('server_time', None)
+        return result
+
+    currency_api_override = app.dependency_overrides[currency_api_provider]
+    async with httpx.AsyncClient(
+            transport=httpx.MockTransport(binance_handler)) as binance:
+        currency_api = CachedCurrencyAPI(binance)
+        app.dependency_overrides[currency_api_provider] = \
+            lambda: currency_api
+        try:
+            dashboard = await get('/api/v1/dashboard', **period)
+            crypto_portfolio = await get(
+                '/api/v1/cryptoportfolio/totalPrice',
+                portfolio_id=crypto_transaction.portfolio_id)
+        finally:
+            app.dependency_overrides[currency_api_provider] = \
+                currency_api_override
+
+    dashboard['crypto_portfolio'].pop('server_time')
+    assert dashboard == {
+        'total_assets': (await get('/api/v1/asset/totalPrices'))['total'],
+        'total_income': (await get('/api/v1/transaction/totalByPeriod',
+                                   type='income', **period))['total'],
+        'total_expense': (await get('/api/v1/transaction/totalByPeriod',
+                                    type='expense', **period))['total'],
+        'categories': await get(
+            '/api/v1/transaction/totalCategoriesByPeriod', type='expense',
+            **period),
+        'crypto_portfolio': crypto_portfolio
+    }
+
+
+def test_dashboard_server_time_is_per_response():
+    def make_result() -> DashboardResult:
+        return DashboardResult(
+            total_assets=0, total_income=0, total_expense=0,
+            categories=dto.TotalCategories(total=0, categories=[]))
+
+    first = make_result()
+    time.sleep(0.01)
+    assert make_result().server_time > first.server_time
+
+
+@pytest.mark.asyncio
+async def test_dashboard_limits_open_sessions(
+        transaction: dto.Transaction,
+        user: dto.User,
+        sessionmaker: async_sessionmaker
+):
+    db_provider = DatabaseProvider(sessionmaker)
+    open_sessions, max_open_sessions = 0, 0
+
+    @asynccontextmanager
+    async def dao_factory():
+        nonlocal open_sessions, max_open_sessions
+        async with db_provider.open_dao() as dao:
+            open_sessions += 1
+            max_open_sessions = max(max_open_sessions, open_sessions)
+            try:
+                # touch the session so it checks out a connection
+                await dao.user.get_configuration(user)
+                yield dao
+            finally:
+                open_sessions -= 1
+
+    async with httpx.AsyncClient(
+            transport=httpx.MockTransport(binance_handler)) as binance:
+        await get_dashboard(
+            transaction.created.date() - timedelta(days=1),
+            transaction.created.date() + timedelta(days=1),
+            TransactionType.EXPENSE, user, dao_factory,
+            FXRates(sessionmaker), CachedCurrencyAPI(binance))
+
+    assert max_open_sessions == DASHBOARD_MAX_SESSIONS
@@ -1,12 +1,22 @@
+import asyncio
+from datetime import timedelta, date, datetime
 from decimal import Decimal
+from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
 
+from sqlalchemy import delete, or_, select, func
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
 from api.v1.dependencies import AuthProvider
 from finances.database.dao import DAO
+from finances.database.models import Currency, CurrencyPriceHistory, \
+    TransactionDailyTotal, Transaction
 from finances.exceptions.transaction import TransactionNotFound
 from finances.models import dto
+from finances.services.transaction import get_signed_amount
+from scheduler.rollup import compact_rollup_task
 
 
 @pytest.mark.asyncio
@@ -210,3 +220,458 @@ async def test_change_transaction(
         'amount': changed_transaction_dict['amount'],
         'created': '2023-02-19T22:04:00'
     }
+
+
+@pytest.mark.asyncio
+async def test_get_all_transactions(
+        transaction: dto.Transaction,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider
+):
+    token = auth.create_user_token(user)
+    created = transaction.created.date()
+    resp = await client.get(
+        '/api/v1/transaction/all',
+        headers={
+            'Authorization': 'Bearer ' + token.access_token},
+        params={
+            'startDate': created.isoformat(),
+            'endDate': (created + timedelta(days=1)).isoformat(),
+            'asset_id': str(transaction.asset_id)
+        }
+    )
+    assert resp.is_success
+    days = resp.json()
+    assert len(days) == 1
+    assert days[0]['created'] == created.isoformat()
+    assert transaction.id in [item['id'] for item in days[0]['transactions']]
+
+    total_income = sum(
+        item['amount'] for item in days[0]['transactions']
+        if item['category']['type'] == 'income')
+    total_expense = sum(
+        item['amount'] for item in days[0]['transactions']
+        if item['category']['type'] == 'expense')
+    assert days[0]['total_income'] == total_income
+    assert days[0]['total_expense'] == total_expense
+
+
+@pytest.mark.asyncio
+async def test_get_all_transactions_pagination(
+        transaction: dto.Transaction,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider,
+        dao: DAO
+):
+    token = auth.create_user_token(user)
+    earlier_transaction = await dao.transaction.create(dto.Transaction(
+        id=1000,
+        user_id=user.id,
+        asset_id=transaction.asset_id,
+        category_id=transaction.category_id,
+        amount=Decimal('3'),
+        created=transaction.created - timedelta(seconds=1)
+    ))
+    await dao.commit()
+
+    created = transaction.created.date()
+    params = {
+        'startDate': created.isoformat(),
+        'endDate': (created + timedelta(days=1)).isoformat(),
+        'asset_id': str(transaction.asset_id),
+        'limit': 1
+    }
+    resp = await client.get(
+        '/api/v1/transaction/all',
+        headers={
+            'Authorization': 'Bearer ' + token.access_token},
+        params=params
+    )
+    assert resp.is_success
+    first_page = resp.json()
+    assert [item['id'] for item in first_page[0]['transactions']] == [
+        transaction.id]
+    assert first_page[0]['total_income'] == float(
+        transaction.amount + earlier_transaction.amount)
+    assert 'next' in resp.links
+
+    resp = await client.get(
+        resp.links['next']['url'],
+        headers={
+            'Authorization': 'Bearer ' + token.access_token},
+    )
+    assert resp.is_success
+    second_page = resp.json()
+    assert [item['id'] for item in second_page[0]['transactions']] == [
+        earlier_transaction.id]
+    assert 'next' not in resp.links
+
+    resp = await client.get(
+        '/api/v1/transaction/all',
+        headers={
+            'Authorization': 'Bearer ' + token.access_token},
+        params=params | {'cursor': 'invalid'}
+    )
+    assert resp.status_code == 400
+
+    await dao.transaction.delete_by_id(earlier_transaction.id, user.id)
+    await dao.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_totals_by_asset(
+        transaction: dto.Transaction,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider,
+        dao: DAO
+):
+    token = auth.create_user_token(user)
+    await dao.transaction_daily_total.rebuild()
+    await dao.commit()
+
+    created = transaction.created.date()
+    get_totals = lambda: client.get(  # noqa
+        '/api/v1/transaction/totalsByAsset',
+        headers={
+            'Authorization': 'Bearer ' + token.access_token},
+        params={
+            'startDate': created.isoformat(),
+            'endDate': (created + timedelta(days=1)).isoformat(),
+            'asset_id': str(transaction.asset_id)
+        }
+    )
+    resp = await get_totals()
+    assert resp.is_success
+    totals = resp.json()
+    assert totals['total_income'] >= float(transaction.amount)
+
+    resp = await client.delete(
+        f'/api/v1/transaction/{transaction.id}',
+        headers={
+            'Authorization': 'Bearer ' + token.access_token},
+    )
+    assert resp.is_success
+
+    resp = await get_totals()
+    assert resp.is_success
+    assert totals['total_income'] - resp.json()['total_income'] == float(
+        transaction.amount)
+
+
+@pytest.mark.asyncio
+async def test_totals_include_midnight_of_end_date(
+        asset: dto.Asset,
+        transaction_category: dto.TransactionCategory,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider,
+        dao: DAO
+):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    start_date, end_date = date(1985, 6, 1), date(1985, 6, 2)
+    period = {
+        'startDate': start_date.isoformat(),
+        'endDate': end_date.isoformat(),
+        'asset_id': str(asset.id)
+    }
+    total_key = f'total_{transaction_category.type.value}'
+
+    import_resp = await client.post(
+        '/api/v1/transaction/import',
+        headers=headers,
+        json=[
+            {
+                'asset_id': str(asset.id),
+                'category_id': transaction_category.id,
+                'amount': amount,
+                'created': created
+            }
+            for amount, created in [(1, '1985-06-01T10:00:00'),
+                                    (2, '1985-06-02T00:00:00'),
+                                    (4, '1985-06-02T10:00:00')]
+        ]
+    )
+    try:
+        assert import_resp.is_success
+
+        resp = await client.get('/api/v1/transaction/totalsByAsset',
+                                headers=headers, params=period)
+        assert resp.is_success
+        assert resp.json()[total_key] == 3
+
+        resp = await client.get('/api/v1/transaction/all',
+                                headers=headers, params=period)
+        assert resp.is_success
+        assert sorted(item['amount'] for day in resp.json()
+                      for item in day['transactions']) == [1, 2]
+    finally:
+        await dao.session.execute(delete(Transaction).where(
+            Transaction.asset_id == asset.id,
+            Transaction.created >= start_date,
+            Transaction.created < end_date + timedelta(days=1)))
+        await dao.session.execute(delete(TransactionDailyTotal).where(
+            TransactionDailyTotal.asset_id == asset.id,
+            TransactionDailyTotal.day >= start_date,
+            TransactionDailyTotal.day <= end_date))
+        if import_resp.is_success:
+            await dao.asset.update_amount(
+                get_signed_amount(transaction_category.type, Decimal(-7)),
+                asset.id, user.id)
+        await dao.commit()
+
+
+@pytest.mark.asyncio
+async def test_rollup_compaction_removes_empty_days(
+        transaction: dto.Transaction,
+        dao: DAO,
+        sessionmaker: async_sessionmaker
+):
+    moved_transaction = dto.Transaction(
+        id=None,
+        user_id=transaction.user_id,
+        asset_id=transaction.asset_id,
+        category_id=transaction.category_id,
+        amount=transaction.amount,
+        created=transaction.created - timedelta(days=3650)
+    )
+    await dao.transaction_daily_total.add_transaction(moved_transaction)
+    await dao.transaction_daily_total.remove_transaction(moved_transaction)
+    await dao.commit()
+
+    empty_days = select(func.count()).select_from(TransactionDailyTotal) \
+        .where(TransactionDailyTotal.count == 0)
+    assert (await dao.session.execute(empty_days)).scalar() > 0
+    await compact_rollup_task(sessionmaker)
+    assert (await dao.session.execute(empty_days)).scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_import_transactions(
+        asset: dto.Asset,
+        transaction_category: dto.TransactionCategory,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider
+):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    get_asset_amount = lambda: client.get(  # noqa
+        f'/api/v1/asset/{asset.id}', headers=headers)
+    get_total = lambda: client.get(  # noqa
+        '/api/v1/transaction/totalsByAsset',
+        headers=headers,
+        params={
+            'startDate': '2023-03-01',
+            'endDate': '2023-03-03',
+            'asset_id': str(asset.id)
+        }
+    )
+    amount_before = (await get_asset_amount()).json()['amount']
+    total_before = (await get_total()).json()['total_income']
+
+    resp = await client.post(
+        '/api/v1/transaction/import',
+        headers=headers,
+        json=[
+            {
+                'asset_id': str(asset.id),
+                'category_id': transaction_category.id,
+                'amount': 10,
+                'created': '2023-03-01T10:00:00'
+            },
+            {
+                'asset_id': str(asset.id),
+                'category_id': transaction_category.id,
+                'amount': 2.5,
+                'created': '2023-03-02T11:00:00'
+            }
+        ]
+    )
+    assert resp.is_success
+    assert resp.json() == {'imported': 2}
+
+    resp = await client.post(
+        '/api/v1/transaction/import',
+        headers=headers | {'Content-Type': 'text/csv'},
+        content=f'asset_id,category_id,amount,created\n'
+                f'{asset.id},{transaction_category.id},'
+                f'4,2023-03-01T12:00:00\n'
+    )
+    assert resp.is_success
+    assert resp.json() == {'imported': 1}
+
+    assert (await get_asset_amount()).json()['amount'] == \
+        amount_before + 16.5
+    assert (await get_total()).json()['total_income'] == \
+        total_before + 16.5
+
+    resp = await client.post(
+        '/api/v1/transaction/import',
+        headers=headers,
+        json=[{
+            'asset_id': str(uuid4()),
+            'category_id': transaction_category.id,
+            'amount': 1,
+            'created': '2023-03-01T10:00:00'
+        }]
+    )
+    assert resp.status_code == 404
+    assert (await get_asset_amount()).json()['amount'] == \
+        amount_before + 16.5
+
+
+@pytest.mark.asyncio
+async def test_import_transactions_over_many_days(
+        asset: dto.Asset,
+        transaction_category: dto.TransactionCategory,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider,
+        dao: DAO
+):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    # more distinct daily total keys than fit in one statement's parameters
+    days_count = 6000
+    first_day = date(1990, 1, 1)
+    last_day = first_day + timedelta(days=days_count - 1)
+
+    resp = await client.post(
+        '/api/v1/transaction/import',
+        headers=headers,
+        json=[
+            {
+                'asset_id': str(asset.id),
+                'category_id': transaction_category.id,
+                'amount': 1,
+                'created': f'{first_day + timedelta(days=i)}T10:00:00'
+            }
+            for i in range(days_count)
+        ]
+    )
+    try:
+        assert resp.is_success
+        assert resp.json() == {'imported': days_count}
+
+        days = select(func.count()).select_from(TransactionDailyTotal).where(
+            TransactionDailyTotal.asset_id == asset.id,
+            TransactionDailyTotal.day <= last_day)
+        assert (await dao.session.execute(days)).scalar() == days_count
+    finally:
+        await dao.session.execute(delete(Transaction).where(
+            Transaction.asset_id == asset.id,
+            Transaction.created < last_day + timedelta(days=1)))
+        await dao.session.execute(delete(TransactionDailyTotal).where(
+            TransactionDailyTotal.asset_id == asset.id,
+            TransactionDailyTotal.day <= last_day))
+        if resp.is_success:
+            await dao.asset.update_amount(
+                get_signed_amount(transaction_category.type,
+                                  Decimal(-days_count)),
+                asset.id, user.id)
+        await dao.commit()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_transactions_keep_balance(
+        asset: dto.Asset,
+        transaction_category: dto.TransactionCategory,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider
+):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    amount_before = (await client.get(f'/api/v1/asset/{asset.id}',
+                                      headers=headers)).json()['amount']
+
+    responses = await asyncio.gather(*(
+        client.post(
+            '/api/v1/transaction/add',
+            headers=headers,
+            json={
+                'asset_id': str(asset.id),
+                'category_id': transaction_category.id,
+                'amount': 1,
+                'created': '2023-03-05T10:00:00'
+            }
+        )
+        for _ in range(10)))
+    assert all(resp.is_success for resp in responses)
+
+    resp = await client.get(f'/api/v1/asset/{asset.id}', headers=headers)
+    assert resp.json()['amount'] == amount_before + 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('start_date', [
+    date(2021, 1, 1), date.today() - timedelta(days=20)
+])
+async def test_total_by_period_uses_daily_rates(
+        start_date: date,
+        transaction_category: dto.TransactionCategory,
+        client: AsyncClient,
+        user: dto.User,
+        auth: AuthProvider,
+        dao: DAO
+):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    base_currency = await dao.user.get_base_currency(user)
+    base_code = getattr(base_currency, 'code', 'USD')
+    await dao.session.merge(Currency(id=900, name='history', code='HST',
+                                     is_custom=False))
+    await dao.commit()
+    asset = await dao.asset.create(dto.Asset(
+        id=None, user_id=user.id, title='history asset', currency_id=900,
+        amount=Decimal(0)
+    ))
+    await dao.currency_price_history.add_many([
+        dto.CurrencyPrice(base=base_code, quote='HST', price=Decimal(2))
+    ], start_date)
+    await dao.currency_price_history.add_many([
+        dto.CurrencyPrice(base='HST', quote=base_code, price=Decimal('0.25'))
+    ], start_date + timedelta(days=10))
+    await dao.commit()
+
+    try:
+        resp = await client.post(
+            '/api/v1/transaction/import',
+            headers=headers,
+            json=[
+                {
+                    'asset_id': str(asset.id),
+                    'category_id': transaction_category.id,
+                    'amount': amount,
+                    'created': datetime.combine(
+                        start_date + timedelta(days=day),
+                        datetime.min.time()).isoformat()
+                }
+                for day, amount in ((5, 10), (15, 20))
+            ]
+        )
+        assert resp.is_success
+
+        resp = await client.get(
+            '/api/v1/transaction/totalByPeriod',
+            headers=headers,
+            params={
+                'startDate': start_date.isoformat(),
+                'endDate': (start_date + timedelta(days=20)).isoformat(),
+                'type': transaction_category.type.value,
+                'asset_id': str(asset.id)
+            }
+        )
+        assert resp.is_success
+        assert resp.json()['total'] == 10
+    finally:
+        await dao.asset.delete_by_id(asset.id, user.id)
+        await dao.session.execute(delete(CurrencyPriceHistory).where(or_(
+            CurrencyPriceHistory.base == 'HST',
+            CurrencyPriceHistory.quote == 'HST')))
+        await dao.session.execute(delete(Currency).where(Currency.id == 900))
+        await dao.commit()
@@ -101,6 +101,14 @@ async def test_delete_transaction_category(
 
     assert resp.status_code == 404
 
+    resp = await client.delete(
+        f'/api/v1/transaction/category/{transaction_category.id}',
+        headers={
+            'Authorization': 'Bearer ' + token.access_token}
+    )
+
+    assert resp.is_success
+
 
 @pytest.mark.asyncio
 async def test_get_all_transaction_categories(
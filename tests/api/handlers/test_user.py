@@ -1,9 +1,13 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from api.v1.dependencies import AuthProvider
+from api.v1.dependencies.user_cache import UserCache
 from finances.database.dao import DAO
 from finances.models import dto
+from finances.models.enums.user_type import UserType
 
 
 @pytest.mark.asyncio
@@ -18,7 +22,8 @@ async def test_signup_user(client: AsyncClient, dao: DAO, auth: AuthProvider):
 
     created_user = await dao.user.get_by_username_with_password(
         username=username)
-    assert auth.verify_password(password, created_user.hashed_password)
+    assert await auth.verify_password(password,
+                                      created_user.hashed_password)
 
 
 @pytest.mark.asyncio
@@ -92,3 +97,51 @@ async def test_change_password(client: AsyncClient, user: dto.User,
         data={'username': user.username, 'password': 'test123!T'},
     )
     assert resp.is_success
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached(client: AsyncClient,
+                                      user: dto.User,
+                                      auth: AuthProvider,
+                                      sessionmaker: async_sessionmaker):
+    token = auth.create_user_token(user)
+    headers = {'Authorization': 'Bearer ' + token.access_token}
+    resp = await client.get('/api/v1/user/me', headers=headers)
+    assert resp.is_success
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context,
+                              executemany):
+        statements.append(statement)
+
+    engine = sessionmaker.kw['bind'].sync_engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        resp = await client.get('/api/v1/user/me', headers=headers)
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    assert resp.is_success
+    assert resp.json()['username'] == user.username
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_user_cache_is_cleared_after_commit(
+        sessionmaker: async_sessionmaker):
+    user_cache = UserCache()
+    async with sessionmaker() as session:
+        dao = DAO(session, user_cache=user_cache)
+        user = await dao.user.create(dto.UserWithCreds(
+            username='switch', hashed_password='', user_type=UserType.USER))
+        await dao.commit()
+        user_cache.set(user.username, user)
+
+        await dao.user.set_password(user, 'new hash')
+        await dao.session.rollback()
+        assert user_cache.get(user.username) == user
+
+        await dao.user.delete_by_id(user.id)
+        assert user_cache.get(user.username) == user
+        await dao.commit()
+        assert user_cache.get(user.username) is None
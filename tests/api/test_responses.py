@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import orjson
+import pytest
+
+from api.responses import ORJSONResponse
+from finances.models.enums.transaction_type import TransactionType
+
+
+@dataclass
+class Item:
+    id: UUID
+    amount: Decimal
+    type: TransactionType
+    created: datetime
+    day: date | None = None
+
+
+def test_orjson_response_renders_dataclasses():
+    item = Item(id=UUID('3f2b3c2e-3b64-4f0c-8f4d-3f0b1d6e8c11'),
+                amount=Decimal('10.25'), type=TransactionType.INCOME,
+                created=datetime(2023, 1, 2, 3, 4, 5))
+
+    response = ORJSONResponse([item])
+    assert orjson.loads(response.body) == [{
+        'id': '3f2b3c2e-3b64-4f0c-8f4d-3f0b1d6e8c11',
+        'amount': 10.25,
+        'type': TransactionType.INCOME.value,
+        'created': '2023-01-02T03:04:05',
+        'day': None
+    }]
+
+
+def test_orjson_response_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        ORJSONResponse({'value': object()})
@@ -0,0 +1,44 @@
+from decimal import Decimal
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from finances.database.dao import DAO
+from finances.models import dto
+
+
+@pytest_asyncio.fixture
+async def clean_prices(dao: DAO) -> AsyncGenerator[None, None]:
+    yield
+
+    await dao.session.rollback()
+    await dao.session.execute(
+        text("DELETE FROM currencies_prices WHERE base = 'UPA'"))
+    await dao.commit()
+
+
+@pytest.mark.asyncio
+async def test_add_many_upserts_prices(dao: DAO, clean_prices: None):
+    await dao.currency_price.add_many([
+        dto.CurrencyPrice(base='UPA', quote='UPB', price=Decimal('1')),
+        dto.CurrencyPrice(base='UPA', quote='UPC', price=Decimal('2')),
+    ])
+    await dao.commit()
+
+    await dao.currency_price.add_many([
+        dto.CurrencyPrice(base='UPA', quote='UPB', price=Decimal('3')),
+        dto.CurrencyPrice(base='UPA', quote='UPB', price=Decimal('4')),
+        dto.CurrencyPrice(base='UPA', quote='UPD', price=Decimal('5')),
+    ])
+    await dao.commit()
+    dao.session.expire_all()
+
+    prices = await dao.currency_price.get_prices('UPA',
+                                                 ['UPB', 'UPC', 'UPD'])
+    assert {quote: price.price for quote, price in prices.items()} == {
+        'UPB': Decimal('4'),
+        'UPC': Decimal('2'),
+        'UPD': Decimal('5')
+    }
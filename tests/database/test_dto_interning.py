@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from finances.database.models import Transaction, Asset, Currency, \
+    TransactionCategory
+from finances.models.enums.transaction_type import TransactionType
+
+
+def make_transactions(count: int) -> list[Transaction]:
+    user_id = uuid.uuid4()
+    currency = Currency(id=1, name='Dollar', code='USD', is_custom=False,
+                        rate_to_base_currency=None, user_id=None)
+    asset = Asset(id=uuid.uuid4(), user_id=user_id, title='Wallet',
+                  currency_id=currency.id, currency=currency,
+                  amount=Decimal('10'), deleted=False)
+    category = TransactionCategory(id=1, title='Food',
+                                   type=TransactionType.EXPENSE.value,
+                                   user_id=user_id, deleted=False)
+    return [Transaction(id=i, user_id=user_id, asset_id=asset.id, asset=asset,
+                        category_id=category.id, category=category,
+                        amount=Decimal('1'), created=datetime(2023, 1, 1))
+            for i in range(count)]
+
+
+def test_nested_dtos_are_shared_when_interned():
+    first, second = make_transactions(2)
+
+    interned = {}
+    first_dto = first.to_dto(interned=interned)
+    second_dto = second.to_dto(interned=interned)
+    assert first_dto.asset is second_dto.asset
+    assert first_dto.asset.currency is second_dto.asset.currency
+    assert first_dto.category is second_dto.category
+    assert not hasattr(first_dto, '__dict__')
+
+    assert first.to_dto().asset is not second.to_dto().asset
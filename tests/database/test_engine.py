@@ -0,0 +1,56 @@
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from finances.database.engine import create_engine
+from finances.models.dto import Config
+
+
+@pytest.mark.asyncio
+async def test_engine_applies_statement_timeout(config: Config):
+    engine = create_engine(replace(
+        config.db, statement_timeout=timedelta(milliseconds=1500)))
+    try:
+        async with engine.connect() as connection:
+            result = await connection.execute(text('SHOW statement_timeout'))
+            assert result.scalar() == '1500ms'
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_records_checkout_waits(config: Config):
+    engine = create_engine(replace(
+        config.db, pool_size=1, max_overflow=0,
+        pool_timeout=timedelta(milliseconds=200),
+        pool_slow_checkout=timedelta(milliseconds=50)))
+
+    async def hold(seconds: float):
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+            await asyncio.sleep(seconds)
+
+    try:
+        holder = asyncio.create_task(hold(0.1))
+        await asyncio.sleep(0.02)
+        await hold(0)
+        await holder
+
+        stats = engine.pool.stats()
+        assert stats.checkouts == 2
+        assert stats.slow_checkouts == 1
+        assert stats.max_wait >= 0.05
+        assert stats.checked_out == 0
+
+        holder = asyncio.create_task(hold(0.5))
+        await asyncio.sleep(0.02)
+        with pytest.raises(PoolTimeoutError):
+            await hold(0)
+        await holder
+        assert engine.pool.stats().timeouts == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,163 @@
+from contextlib import contextmanager
+from datetime import date
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from finances.database.dao import DAO
+from finances.models import dto
+
+SEED_SQL = [
+    "INSERT INTO users (id, username, password, user_type) "
+    "SELECT gen_random_uuid(), 'explain_' || i, '', 'user' "
+    "FROM generate_series(1, 50) i",
+    "INSERT INTO assets (id, user_id, title, amount, deleted) "
+    "SELECT gen_random_uuid(), u.id, 'asset_' || i, 0, false "
+    "FROM users u, generate_series(1, 4) i "
+    "WHERE u.username LIKE 'explain_%'",
+    "INSERT INTO transaction_categories (id, title, type, user_id, deleted) "
+    "SELECT 100000 + row_number() OVER (), 'category', t.type, u.id, false "
+    "FROM users u, (VALUES ('income'), ('expense')) t(type) "
+    "WHERE u.username LIKE 'explain_%'",
+    "INSERT INTO transactions "
+    "(id, user_id, asset_id, category_id, amount, created) "
+    "SELECT 1000000 + row_number() OVER (), a.user_id, a.id, c.id, i, "
+    "TIMESTAMP '2022-01-01' + i * INTERVAL '1 day' "
+    "FROM assets a "
+    "JOIN transaction_categories c ON c.user_id = a.user_id, "
+    "generate_series(1, 25) i "
+    "WHERE c.id > 100000",
+    "INSERT INTO crypto_currencies (id, name, code) "
+    "SELECT 100000 + i, 'explain_' || i, 'EX' || i "
+    "FROM generate_series(1, 20) i",
+    "INSERT INTO crypto_portfolios (id, user_id, title) "
+    "SELECT gen_random_uuid(), u.id, 'portfolio' "
+    "FROM users u WHERE u.username LIKE 'explain_%'",
+    "INSERT INTO crypto_assets "
+    "(id, user_id, portfolio_id, crypto_currency_id, amount) "
+    "SELECT 1000000 + row_number() OVER (), p.user_id, p.id, c.id, 0 "
+    "FROM crypto_portfolios p JOIN users u ON u.id = p.user_id, "
+    "crypto_currencies c "
+    "WHERE u.username LIKE 'explain_%' AND c.id > 100000",
+    "INSERT INTO crypto_transactions (id, user_id, portfolio_id, "
+    "crypto_asset_id, type, amount, price, created) "
+    "SELECT 1000000 + row_number() OVER (), a.user_id, a.portfolio_id, "
+    "a.id, 'buy', 1, i, TIMESTAMP '2022-01-01' + i * INTERVAL '1 day' "
+    "FROM crypto_assets a, generate_series(1, 10) i "
+    "WHERE a.id > 1000000",
+]
+
+
+@pytest_asyncio.fixture
+async def seeded_user(dao: DAO) -> AsyncGenerator[dto.User, None]:
+    for statement in SEED_SQL:
+        await dao.session.execute(text(statement))
+    await dao.transaction_daily_total.rebuild()
+    await dao.commit()
+    await dao.session.execute(text('ANALYZE'))
+
+    user = await dao.user.get_by_username('explain_1')
+    yield user
+
+    await dao.session.execute(
+        text("DELETE FROM users WHERE username LIKE 'explain_%'"))
+    await dao.session.execute(
+        text('DELETE FROM crypto_currencies WHERE id > 100000'))
+    await dao.commit()
+
+
+@contextmanager
+def capture_statements(session: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context,
+                              executemany):
+        statements.append((statement, parameters))
+
+    engine = session.bind.sync_engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+async def explain(session: AsyncSession, statements: list) -> str:
+    connection = await session.connection()
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(
+            'EXPLAIN ' + statement, parameters)
+        plans.extend(row[0] for row in result.fetchall())
+    return '\n'.join(plans)
+
+
+@pytest.mark.asyncio
+async def test_transactions_listing_uses_index(
+        seeded_user: dto.User,
+        dao: DAO
+):
+    with capture_statements(dao.session) as statements:
+        await dao.transaction.get_all(seeded_user, date(2022, 1, 1),
+                                      date(2022, 2, 1), limit=10)
+    plan = await explain(dao.session, statements)
+    assert 'ix_transactions_user_id_created' in plan
+
+
+@pytest.mark.asyncio
+async def test_totals_by_asset_uses_index(
+        seeded_user: dto.User,
+        dao: DAO
+):
+    assets = await dao.asset.get_all(seeded_user)
+    with capture_statements(dao.session) as statements:
+        await dao.transaction.get_totals_by_asset(
+            assets[0].id, date(2022, 1, 1), date(2022, 2, 1))
+    plan = await explain(dao.session, statements)
+    assert 'ix_transaction_daily_totals_asset_id_day' in plan
+
+
+@pytest.mark.asyncio
+async def test_crypto_transactions_by_asset_use_index(
+        seeded_user: dto.User,
+        dao: DAO
+):
+    portfolio = (await dao.crypto_portfolio.get_all(seeded_user))[0]
+    crypto_assets = await dao.crypto_asset.get_all(portfolio.id,
+                                                   seeded_user.id)
+    with capture_statements(dao.session) as statements:
+        await dao.crypto_transaction.get_all_by_crypto_asset(
+            crypto_assets[0].id, seeded_user.id)
+    plan = await explain(dao.session, statements)
+    assert 'ix_crypto_transactions_crypto_asset_id_user_id_created' in plan
+
+
+@pytest.mark.asyncio
+async def test_crypto_asset_by_currency_uses_index(
+        seeded_user: dto.User,
+        dao: DAO
+):
+    portfolio = (await dao.crypto_portfolio.get_all(seeded_user))[0]
+    with capture_statements(dao.session) as statements:
+        await dao.crypto_asset.get_by_currency(100001, portfolio.id)
+    plan = await explain(dao.session, statements)
+    assert 'ix_crypto_assets_portfolio_id_crypto_currency_id' in plan
+
+
+@pytest.mark.asyncio
+async def test_crypto_portfolio_totals_use_index(
+        seeded_user: dto.User,
+        dao: DAO
+):
+    portfolio = (await dao.crypto_portfolio.get_all(seeded_user))[0]
+    with capture_statements(dao.session) as statements:
+        totals = await dao.crypto_transaction.get_totals_by_portfolio(
+            portfolio.id, seeded_user.id)
+    plan = await explain(dao.session, statements)
+    assert 'ix_crypto_transactions_crypto_asset_id_user_id_created' in plan
+    assert len(totals) == 20
+    assert all(total.buy_amount == 10 and total.buy_cost == 55 and
+               total.sell_amount == 0 for total in totals.values())
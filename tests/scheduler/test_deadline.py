@@ -0,0 +1,105 @@
+import asyncio
+from datetime import timedelta, datetime
+
+import pytest
+
+from scheduler.deadline import DeadlineScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def advance(scheduler: DeadlineScheduler, clock: FakeClock,
+                  seconds: int):
+    for _ in range(seconds):
+        scheduler.run_pending()
+        # let the started jobs run to completion
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        clock.now += 1
+    scheduler.run_pending()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_at_their_deadlines():
+    runs = {'fast': 0, 'slow': 0, 'daily': 0}
+
+    def job(name: str):
+        async def run():
+            runs[name] += 1
+        return run
+
+    async def failing():
+        raise RuntimeError('boom')
+
+    clock = FakeClock()
+    scheduler = DeadlineScheduler(clock)
+    scheduler.every('fast', timedelta(seconds=2), job('fast'),
+                    run_now=True)
+    scheduler.every('slow', timedelta(seconds=7), job('slow'))
+    scheduler.daily('daily', (datetime.now() - timedelta(hours=1)).time(),
+                    job('daily'))
+    scheduler.every('failing', timedelta(seconds=5), failing)
+
+    await advance(scheduler, clock, 11)
+
+    assert runs['fast'] == 6
+    assert runs['slow'] == 1
+    assert runs['daily'] == 0
+
+    stats = scheduler.stats()
+    assert stats['fast'].runs == runs['fast']
+    assert stats['fast'].last_duration is not None
+    assert stats['failing'].runs == 2
+    assert stats['failing'].failures == 2
+
+
+@pytest.mark.asyncio
+async def test_running_job_is_not_started_twice():
+    running, max_running = 0, 0
+    release = asyncio.Event()
+
+    async def slow():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+
+    clock = FakeClock()
+    scheduler = DeadlineScheduler(clock)
+    scheduler.every('slow', timedelta(seconds=1), slow, run_now=True)
+
+    await advance(scheduler, clock, 3)
+    assert max_running == 1
+    assert scheduler.stats()['slow'].skipped == 3
+
+    release.set()
+    await asyncio.sleep(0)
+    assert running == 0
+    assert scheduler.stats()['slow'].runs == 1
+
+
+@pytest.mark.asyncio
+async def test_run_forever_stops_on_cancel():
+    ran = asyncio.Event()
+
+    async def job():
+        ran.set()
+
+    scheduler = DeadlineScheduler()
+    scheduler.every('job', timedelta(hours=1), job, run_now=True)
+    task = asyncio.create_task(scheduler.run_forever())
+    await asyncio.wait_for(ran.wait(), 1)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert scheduler.stats()['job'].runs == 1
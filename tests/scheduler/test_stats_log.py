@@ -0,0 +1,35 @@
+import logging
+from dataclasses import replace
+
+import pytest
+from passlib.context import CryptContext
+from sqlalchemy import text
+
+from api.v1.dependencies.password_hasher import PasswordHasher
+from finances.database.engine import create_engine
+from finances.models.dto import Config
+from scheduler.deadline import DeadlineScheduler
+from scheduler.start import log_stats
+
+
+@pytest.mark.asyncio
+async def test_stats_log_reports_pools_and_hasher(
+        config: Config, caplog: pytest.LogCaptureFixture):
+    engine = create_engine(replace(config.db, pool_size=1, max_overflow=0))
+    password_hasher = PasswordHasher(
+        CryptContext(schemes=['bcrypt'], bcrypt__rounds=4),
+        workers=1, queue_size=1)
+    try:
+        await password_hasher.hash('12345')
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+
+        with caplog.at_level(logging.INFO):
+            await log_stats(DeadlineScheduler(), {'primary': engine.pool},
+                            password_hasher)
+        assert '[MeteredQueuePool] primary: 0/1 checked out' in caplog.text
+        assert '1 checkouts, 0 timeouts' in caplog.text
+        assert '[PasswordHasher] 0/2 pending, peak 1, 1 completed' \
+               in caplog.text
+    finally:
+        await engine.dispose()
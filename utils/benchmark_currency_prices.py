@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import time
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.config import load_config
+from finances.database.dao.currency_price import CurrencyPriceDAO
+from finances.database.engine import create_engine
+from finances.database.models import CurrencyPrice
+from finances.models import dto
+
+PAIRS_COUNT = 2000
+ROUNDS = 3
+
+
+def make_prices(round_: int) -> list[dto.CurrencyPrice]:
+    return [dto.CurrencyPrice(base=f'B{i % 50:03}',
+                              quote=f'Q{i // 50:03}',
+                              price=Decimal(i + round_))
+            for i in range(PAIRS_COUNT)]
+
+
+async def merge_one_by_one(dao: CurrencyPriceDAO,
+                           currency_prices: list[dto.CurrencyPrice]):
+    for currency_price_dto in currency_prices:
+        await dao.session.merge(CurrencyPrice.from_dto(currency_price_dto))
+    await dao.session.flush()
+
+
+async def bulk_upsert(dao: CurrencyPriceDAO,
+                      currency_prices: list[dto.CurrencyPrice]):
+    await dao.add_many(currency_prices)
+
+
+async def benchmark(ss: async_sessionmaker):
+    for name, add_many in (('merge', merge_one_by_one),
+                           ('upsert', bulk_upsert)):
+        async with ss() as session:
+            dao = CurrencyPriceDAO(session)
+            timings = []
+            for round_ in range(ROUNDS):
+                currency_prices = make_prices(round_)
+                start = time.perf_counter()
+                await add_many(dao, currency_prices)
+                timings.append(time.perf_counter() - start)
+                session.expunge_all()
+            await session.rollback()
+
+        logging.info(f'{name}: {PAIRS_COUNT} pairs, ' + ', '.join(
+            f'{timing * 1000:.1f} ms' for timing in timings))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    config = load_config()
+    engine = create_engine(config.db)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(benchmark(async_session))
+
+
+if __name__ == '__main__':
+    main()
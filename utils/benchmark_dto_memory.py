@@ -0,0 +1,98 @@
+import dataclasses
+import logging
+import random
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from finances.database.models import Transaction, Asset, Currency, \
+    TransactionCategory
+from finances.models import dto
+from finances.models.enums.transaction_type import TransactionType
+
+TRANSACTIONS_COUNT = 100000
+ASSETS_COUNT = 5
+CATEGORIES_COUNT = 20
+NESTED_DTOS = ('Transaction', 'Asset', 'Currency', 'TransactionCategory')
+
+
+def make_rows() -> list[Transaction]:
+    user_id = uuid.uuid4()
+    currencies = [Currency(id=i, name=f'Currency {i}', code=f'C{i:02}',
+                           is_custom=False, user_id=None,
+                           rate_to_base_currency=Decimal('1.5'))
+                  for i in range(2)]
+    assets = [Asset(id=uuid.uuid4(), user_id=user_id, title=f'Asset {i}',
+                    currency_id=currencies[i % 2].id,
+                    currency=currencies[i % 2], amount=Decimal('100.00'),
+                    deleted=False)
+              for i in range(ASSETS_COUNT)]
+    categories = [TransactionCategory(id=i, title=f'Category {i}',
+                                      type=TransactionType.EXPENSE.value,
+                                      user_id=user_id, deleted=False)
+                  for i in range(CATEGORIES_COUNT)]
+    created = datetime(2023, 1, 1)
+    rows = []
+    for i in range(TRANSACTIONS_COUNT):
+        asset = random.choice(assets)
+        category = random.choice(categories)
+        rows.append(Transaction(id=i, user_id=user_id, asset_id=asset.id,
+                                asset=asset, category_id=category.id,
+                                category=category, amount=Decimal('9.99'),
+                                created=created + timedelta(minutes=i)))
+    return rows
+
+
+def unslotted(cls: type) -> type:
+    fields = dataclasses.fields(cls)
+    namespace = {'__annotations__': {f.name: f.type for f in fields}}
+    namespace.update({f.name: f.default for f in fields
+                      if f.default is not dataclasses.MISSING})
+    return dataclasses.dataclass(type(cls.__name__, (), namespace))
+
+
+@contextmanager
+def dict_dtos():
+    # the DTOs as they were before: plain dataclasses with __dict__
+    originals = {name: getattr(dto, name) for name in NESTED_DTOS}
+    for name, cls in originals.items():
+        setattr(dto, name, unslotted(cls))
+    try:
+        yield
+    finally:
+        for name, cls in originals.items():
+            setattr(dto, name, cls)
+
+
+def measure(rows: list[Transaction], interned: bool) -> int:
+    tracemalloc.start()
+    try:
+        cache = {} if interned else None
+        dtos = [row.to_dto(interned=cache) for row in rows]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del dtos
+    return size
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    rows = make_rows()
+    with dict_dtos():
+        before = measure(rows, interned=False)
+    results = (
+        ('dict dataclasses, copied per row', before),
+        ('slotted, copied per row', measure(rows, interned=False)),
+        ('slotted, interned', measure(rows, interned=True)),
+    )
+    for name, size in results:
+        logging.info(f'{name}: {size / TRANSACTIONS_COUNT:.0f} bytes '
+                     f'per transaction')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from api.responses import ORJSONResponse
+from api.v1.models.response.total_result import TransactionsResponse
+from finances.models import dto
+from finances.models.enums.transaction_type import TransactionType
+
+TRANSACTIONS_COUNT = 10000
+TRANSACTIONS_PER_DAY = 100
+ROUNDS = 5
+
+
+def make_days() -> list[dto.Transactions]:
+    user_id = uuid4()
+    currency = dto.Currency(id=1, name='Dollar', code='USD', is_custom=False,
+                            rate_to_base_currency=Decimal('1.0'),
+                            user_id=None)
+    asset = dto.Asset(id=uuid4(), user_id=user_id, title='Wallet',
+                      currency_id=currency.id, amount=Decimal('1000.00'),
+                      currency=currency)
+    category = dto.TransactionCategory(id=1, title='Food',
+                                       type=TransactionType.EXPENSE,
+                                       user_id=user_id)
+    days = []
+    for day in range(TRANSACTIONS_COUNT // TRANSACTIONS_PER_DAY):
+        created = datetime(2023, 1, 1) + timedelta(days=day)
+        days.append(dto.Transactions(
+            created=created.date(),
+            total_income=Decimal('0'),
+            total_expense=Decimal('123.45'),
+            transactions=[
+                dto.Transaction(id=day * TRANSACTIONS_PER_DAY + i,
+                                user_id=user_id, asset_id=asset.id,
+                                category_id=category.id,
+                                amount=Decimal('1.23'), created=created,
+                                asset=asset, category=category)
+                for i in range(TRANSACTIONS_PER_DAY)
+            ]
+        ))
+    return days
+
+
+async def validated(days: list[dto.Transactions]) -> bytes:
+    # the default FastAPI path: response_model validation, jsonable_encoder
+    # and json.dumps
+    field = create_response_field(name='transactions',
+                                  type_=list[TransactionsResponse])
+    content = await serialize_response(field=field, response_content=[
+        TransactionsResponse(created=day.created,
+                             transactions=day.transactions,
+                             total_income=day.total_income,
+                             total_expense=day.total_expense)
+        for day in days
+    ])
+    return JSONResponse(content).body
+
+
+async def direct(days: list[dto.Transactions]) -> bytes:
+    return ORJSONResponse([
+        TransactionsResponse.from_dto(day) for day in days
+    ]).body
+
+
+async def benchmark():
+    days = make_days()
+    for name, render in (('validated + json', validated),
+                         ('dataclasses + orjson', direct)):
+        timings = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            body = await render(days)
+            timings.append(time.perf_counter() - start)
+        logging.info(f'{name}: {TRANSACTIONS_COUNT} transactions, '
+                     f'{len(body)} bytes, best of {ROUNDS}: '
+                     f'{min(timings) * 1000:.1f} ms')
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(benchmark())
+
+
+if __name__ == '__main__':
+    main()
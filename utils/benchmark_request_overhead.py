@@ -0,0 +1,58 @@
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.config import load_config
+from api.v1.dependencies.db import DatabaseProvider
+from finances.database.engine import create_engine
+
+REQUESTS_COUNT = 20000
+DAO_NAMES = ('user', 'currency', 'asset', 'transaction_category',
+             'transaction', 'transaction_daily_total', 'crypto_portfolio',
+             'crypto_currency', 'crypto_asset', 'crypto_transaction',
+             'currency_price', 'currency_price_history')
+
+
+async def eager_request(db_provider: DatabaseProvider):
+    # what every request paid before: a session and all DAOs up front
+    async with db_provider.open_dao() as dao:
+        for name in DAO_NAMES:
+            getattr(dao, name)
+
+
+async def lazy_cached_request(db_provider: DatabaseProvider):
+    async with db_provider.open_dao():
+        pass
+
+
+async def lazy_single_dao_request(db_provider: DatabaseProvider):
+    async with db_provider.open_dao() as dao:
+        dao.transaction
+
+
+async def benchmark(ss: async_sessionmaker):
+    db_provider = DatabaseProvider(ss)
+    for name, request in (('eager', eager_request),
+                          ('lazy, served from cache', lazy_cached_request),
+                          ('lazy, one DAO', lazy_single_dao_request)):
+        start = time.perf_counter()
+        for _ in range(REQUESTS_COUNT):
+            await request(db_provider)
+        elapsed = time.perf_counter() - start
+        logging.info(f'{name}: {elapsed / REQUESTS_COUNT * 1e6:.1f} us '
+                     f'per request')
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    config = load_config()
+    engine = create_engine(config.db)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(benchmark(async_session))
+
+
+if __name__ == '__main__':
+    main()
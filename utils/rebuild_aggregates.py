@@ -0,0 +1,32 @@
+import asyncio
+import logging
+from dataclasses import replace
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.config import load_config
+from finances.database.dao import DAO
+from finances.database.engine import create_engine
+
+
+async def rebuild_aggregates(ss: async_sessionmaker):
+    async with ss() as session:
+        dao = DAO(session)
+        await dao.transaction_daily_total.rebuild()
+        await dao.crypto_asset.rebuild_totals()
+        await dao.commit()
+    logging.info('AGGREGATES SUCCESSFULLY REBUILT')
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    config = load_config()
+    # a full rebuild runs far longer than the API's statement timeout
+    engine = create_engine(replace(config.db, statement_timeout=None))
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(rebuild_aggregates(async_session))
+
+
+if __name__ == '__main__':
+    main()